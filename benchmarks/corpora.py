@@ -0,0 +1,186 @@
+"""Deterministic synthetic corpora for the benchmarks.
+
+Usage:
+```
+commands = build_commands(10_000)
+payload = json.dumps(commands).encode()
+```
+"""
+
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord_yg_types.enums import ApplicationCommandOptionTypes, ApplicationCommandPermissionType, ApplicationCommandTypes, ChannelTypes, Locale
+from discord_yg_types.permissions import ALL_PERMISSIONS
+
+
+APPLICATION_ID = 1_000_000_000_000_000_000
+GUILD_ID = 1_100_000_000_000_000_000
+LOCALE_CODES = [locale.code for locale in Locale]
+CHOICE_LOCALE_CODES = ["de", "fr", "es-ES"]
+"""Locales of the choices, which are rarely fully translated."""
+WORDS = [f"word{index}" for index in range(500)]
+"""Vocabulary of the names. Translations repeat across commands, like they \
+do in real bots."""
+
+
+def localizations(word: str, codes: list[str] = LOCALE_CODES) -> dict[str, str]:
+    """A :data:`~typings.Locales` map, full by default."""
+    return {code: f"{word}-{code.lower()}" for code in codes}
+
+
+def _option(rng: random.Random, index: int) -> dict[str, Any]:
+    word = rng.choice(WORDS)
+    option: dict[str, Any] = {
+        "name": f"{word}{index}",
+        "description": f"The {word}.",
+        "name_localizations": localizations(word),
+        "required": index == 0,
+    }
+    kind = rng.random()
+    if kind < 0.3:
+        option["type"] = ApplicationCommandOptionTypes.STRING
+        option["choices"] = [
+            {"name": f"{choice} {index}", "value": choice, "name_localizations": localizations(choice, CHOICE_LOCALE_CODES)}
+            for choice in rng.sample(WORDS, 25)
+        ]
+    elif kind < 0.5:
+        option["type"] = ApplicationCommandOptionTypes.INTEGER
+        option["min_value"] = 0
+        option["max_value"] = rng.randrange(1, 1000)
+    elif kind < 0.6:
+        option["type"] = ApplicationCommandOptionTypes.CHANNEL
+        option["channel_types"] = [ChannelTypes.GUILD_TEXT, ChannelTypes.GUILD_ANNOUNCEMENT]
+    else:
+        option["type"] = rng.choice((
+            ApplicationCommandOptionTypes.BOOLEAN,
+            ApplicationCommandOptionTypes.USER,
+            ApplicationCommandOptionTypes.ROLE,
+        ))
+    return option
+
+
+def _options(rng: random.Random) -> list[dict[str, Any]]:
+    return [_option(rng, index) for index in range(rng.randrange(1, 4))]
+
+
+def _subcommands(rng: random.Random, count: int) -> list[dict[str, Any]]:
+    subcommands = []
+    for index in range(count):
+        word = rng.choice(WORDS)
+        subcommands.append({
+            "type": ApplicationCommandOptionTypes.SUB_COMMAND,
+            "name": f"{word}{index}",
+            "description": f"Does {word}.",
+            "name_localizations": localizations(word),
+            "options": _options(rng),
+        })
+    return subcommands
+
+
+def build_command(rng: random.Random, index: int) -> dict[str, Any]:
+    """A command as returned by the API. 60% have plain options, 25% have \
+    subcommands, and 15% have 2 subcommand groups of 3 subcommands."""
+    word = rng.choice(WORDS)
+    kind = rng.random()
+    if kind < 0.6:
+        options = _options(rng)
+    elif kind < 0.85:
+        options = _subcommands(rng, 3)
+    else:
+        options = []
+        for group in range(2):
+            group_word = rng.choice(WORDS)
+            options.append({
+                "type": ApplicationCommandOptionTypes.SUB_COMMAND_GROUP,
+                "name": f"{group_word}{group}",
+                "description": f"Manages {group_word}.",
+                "name_localizations": localizations(group_word),
+                "options": _subcommands(rng, 3),
+            })
+    return {
+        "id": str(APPLICATION_ID + 1 + index),
+        "application_id": str(APPLICATION_ID),
+        "version": str(APPLICATION_ID + 1 + index),
+        "type": ApplicationCommandTypes.CHAT_INPUT,
+        "name": f"{word}{index}",
+        "description": f"Runs {word}.",
+        "default_member_permissions": str(rng.getrandbits(41) & ALL_PERMISSIONS.value) if rng.random() < 0.2 else None,
+        "name_localizations": localizations(word),
+        "description_localizations": localizations(f"runs-{word}"),
+        "options": options,
+    }
+
+
+def build_commands(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    return [build_command(rng, index) for index in range(count)]
+
+
+def build_permission_strings(count: int, distinct: int = 500, seed: int = 0) -> list[str]:
+    """Permission strings, with the repetition of the roles seen by a bot."""
+    rng = random.Random(seed)
+    values = [str(rng.getrandbits(47) & ALL_PERMISSIONS.value) for _ in range(distinct)]
+    return [rng.choice(values) for _ in range(count)]
+
+
+def build_command_permissions(commands: int, seed: int = 0) -> list[dict[str, Any]]:
+    """:class:`~GuildApplicationCommandPermission`s of `commands` commands \
+    and of the application, up to 100 entries each."""
+    rng = random.Random(seed)
+    listing = []
+    for command_id in [APPLICATION_ID] + [APPLICATION_ID + 1 + index for index in range(commands)]:
+        entries = []
+        for _ in range(rng.randrange(1, 101)):
+            entry_type = rng.choice(list(ApplicationCommandPermissionType))
+            entries.append({"id": str(GUILD_ID + rng.randrange(1, 10_000)), "type": entry_type, "permission": rng.random() < 0.7})
+        listing.append({"id": str(command_id), "application_id": str(APPLICATION_ID), "guild_id": str(GUILD_ID), "permissions": entries})
+    return listing
+
+
+def build_snowflakes(count: int, seed: int = 0) -> list[str]:
+    """Snowflakes created over about a year."""
+    rng = random.Random(seed)
+    return [str((rng.randrange(1_600_000_000_000, 1_630_000_000_000) - 1_420_070_400_000) << 22 | rng.getrandbits(22)) for _ in range(count)]
+
+
+def _argument(option: dict[str, Any]) -> Any:
+    """A valid value of `option`."""
+    if option.get("choices"):
+        return option["choices"][0]["value"]
+    option_type = option["type"]
+    if option_type == ApplicationCommandOptionTypes.STRING:
+        return "x" * max(option.get("min_length") or 0, 1)
+    if option_type == ApplicationCommandOptionTypes.INTEGER:
+        return option.get("min_value", 0)
+    if option_type == ApplicationCommandOptionTypes.NUMBER:
+        return float(option.get("min_value", 0))
+    if option_type == ApplicationCommandOptionTypes.BOOLEAN:
+        return True
+    return str(GUILD_ID + 1)
+
+
+def build_invocation(command: dict[str, Any]) -> dict[str, Any]:
+    """The `data` of an invocation of the first subcommand of `command`, \
+    with a valid value for every option."""
+    data: dict[str, Any] = {"id": command["id"], "name": command["name"], "type": command.get("type", 1)}
+    parent = data
+    options = command.get("options") or []
+    while options and options[0]["type"] in (ApplicationCommandOptionTypes.SUB_COMMAND, ApplicationCommandOptionTypes.SUB_COMMAND_GROUP):
+        child = {"name": options[0]["name"], "type": options[0]["type"]}
+        parent["options"] = [child]
+        parent = child
+        options = options[0].get("options") or []
+    parent["options"] = [{"name": option["name"], "type": option["type"], "value": _argument(option)} for option in options]
+    snowflake = str(GUILD_ID + 1)
+    channel_types = [channel_type for option in options for channel_type in option.get("channel_types") or ()]
+    data["resolved"] = {
+        "users": {snowflake: {"id": snowflake, "username": "user"}},
+        "roles": {snowflake: {"id": snowflake, "name": "role"}},
+        "channels": {snowflake: {"id": snowflake, "type": int(channel_types[0]) if channel_types else 0}},
+    }
+    return data
\ No newline at end of file
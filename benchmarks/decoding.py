@@ -0,0 +1,92 @@
+"""Benchmarks :func:`~decoding.decode` against `json.loads` followed by a \
+walk converting the enums, on 2k commands with localized options and \
+choices.
+
+Usage: `python benchmarks/decoding.py`
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord_yg_types.decoding import decode, to_struct
+from discord_yg_types.enums import ApplicationCommandOptionTypes, ApplicationCommandTypes, ChannelTypes, Permissions
+
+
+COMMANDS = 2_000
+OPTIONS = 5
+CHOICES = 5
+
+
+def build() -> bytes:
+    localizations = {"fr": "nom", "de": "name", "es-ES": "nombre"}
+    commands = []
+    for c in range(COMMANDS):
+        options = []
+        for o in range(OPTIONS):
+            options.append({
+                "type": 3,
+                "name": f"option{o}",
+                "description": "Option.",
+                "name_localizations": localizations,
+                "required": o == 0,
+                "choices": [{"name": f"choice{i}", "value": f"value{i}", "name_localizations": localizations} for i in range(CHOICES)],
+            })
+        options.append({"type": 7, "name": "channel", "description": "Channel.", "channel_types": [0, 2, 5]})
+        commands.append({
+            "id": str(10**18 + c),
+            "application_id": "1000000000000000000",
+            "version": str(10**18 + c),
+            "type": 1,
+            "name": f"command{c}",
+            "description": "Command.",
+            "default_member_permissions": "8",
+            "name_localizations": localizations,
+            "options": options,
+        })
+    return json.dumps(commands).encode()
+
+
+def walk(payload: dict) -> dict:
+    """Converts the enums of a command by hand."""
+    payload["type"] = ApplicationCommandTypes(payload["type"])
+    if payload.get("default_member_permissions") is not None:
+        payload["default_member_permissions"] = Permissions(int(payload["default_member_permissions"]))
+    for option in payload.get("options", ()):
+        option["type"] = ApplicationCommandOptionTypes(option["type"])
+        if "channel_types" in option:
+            option["channel_types"] = [ChannelTypes(item) for item in option["channel_types"]]
+    return payload
+
+
+def loads_then_walk(data: bytes) -> list[dict]:
+    return [walk(command) for command in json.loads(data)]
+
+
+def loads_then_to_struct(data: bytes) -> list:
+    return to_struct(json.loads(data))
+
+
+def footprint(function, data: bytes) -> int:
+    tracemalloc.start()
+    result = function(data)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    data = build()
+    print(f"payload: {len(data) / 1e6:.1f} MB")
+    for name, function in (("json.loads", json.loads), ("json.loads + walk", loads_then_walk), ("json.loads + to_struct", loads_then_to_struct), ("decode", decode)):
+        seconds = min(timeit.repeat(lambda: function(data), number=1, repeat=5))
+        print(f"{name}: {seconds * 1e3:.1f} ms, {footprint(function, data) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
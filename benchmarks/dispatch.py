@@ -0,0 +1,77 @@
+"""Benchmarks :class:`~dispatch.CommandRouter` with 10k routes: 400 commands \
+with 5 subcommand groups of 5 subcommands each.
+
+Usage: `python benchmarks/dispatch.py`
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord_yg_types.dispatch import CommandRouter
+from discord_yg_types.enums import ApplicationCommandOptionTypes, ApplicationCommandTypes
+
+
+COMMANDS = 400
+GROUPS = 5
+SUBCOMMANDS = 5
+INVOCATIONS = 100_000
+
+
+def build() -> tuple[list[dict], dict]:
+    commands = []
+    handlers = {}
+    for c in range(COMMANDS):
+        groups = []
+        for g in range(GROUPS):
+            subcommands = []
+            for s in range(SUBCOMMANDS):
+                subcommands.append({
+                    "type": ApplicationCommandOptionTypes.SUB_COMMAND,
+                    "name": f"sub{s}",
+                    "description": "Subcommand.",
+                    "options": [{"type": ApplicationCommandOptionTypes.STRING, "name": "text", "description": "Text."}],
+                })
+                handlers[(ApplicationCommandTypes.CHAT_INPUT, f"command{c}", f"group{g}", f"sub{s}")] = lambda: None
+            groups.append({
+                "type": ApplicationCommandOptionTypes.SUB_COMMAND_GROUP,
+                "name": f"group{g}",
+                "description": "Group.",
+                "options": subcommands,
+            })
+        commands.append({"name": f"command{c}", "description": "Command.", "options": groups})
+    return commands, handlers
+
+
+def main() -> None:
+    commands, handlers = build()
+    print(f"build {len(handlers)} routes: {timeit.timeit(lambda: CommandRouter(commands, handlers), number=1) * 1e3:.1f} ms")
+    router = CommandRouter(commands, handlers)
+    assert len(router) == len(handlers)
+
+    rng = random.Random(0)
+    invocations = [
+        {
+            "type": 1,
+            "name": f"command{rng.randrange(COMMANDS)}",
+            "options": [{
+                "type": 2,
+                "name": f"group{rng.randrange(GROUPS)}",
+                "options": [{"type": 1, "name": f"sub{rng.randrange(SUBCOMMANDS)}", "options": [{"type": 3, "name": "text", "value": "hi"}]}],
+            }],
+        }
+        for _ in range(INVOCATIONS)
+    ]
+    resolve = router.resolve
+    seconds = min(timeit.repeat(lambda: [resolve(data) for data in invocations], number=1, repeat=5))
+    print(f"resolve: {seconds / INVOCATIONS * 1e9:.0f} ns/invocation")
+    dispatch = router.dispatch
+    seconds = min(timeit.repeat(lambda: [dispatch(data) for data in invocations], number=1, repeat=5))
+    print(f"dispatch: {seconds / INVOCATIONS * 1e9:.0f} ns/invocation")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""Guards the import time of the package with `python -X importtime`.
+
+Every module is imported in a fresh interpreter several times, and the \
+fastest cumulative import time is compared with its budget. The modules that \
+must stay light are also checked not to import `typing` or the Application \
+Commands types.
+
+Usage: `python benchmarks/import_time.py`. Exits with 1 if a budget is exceeded.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+RUNS = 5
+
+BUDGETS_MS = {
+    "discord_yg_types": 5,
+    "discord_yg_types.enums": 20,
+    "discord_yg_types.typings": 30,
+    "discord_yg_types.application_commands": 5,
+    "discord_yg_types.application_commands.ApplicationCommand": 40,
+    "discord_yg_types.validators": 40,
+}
+"""Budget of the cumulative import time, in milliseconds. Includes the \
+standard library modules imported for the first time."""
+
+FORBIDDEN = {
+    "discord_yg_types": ("typing", "discord_yg_types.enums", "discord_yg_types.application_commands"),
+    "discord_yg_types.enums": ("typing", "discord_yg_types.typings", "discord_yg_types.application_commands"),
+    "discord_yg_types.typings": ("discord_yg_types.application_commands",),
+    "discord_yg_types.application_commands": ("discord_yg_types.application_commands.ApplicationCommand",),
+}
+"""Modules that must not be imported by a module."""
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    """Cumulative import time of `module` in milliseconds, and the modules \
+    imported."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}, sys; print(*sys.modules)"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        parts = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000, set(result.stdout.split())
+    raise RuntimeError(f"{module} was not imported.")
+
+
+def main() -> int:
+    failed = False
+    # Write the bytecode caches first
+    subprocess.run([sys.executable, "-m", "compileall", "-q", str(ROOT / "discord_yg_types")], check=True)
+
+    for module, budget in BUDGETS_MS.items():
+        best = float("inf")
+        imported: set[str] = set()
+        for _ in range(RUNS):
+            milliseconds, imported = import_time(module)
+            best = min(best, milliseconds)
+        forbidden = [name for name in FORBIDDEN.get(module, ()) if name in imported]
+        ok = best <= budget and not forbidden
+        failed |= not ok
+        print(f"{'ok' if ok else 'FAIL':<5} {module:<60} {best:>6.1f} ms (budget {budget} ms)")
+        for name in forbidden:
+            print(f"      imports {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
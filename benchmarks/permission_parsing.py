@@ -0,0 +1,58 @@
+"""Benchmarks the fast scalar :class:`~enums.Permissions` helpers against \
+the plain `Permissions` form.
+
+Usage: `python benchmarks/permission_parsing.py`
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord_yg_types.enums import Permissions
+from discord_yg_types.permissions import ALL_PERMISSIONS, decompose_permissions, parse_permissions, permission_names, serialize_permissions
+
+
+DISTINCT = 500
+"""Distinct permission strings, like the roles seen by a bot."""
+REQUESTS = 100_000
+
+
+def report(name: str, plain: float, fast: float) -> None:
+    print(f"{name:<30} {plain / REQUESTS * 1e9:>8.0f} ns {fast / REQUESTS * 1e9:>8.0f} ns {plain / fast:>6.1f}x")
+
+
+def main() -> None:
+    rng = random.Random(0)
+    distinct = [str(rng.getrandbits(47) & ALL_PERMISSIONS.value) for _ in range(DISTINCT)]
+    strings = [rng.choice(distinct) for _ in range(REQUESTS)]
+    for string in strings:
+        assert permission_names(int(string)) == tuple(member.name for member in Permissions(int(string)))
+
+    print(f"{'':<30} {'plain':>11} {'fast':>11} {'speedup':>7}")
+    report(
+        "parse",
+        min(timeit.repeat(lambda: [Permissions(int(s)) for s in strings], number=1, repeat=5)),
+        min(timeit.repeat(lambda: [parse_permissions(s) for s in strings], number=1, repeat=5)),
+    )
+    report(
+        "names",
+        min(timeit.repeat(lambda: [[m.name for m in Permissions(int(s))] for s in strings], number=1, repeat=5)),
+        min(timeit.repeat(lambda: [permission_names(parse_permissions(s)) for s in strings], number=1, repeat=5)),
+    )
+    report(
+        "decompose",
+        min(timeit.repeat(lambda: [list(Permissions(int(s))) for s in strings], number=1, repeat=5)),
+        min(timeit.repeat(lambda: [decompose_permissions(parse_permissions(s)) for s in strings], number=1, repeat=5)),
+    )
+    report(
+        "parse and serialize",
+        min(timeit.repeat(lambda: [str(Permissions(int(s)).value) for s in strings], number=1, repeat=5)),
+        min(timeit.repeat(lambda: [serialize_permissions(parse_permissions(s)) for s in strings], number=1, repeat=5)),
+    )
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,87 @@
+"""Benchmarks :class:`~permissions.PermissionResolver` on a guild with 250 \
+roles, 500 channels and 5000 members.
+
+Usage: `python benchmarks/permission_resolver.py`
+"""
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from discord_yg_types.enums import Permissions
+from discord_yg_types.permissions import PermissionResolver
+
+
+ROLES = 250
+CHANNELS = 500
+MEMBERS = 5000
+ROLES_PER_MEMBER = 5
+OVERWRITES_PER_CHANNEL = 10
+
+
+def build(seed: int = 0) -> tuple[PermissionResolver, list[str], list[str], list[str]]:
+    """A guild with random roles, members and overwrites."""
+    rng = random.Random(seed)
+    flags = list(Permissions)
+    guild_id = "1"
+    resolver = PermissionResolver(guild_id, owner_id="2")
+
+    roles = [str(10_000 + i) for i in range(ROLES)]
+    resolver.set_role(guild_id, Permissions.VIEW_CHANNEL | Permissions.SEND_MESSAGES)
+    for role_id in roles:
+        permissions = 0
+        for flag in rng.sample(flags, 4):
+            if flag is not Permissions.ADMINISTRATOR:
+                permissions |= flag
+        resolver.set_role(role_id, permissions)
+
+    members = [str(100_000 + i) for i in range(MEMBERS)]
+    for member_id in members:
+        resolver.set_member(member_id, rng.sample(roles, ROLES_PER_MEMBER))
+
+    channels = [str(1_000_000 + i) for i in range(CHANNELS)]
+    for channel_id in channels:
+        resolver.set_overwrite(channel_id, guild_id, deny=Permissions.SEND_MESSAGES)
+        for target_id in rng.sample(roles, OVERWRITES_PER_CHANNEL - 2) + rng.sample(members, 1):
+            resolver.set_overwrite(channel_id, target_id, allow=rng.choice(flags), deny=rng.choice(flags))
+    return resolver, roles, channels, members
+
+
+def report(name: str, seconds: float, operations: int) -> None:
+    print(f"{name:<40} {seconds / operations * 1e9:>10.0f} ns/op")
+
+
+def main() -> None:
+    resolver, roles, channels, members = build()
+    rng = random.Random(1)
+    queries = [(rng.choice(members), rng.choice(channels)) for _ in range(100_000)]
+    permissions = resolver.permissions
+
+    resolver.clear()
+    report("cold", timeit.timeit(lambda: [permissions(m, c) for m, c in queries], number=1), len(queries))
+    report("cached", min(timeit.repeat(lambda: [permissions(m, c) for m, c in queries], number=1, repeat=5)), len(queries))
+
+    def update_role_overwrite() -> None:
+        resolver.set_overwrite(rng.choice(channels), rng.choice(roles), allow=rng.getrandbits(40))
+
+    report("role overwrite update", timeit.timeit(update_role_overwrite, number=10_000), 10_000)
+    report("cached after updates", min(timeit.repeat(lambda: [permissions(m, c) for m, c in queries], number=1, repeat=5)), len(queries))
+
+    def update_role() -> None:
+        resolver.set_role(rng.choice(roles), rng.getrandbits(40) & ~Permissions.ADMINISTRATOR)
+
+    report("role update", timeit.timeit(update_role, number=1_000), 1_000)
+
+    def full_flush() -> None:
+        resolver.clear()
+        for m, c in queries[:10_000]:
+            permissions(m, c)
+
+    report("flush and recompute (per query)", timeit.timeit(full_flush, number=1), 10_000)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Benchmarks the registration of commands in 10k guilds through \
+:class:`~scheduler.RegistrationScheduler`, against the in-process \
+:class:`~fake_api.FakeAPI`: requests per second without rate limits, and \
+with buckets of 50 requests per second.
+
+Usage: `python benchmarks/registration.py`
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpora import APPLICATION_ID, build_commands
+from discord_yg_types.bulk import BulkUpsertPlanner
+from discord_yg_types.fake_api import FakeAPI
+from discord_yg_types.permissions import parse_permissions
+from discord_yg_types.scheduler import RegistrationScheduler, bulk_overwrite_jobs
+
+
+GUILDS = 10_000
+COMMAND_SETS = 10
+
+
+def plan() -> BulkUpsertPlanner:
+    commands = [
+        {
+            key: parse_permissions(value) if key == "default_member_permissions" and value is not None else value
+            for key, value in command.items()
+            if key not in ("id", "application_id", "version", "guild_id")
+        }
+        for command in build_commands(COMMAND_SETS * 5)
+    ]
+    sets = [commands[index:index + 5] for index in range(0, len(commands), 5)]
+    planner = BulkUpsertPlanner()
+    for guild_id in range(GUILDS):
+        planner.add(str(guild_id), sets[guild_id % COMMAND_SETS])  # type: ignore
+    return planner
+
+
+async def register(planner: BulkUpsertPlanner, api: FakeAPI) -> float:
+    scheduler = RegistrationScheduler(api, concurrency=64)
+    start = time.perf_counter()
+    report = await scheduler.run(bulk_overwrite_jobs(APPLICATION_ID, planner.groups()))
+    seconds = time.perf_counter() - start
+    assert report.succeeded == GUILDS and not report.failed, report
+    return seconds
+
+
+def main() -> None:
+    planner = plan()
+    api = FakeAPI(rate_limit=None)
+    start = time.perf_counter()
+    for group in planner.groups():
+        for guild_id in group.guild_ids:
+            api.handle("PUT", f"/applications/{APPLICATION_ID}/guilds/{guild_id}/commands", group.body)
+    print(f"FakeAPI alone: {GUILDS / (time.perf_counter() - start):,.0f} requests/s")
+    for name, api in (("no rate limits", FakeAPI(rate_limit=None)), ("50 requests/s per bucket", FakeAPI(rate_limit=50))):
+        seconds = asyncio.run(register(planner, api))
+        print(f"scheduler, {name}: {GUILDS / seconds:,.0f} guilds/s, {api.requests:,} requests")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Benchmarks :func:`~streaming.iter_items` against `json.load` on a file \
+of 2k commands: time, and peak memory while counting the commands.
+
+Usage: `python benchmarks/streaming.py`
+"""
+
+import json
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from decoding import build
+from discord_yg_types.streaming import iter_items
+
+
+def load(path: Path) -> int:
+    with path.open("rb") as file:
+        return len(json.load(file))
+
+
+def stream(path: Path) -> int:
+    with path.open("rb") as file:
+        return sum(1 for _ in iter_items(file))
+
+
+def peak(function, path: Path) -> int:
+    tracemalloc.start()
+    function(path)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "commands.json")
+        path.write_bytes(build())
+        print(f"payload: {path.stat().st_size / 1e6:.1f} MB")
+        for name, function in (("json.load", load), ("iter_items", stream)):
+            assert function(path) == load(path)
+            seconds = min(timeit.repeat(lambda: function(path), number=1, repeat=5))
+            print(f"{name}: {seconds * 1e3:.1f} ms, peak {peak(function, path) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,400 @@
+"""Benchmark suite of the type layer, on the synthetic corpora of \
+:mod:`corpora`.
+
+Every benchmark reports a time per item in nanoseconds, or a size per item \
+in bytes, and is compared with `baseline.json`. A result more than \
+`--tolerance` worse than the baseline is reported as a regression, and a \
+benchmark without a baseline fails `--check`: store its baseline with \
+`--save -k NAME` in the change that adds it. Baselines depend on the machine, so save one before changing the code and \
+compare on the same machine.
+
+Usage:
+```
+python benchmarks/suite.py --save            # store the baseline
+python benchmarks/suite.py --check           # exit 1 on a regression
+python benchmarks/suite.py -k decoding --commands 1000
+```
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpora import GUILD_ID, APPLICATION_ID, build_command_permissions, build_commands, build_invocation, build_permission_strings, build_snowflakes
+from discord_yg_types import snowflakes
+from discord_yg_types.arguments import ArgumentParser, ArgumentParserCache
+from discord_yg_types.channel_types import ChannelTypeMask
+from discord_yg_types.application_commands.GetApplicationCommand import GetApplicationCommand
+from discord_yg_types.application_commands.PutGuildApplicationCommand import PutGuildApplicationCommand
+from discord_yg_types.command_permissions import CommandPermissionIndex
+from discord_yg_types.decoding import decode, to_struct
+from discord_yg_types.encoding import EncodingCache, encode
+from discord_yg_types.enums import Permissions
+from discord_yg_types.fingerprints import FingerprintCache
+from discord_yg_types.localizations import Localizations
+from discord_yg_types.permissions import PermissionArray, PermissionResolver, decompose_permissions, parse_permissions, permission_names
+from discord_yg_types.snowflakes import IntSnowflake
+from discord_yg_types.streaming import iter_items
+from discord_yg_types.validators import validate
+from discord_yg_types.views import view
+
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+COMMANDS = 10_000
+PERMISSION_STRINGS = 100_000
+SNOWFLAKES = 100_000
+REPEAT = 3
+
+
+class Corpus:
+    """The inputs of the benchmarks, built once."""
+
+    def __init__(self, commands: int) -> None:
+        self.commands = build_commands(commands)
+        self.payload = json.dumps(self.commands, separators=(",", ":")).encode()
+        self.command_payloads = [json.dumps(command, separators=(",", ":")).encode() for command in self.commands]
+        self.parsed = [
+            dict(command, default_member_permissions=None if command["default_member_permissions"] is None else parse_permissions(command["default_member_permissions"]))
+            for command in self.commands
+        ]
+        """The commands with :class:`~enums.Permissions`, like the TypedDicts describe them."""
+        self.permission_strings = build_permission_strings(PERMISSION_STRINGS)
+        self.command_permissions = build_command_permissions(1000)
+        self.snowflakes = build_snowflakes(SNOWFLAKES)
+        self.invocations = [build_invocation(command) for command in self.commands]
+
+
+class Result(NamedTuple):
+    value: float
+    unit: str
+
+
+Benchmark = Callable[[Corpus], Result]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(function: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def per_item(function: Callable[[], Any], items: int) -> Result:
+    """Best time of `function` divided by `items`, in nanoseconds."""
+    return Result(min(timeit.repeat(function, number=1, repeat=REPEAT)) / items * 1e9, "ns")
+
+
+def size_per_item(function: Callable[[], Any], items: int) -> Result:
+    """Memory held by the result of `function` divided by `items`, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return Result(size / items, "B")
+
+
+# Construction
+
+@benchmark("construction/commands")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: build_commands(len(corpus.commands) // 10), len(corpus.commands) // 10)
+
+
+@benchmark("construction/structs")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: to_struct(corpus.commands), len(corpus.commands))
+
+
+@benchmark("construction/localizations")
+def _(corpus: Corpus) -> Result:
+    maps = [command["name_localizations"] for command in corpus.commands]
+    return per_item(lambda: [Localizations.from_dict(localizations) for localizations in maps], len(maps))
+
+
+# Validation
+
+@benchmark("validation/validate")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: [validate(command, GetApplicationCommand) for command in corpus.parsed], len(corpus.parsed))
+
+
+@benchmark("validation/fingerprint-cache-warm")
+def _(corpus: Corpus) -> Result:
+    cache = FingerprintCache(maxsize=1 << 20)
+    for command in corpus.parsed:
+        cache.validate(command, GetApplicationCommand)
+    return per_item(lambda: [cache.validate(command, GetApplicationCommand) for command in corpus.parsed], len(corpus.parsed))
+
+
+# Encoding
+
+@benchmark("encoding/json.dumps")
+def _(corpus: Corpus) -> Result:
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    return per_item(lambda: [dumps(command) for command in corpus.commands], len(corpus.commands))
+
+
+@benchmark("encoding/encode")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: [encode(command, PutGuildApplicationCommand) for command in corpus.parsed], len(corpus.parsed))
+
+
+@benchmark("encoding/encoding-cache-warm")
+def _(corpus: Corpus) -> Result:
+    cache = EncodingCache(maxsize=1 << 20)
+    for command in corpus.parsed:
+        cache.encode(command, PutGuildApplicationCommand)
+    return per_item(lambda: [cache.encode(command, PutGuildApplicationCommand) for command in corpus.parsed], len(corpus.parsed))
+
+
+@benchmark("encoding/fingerprint-cache-warm")
+def _(corpus: Corpus) -> Result:
+    cache = FingerprintCache(maxsize=1 << 20)
+    for command in corpus.commands:
+        cache.encode(command)
+    return per_item(lambda: [cache.encode(command) for command in corpus.commands], len(corpus.commands))
+
+
+# Decoding
+
+@benchmark("decoding/json.loads")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: json.loads(corpus.payload), len(corpus.commands))
+
+
+@benchmark("decoding/decode")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: decode(corpus.payload), len(corpus.commands))
+
+
+@benchmark("decoding/view-id-name-version")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: [(command["id"], command["name"], command["version"]) for command in view(corpus.payload)], len(corpus.commands))
+
+
+@benchmark("decoding/iter_items")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: sum(1 for _ in iter_items(io.BytesIO(corpus.payload))), len(corpus.commands))
+
+
+# Permissions
+
+@benchmark("permissions/parse")
+def _(corpus: Corpus) -> Result:
+    strings = corpus.permission_strings
+    return per_item(lambda: [parse_permissions(string) for string in strings], len(strings))
+
+
+@benchmark("permissions/names")
+def _(corpus: Corpus) -> Result:
+    permissions = [parse_permissions(string) for string in corpus.permission_strings]
+    return per_item(lambda: [permission_names(value) for value in permissions], len(permissions))
+
+
+@benchmark("permissions/decompose")
+def _(corpus: Corpus) -> Result:
+    permissions = [parse_permissions(string) for string in corpus.permission_strings]
+    return per_item(lambda: [decompose_permissions(value) for value in permissions], len(permissions))
+
+
+@benchmark("permissions/flag-operations")
+def _(corpus: Corpus) -> Result:
+    permissions = [parse_permissions(string) for string in corpus.permission_strings]
+    required = Permissions.SEND_MESSAGES | Permissions.VIEW_CHANNEL
+    return per_item(lambda: [value & required == required for value in permissions], len(permissions))
+
+
+@benchmark("permissions/array-has")
+def _(corpus: Corpus) -> Result | None:
+    try:
+        array = PermissionArray.from_strings(corpus.permission_strings)
+    except ImportError:
+        return None
+    return per_item(lambda: array.has(Permissions.SEND_MESSAGES), len(array))
+
+
+@benchmark("permissions/resolver")
+def _(corpus: Corpus) -> Result:
+    rng = random.Random(0)
+    resolver = PermissionResolver(str(GUILD_ID))
+    roles = [str(GUILD_ID + index) for index in range(200)]
+    for role_id in roles:
+        resolver.set_role(role_id, int(rng.choice(corpus.permission_strings)))
+    members = [str(GUILD_ID + 10_000 + index) for index in range(5_000)]
+    for member_id in members:
+        resolver.set_member(member_id, rng.sample(roles[1:], 5))
+    channels = [str(GUILD_ID + 20_000 + index) for index in range(100)]
+    for channel_id in channels:
+        for role_id in rng.sample(roles, 5):
+            resolver.set_overwrite(channel_id, role_id, allow=Permissions.SEND_MESSAGES, deny=Permissions.ATTACH_FILES)
+    queries = [(rng.choice(members), rng.choice(channels)) for _ in range(100_000)]
+
+    def run() -> None:
+        resolver.clear()
+        for member_id, channel_id in queries:
+            resolver.permissions(member_id, channel_id)
+
+    return per_item(run, len(queries))
+
+
+@benchmark("permissions/command-index")
+def _(corpus: Corpus) -> Result:
+    rng = random.Random(0)
+    index = CommandPermissionIndex(GUILD_ID, APPLICATION_ID)
+    index.set_all(corpus.command_permissions)
+    queries = [
+        (APPLICATION_ID + rng.randrange(1, 1001), GUILD_ID + rng.randrange(1, 10_000), {GUILD_ID + rng.randrange(1, 10_000) for _ in range(5)}, GUILD_ID + rng.randrange(1, 10_000))
+        for _ in range(100_000)
+    ]
+    can_invoke = index.can_invoke
+    return per_item(lambda: [can_invoke(*query) for query in queries], len(queries))
+
+
+# Arguments
+
+@benchmark("arguments/compile")
+def _(corpus: Corpus) -> Result:
+    commands = corpus.commands[:len(corpus.commands) // 10]
+    return per_item(lambda: [ArgumentParser(command) for command in commands], len(commands))
+
+
+@benchmark("arguments/parse-cache-warm")
+def _(corpus: Corpus) -> Result:
+    parsers = ArgumentParserCache()
+    pairs = list(zip(corpus.commands, corpus.invocations))
+    # Every parser is its own function, which the interpreter specializes only after a few calls
+    for _ in range(10):
+        for command, data in pairs:
+            parsers.parse(command, data)
+    return per_item(lambda: [parsers.parse(command, data) for command, data in pairs], len(pairs))
+
+
+# Channel types
+
+@benchmark("channel-types/select")
+def _(corpus: Corpus) -> Result:
+    rng = random.Random(0)
+    channels = [{"id": str(GUILD_ID + index), "type": rng.choice([0, 2, 4, 5, 11, 13, 15])} for index in range(500)]
+    mask = ChannelTypeMask.TEXT | ChannelTypeMask.THREAD
+    return per_item(lambda: [mask.select(channels) for _ in range(100)], 100 * len(channels))
+
+
+@benchmark("channel-types/list-scan")
+def _(corpus: Corpus) -> Result:
+    rng = random.Random(0)
+    channels = [{"id": str(GUILD_ID + index), "type": rng.choice([0, 2, 4, 5, 11, 13, 15])} for index in range(500)]
+    channel_types = (ChannelTypeMask.TEXT | ChannelTypeMask.THREAD).to_list()
+    return per_item(lambda: [[channel for channel in channels if channel["type"] in channel_types] for _ in range(100)], 100 * len(channels))
+
+
+# Snowflakes
+
+@benchmark("snowflakes/int-timestamps")
+def _(corpus: Corpus) -> Result:
+    return per_item(lambda: [IntSnowflake(snowflake).timestamp for snowflake in corpus.snowflakes], len(corpus.snowflakes))
+
+
+@benchmark("snowflakes/array-timestamps")
+def _(corpus: Corpus) -> Result | None:
+    try:
+        snowflakes.decode(corpus.snowflakes[:1])
+    except ImportError:
+        return None
+    return per_item(lambda: snowflakes.timestamps(snowflakes.decode(corpus.snowflakes)), len(corpus.snowflakes))
+
+
+# Memory
+
+@benchmark("memory/dict-command")
+def _(corpus: Corpus) -> Result:
+    return size_per_item(lambda: json.loads(corpus.payload), len(corpus.commands))
+
+
+@benchmark("memory/struct-command")
+def _(corpus: Corpus) -> Result:
+    return size_per_item(lambda: decode(corpus.payload), len(corpus.commands))
+
+
+@benchmark("memory/view-command")
+def _(corpus: Corpus) -> Result:
+    def run() -> list:
+        commands = view(corpus.payload)
+        for command in commands:
+            command["name"]
+        return commands
+    return size_per_item(run, len(corpus.commands))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmarks the type layer.")
+    parser.add_argument("-k", dest="pattern", default="", help="only run the benchmarks whose name contains PATTERN")
+    parser.add_argument("--commands", type=int, default=COMMANDS, help="commands of the corpus")
+    parser.add_argument("--save", action="store_true", help="store the results as the baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 by default")
+    arguments = parser.parse_args()
+
+    baseline: dict[str, Any] = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    if baseline and baseline.get("commands") != arguments.commands:
+        print(f"baseline is for {baseline.get('commands')} commands, not compared")
+        baseline = {}
+    previous: dict[str, list] = baseline.get("results", {})
+
+    corpus = Corpus(arguments.commands)
+    results: dict[str, Result] = {}
+    regressions = []
+    missing = []
+    print(f"{'benchmark':<40} {'result':>14} {'baseline':>14} {'ratio':>7}")
+    for name, function in BENCHMARKS.items():
+        if arguments.pattern not in name:
+            continue
+        result = function(corpus)
+        if result is None:
+            print(f"{name:<40} {'skipped':>14}")
+            continue
+        results[name] = result
+        line = f"{name:<40} {result.value:>11.1f} {result.unit:<2}"
+        if name in previous:
+            value, unit = previous[name]
+            ratio = result.value / value
+            line += f" {value:>11.1f} {unit:<2} {ratio:>6.2f}x"
+            if ratio > 1 + arguments.tolerance:
+                line += "  REGRESSION"
+                regressions.append(name)
+        elif previous and not arguments.save:
+            line += f" {'missing':>14}"
+            missing.append(name)
+        print(line)
+
+    if arguments.save:
+        saved = previous if arguments.pattern else {}
+        saved.update({name: list(result) for name, result in results.items()})
+        BASELINE.write_text(json.dumps({
+            "commands": arguments.commands,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": dict(sorted(saved.items())),
+        }, indent=4) + "\n")
+        print(f"saved {BASELINE}")
+    if missing:
+        print(f"no baseline for {', '.join(missing)}: store it with --save -k NAME")
+    if (regressions or missing) and arguments.check:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,146 @@
+"""Measures the type-check time saved by the flattened stubs of \
+:mod:`discord_yg_types.stubs` on a large consumer project.
+
+A project of `MODULES` modules using the Application Commands types is \
+generated, and checked with mypy and pyright (whichever are installed) twice: \
+against the sources, and against the sources with the stubs next to them, \
+where they take precedence over the `.py` files. Caches are disabled, so \
+every run resolves the types from scratch.
+
+Usage: `python benchmarks/type_checking.py [--modules N]`. Exits with 1 if \
+no type checker is installed, or if the project does not type check.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from discord_yg_types.stubs import generate_stubs
+
+MODULES = 200
+
+RUNS = 3
+
+CONSUMER = '''\
+from discord_yg_types.application_commands import PostChatInputApplicationCommand
+from discord_yg_types.application_commands.ApplicationCommandOption import ApplicationCommandOption
+from discord_yg_types.application_commands.GetApplicationCommand import GetApplicationCommand
+from discord_yg_types.application_commands.PatchApplicationCommand import PatchApplicationCommand
+from discord_yg_types.application_commands.PutGuildApplicationCommand import PutGuildApplicationCommand
+from discord_yg_types.enums import ApplicationCommandOptionTypes, ApplicationCommandTypes
+
+
+def command_{i}(name: str) -> PostChatInputApplicationCommand:
+    option: ApplicationCommandOption = {{
+        "type": ApplicationCommandOptionTypes.STRING,
+        "name": "query",
+        "description": "What to look for",
+        "required": True,
+        "max_length": 100,
+    }}
+    return {{
+        "type": ApplicationCommandTypes.CHAT_INPUT,
+        "name": name,
+        "description": "Command {i}",
+        "options": [option],
+    }}
+
+
+def rename_{i}(command: GetApplicationCommand, name: str) -> PatchApplicationCommand:
+    return {{"name": name, "description": command["description"]}}
+
+
+def overwrite_{i}(command: GetApplicationCommand) -> PutGuildApplicationCommand:
+    return {{"id": command["id"], "name": command["name"], "type": command.get("type", ApplicationCommandTypes.CHAT_INPUT)}}
+
+
+def required_{i}(options: list[ApplicationCommandOption]) -> list[str]:
+    return [option["name"] for option in options if option.get("required", False)]
+'''
+"""Source of every module of the project."""
+
+
+def make_project(directory: Path, modules: int, stubs: bool) -> Path:
+    """Writes the project and a copy of the package into `directory`. With \
+    `stubs`, the stubs are written next to the modules they replace."""
+    shutil.copytree(ROOT / "discord_yg_types", directory / "discord_yg_types", ignore=shutil.ignore_patterns("__pycache__"))
+    if stubs:
+        for path, text in generate_stubs().items():
+            if path.endswith(".pyi"):
+                (directory / "discord_yg_types" / path).write_text(text, encoding="utf-8")
+    project = directory / "consumer"
+    project.mkdir()
+    (project / "__init__.py").write_text("")
+    for i in range(modules):
+        (project / f"module_{i}.py").write_text(CONSUMER.format(i=i))
+    return project
+
+
+# Errors are only reported for the project, as if the package were installed
+
+def mypy(directory: Path, project: Path) -> list[str]:
+    (directory / "mypy.ini").write_text("[mypy]\npython_version = 3.11\n\n[mypy-discord_yg_types.*]\nignore_errors = True\n")
+    return [sys.executable, "-m", "mypy", "--config-file", "mypy.ini", "--no-incremental", "--cache-dir", os.devnull, str(project)]
+
+
+def pyright(directory: Path, project: Path) -> list[str]:
+    (directory / "pyrightconfig.json").write_text(json.dumps({"include": [project.name], "pythonVersion": "3.11"}))
+    return [shutil.which("pyright") or "pyright", "--project", str(directory)]
+
+
+def available() -> dict[str, object]:
+    checkers: dict[str, object] = {}
+    if subprocess.run([sys.executable, "-m", "mypy", "--version"], capture_output=True).returncode == 0:
+        checkers["mypy"] = mypy
+    if shutil.which("pyright"):
+        checkers["pyright"] = pyright
+    return checkers
+
+
+def check_time(checker, modules: int, stubs: bool) -> float:
+    """Fastest time of `RUNS` checks of the project, in seconds."""
+    best = float("inf")
+    for _ in range(RUNS):
+        with tempfile.TemporaryDirectory() as directory:
+            directory = Path(directory)
+            command = checker(directory, make_project(directory, modules, stubs))
+            start = time.perf_counter()
+            result = subprocess.run(command, cwd=directory, capture_output=True, text=True)
+            elapsed = time.perf_counter() - start
+            if result.returncode != 0:
+                raise RuntimeError(f"{' '.join(command)} failed:\n{result.stdout}{result.stderr}")
+            best = min(best, elapsed)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", type=int, default=MODULES)
+    options = parser.parse_args()
+
+    checkers = available()
+    if not checkers:
+        print("Install mypy or pyright to run this benchmark.", file=sys.stderr)
+        return 1
+    try:
+        for name, checker in checkers.items():
+            sources = check_time(checker, options.modules, stubs=False)
+            stubs = check_time(checker, options.modules, stubs=True)
+            print(f"{name:<8} {options.modules} modules: sources {sources:6.2f} s, stubs {stubs:6.2f} s ({sources / stubs:.2f}x)")
+    except RuntimeError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Benchmarks :func:`~views.view` against `json.loads` on a listing of 2k \
+commands, reading the `id`, `name` and `version` of every command.
+
+Usage: `python benchmarks/views.py`
+"""
+
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from decoding import build
+from discord_yg_types.views import view
+
+
+def read(commands: list) -> list[tuple[str, str, str]]:
+    return [(command["id"], command["name"], command["version"]) for command in commands]
+
+
+def footprint(function, data: bytes) -> int:
+    """Memory held by the commands once they are read."""
+    tracemalloc.start()
+    commands = function(data)
+    read(commands)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del commands
+    return size
+
+
+def main() -> None:
+    data = build()
+    print(f"payload: {len(data) / 1e6:.1f} MB")
+    for name, function in (("json.loads", json.loads), ("view", view)):
+        assert read(function(data)) == read(json.loads(data))
+        seconds = min(timeit.repeat(lambda: read(function(data)), number=1, repeat=5))
+        print(f"{name}: {seconds * 1e3:.1f} ms, {footprint(function, data) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
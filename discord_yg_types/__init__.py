@@ -0,0 +1,416 @@
+"""Python types for the Discord API.
+
+Every public name is imported on first access, so `import discord_yg_types` \
+is cheap and :mod:`~discord_yg_types.enums` and \
+:mod:`~discord_yg_types.typings` can be used without importing the \
+Application Commands types.
+
+Usage:
+```
+from discord_yg_types import ApplicationCommand, Permissions
+from discord_yg_types.enums import ChannelTypes
+```
+"""
+
+from importlib import import_module
+
+# `typing` is not imported so that importing the package is cheap
+TYPE_CHECKING = False
+
+
+_EXPORTS: dict[str, str] = {
+    # enums
+    "Permissions": ".enums",
+    "ChannelTypes": ".enums",
+    "ApplicationCommandPermissionType": ".enums",
+    "ApplicationCommandPermissionConstant": ".enums",
+    "ApplicationCommandTypes": ".enums",
+    "ApplicationCommandOptionTypes": ".enums",
+    "Locale": ".enums",
+    # typings
+    "Snowflake": ".typings",
+    "ApplicationCommandName": ".typings",
+    "Description": ".typings",
+    "Locales": ".typings",
+    # application_commands.ApplicationCommand
+    "ApplicationCommand": ".application_commands.ApplicationCommand",
+    "ChatInputApplicationCommand": ".application_commands.ApplicationCommand",
+    "UserApplicationCommand": ".application_commands.ApplicationCommand",
+    "MessageApplicationCommand": ".application_commands.ApplicationCommand",
+    # application_commands.ApplicationCommandOption
+    "ApplicationCommandOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandBooleanOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandUserOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandRoleOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandMentionableOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandAttachmentOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandIntegerOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandStringOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandChannelOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandNumberOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandSubCommandOption": ".application_commands.ApplicationCommandOption",
+    "ApplicationCommandSubCommandGroupOption": ".application_commands.ApplicationCommandOption",
+    # application_commands.ApplicationCommandOptionChoice
+    "ApplicationCommandOptionChoice": ".application_commands.ApplicationCommandOptionChoice",
+    "ApplicationCommandOptionChoiceForString": ".application_commands.ApplicationCommandOptionChoice",
+    "ApplicationCommandOptionChoiceForInteger": ".application_commands.ApplicationCommandOptionChoice",
+    "ApplicationCommandOptionChoiceForNumber": ".application_commands.ApplicationCommandOptionChoice",
+    # application_commands.ApplicationCommandPermission
+    "ApplicationCommandPermission": ".application_commands.ApplicationCommandPermission",
+    # application_commands.GetApplicationCommand
+    "GetApplicationCommand": ".application_commands.GetApplicationCommand",
+    "GetApplicationCommandWithLocalizations": ".application_commands.GetApplicationCommand",
+    "GetApplicationCommandWithoutLocalizations": ".application_commands.GetApplicationCommand",
+    # application_commands.GuildApplicationCommandPermission
+    "GuildApplicationCommandPermission": ".application_commands.GuildApplicationCommandPermission",
+    # application_commands.PatchApplicationCommand
+    "PatchApplicationCommand": ".application_commands.PatchApplicationCommand",
+    "PatchChatInputApplicationCommand": ".application_commands.PatchApplicationCommand",
+    "PatchUserApplicationCommand": ".application_commands.PatchApplicationCommand",
+    "PatchMessageApplicationCommand": ".application_commands.PatchApplicationCommand",
+    # application_commands.PostApplicationCommand
+    "PostApplicationCommand": ".application_commands.PostApplicationCommand",
+    "PostChatInputApplicationCommand": ".application_commands.PostApplicationCommand",
+    "PostUserApplicationCommand": ".application_commands.PostApplicationCommand",
+    "PostMessageApplicationCommand": ".application_commands.PostApplicationCommand",
+    # application_commands.PutGuildApplicationCommand
+    "PutGuildApplicationCommand": ".application_commands.PutGuildApplicationCommand",
+    "PutChatInputGuildApplicationCommand": ".application_commands.PutGuildApplicationCommand",
+    "PutUserGuildApplicationCommand": ".application_commands.PutGuildApplicationCommand",
+    "PutMessageGuildApplicationCommand": ".application_commands.PutGuildApplicationCommand",
+    # arguments
+    "ArgumentParser": ".arguments",
+    "ArgumentParserCache": ".arguments",
+    "AttachmentArgument": ".arguments",
+    "ChannelArgument": ".arguments",
+    "ParsedArguments": ".arguments",
+    "RoleArgument": ".arguments",
+    "UserArgument": ".arguments",
+    "compile_leaf": ".arguments",
+    # autocomplete
+    "AutocompleteIndex": ".autocomplete",
+    # bulk
+    "BulkUpsertPlanner": ".bulk",
+    "UpsertGroup": ".bulk",
+    # channel_types
+    "ChannelTypeMask": ".channel_types",
+    # command_permissions
+    "CommandPermissionIndex": ".command_permissions",
+    # dispatch
+    "CommandRouter": ".dispatch",
+    "Route": ".dispatch",
+    # encoding
+    "EncodingCache": ".encoding",
+    "compile_encoder": ".encoding",
+    "encode": ".encoding",
+    # fake_api
+    "FakeAPI": ".fake_api",
+    # fingerprints
+    "FingerprintCache": ".fingerprints",
+    # localizations
+    "Localizations": ".localizations",
+    # options
+    "OPTION_CLASSES": ".options",
+    "OptionVisitor": ".options",
+    "is_attachment_option": ".options",
+    "is_boolean_option": ".options",
+    "is_channel_option": ".options",
+    "is_integer_option": ".options",
+    "is_mentionable_option": ".options",
+    "is_number_option": ".options",
+    "is_role_option": ".options",
+    "is_string_option": ".options",
+    "is_sub_command_group_option": ".options",
+    "is_sub_command_option": ".options",
+    "is_user_option": ".options",
+    "option_class": ".options",
+    # permissions
+    "ALL_PERMISSIONS": ".permissions",
+    "PermissionArray": ".permissions",
+    "PermissionResolver": ".permissions",
+    "decompose_permissions": ".permissions",
+    "parse_permissions": ".permissions",
+    "permission_names": ".permissions",
+    "permissions_from_names": ".permissions",
+    "serialize_permissions": ".permissions",
+    # registry
+    "CommandRegistry": ".registry",
+    "RegistryEntry": ".registry",
+    "RegistryStats": ".registry",
+    # scheduler
+    "Checkpoint": ".scheduler",
+    "Job": ".scheduler",
+    "RegistrationReport": ".scheduler",
+    "RegistrationScheduler": ".scheduler",
+    "bulk_overwrite_job": ".scheduler",
+    "bulk_overwrite_jobs": ".scheduler",
+    "create_job": ".scheduler",
+    # snowflakes
+    "IntSnowflake": ".snowflakes",
+    # streaming
+    "iter_commands": ".streaming",
+    "iter_items": ".streaming",
+    "iter_permissions": ".streaming",
+    # structs
+    "Struct": ".structs",
+    # stubs
+    "generate_stubs": ".stubs",
+    "verify_stubs": ".stubs",
+    "write_stubs": ".stubs",
+    # sync
+    "SyncPlan": ".sync",
+    "SyncPlanner": ".sync",
+    "plan_sync": ".sync",
+    # transport
+    "HTTPTransport": ".transport",
+    "ProtocolError": ".transport",
+    "Response": ".transport",
+    "Transport": ".transport",
+    # validators
+    "ValidationError": ".validators",
+    "compile_validator": ".validators",
+    "is_valid": ".validators",
+    "validate": ".validators",
+    # views
+    "PayloadView": ".views",
+}
+"""Module of every lazily imported name."""
+
+_SUBMODULES = frozenset({
+    "application_commands",
+    "arguments",
+    "autocomplete",
+    "bulk",
+    "channel_types",
+    "command_permissions",
+    "decoding",
+    "dispatch",
+    "encoding",
+    "enums",
+    "fake_api",
+    "fingerprints",
+    "localizations",
+    "options",
+    "permissions",
+    "registry",
+    "restrictions",
+    "scheduler",
+    "snowflakes",
+    "streaming",
+    "structs",
+    "stubs",
+    "sync",
+    "transport",
+    "typings",
+    "validators",
+    "views",
+})
+"""Submodules imported on first access."""
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(import_module(module, __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS, *_SUBMODULES})
+
+
+if TYPE_CHECKING:
+    from .enums import (
+        Permissions,
+        ChannelTypes,
+        ApplicationCommandPermissionType,
+        ApplicationCommandPermissionConstant,
+        ApplicationCommandTypes,
+        ApplicationCommandOptionTypes,
+        Locale,
+    )
+    from .typings import (
+        Snowflake,
+        ApplicationCommandName,
+        Description,
+        Locales,
+    )
+    from .application_commands.ApplicationCommand import (
+        ApplicationCommand,
+        ChatInputApplicationCommand,
+        UserApplicationCommand,
+        MessageApplicationCommand,
+    )
+    from .application_commands.ApplicationCommandOption import (
+        ApplicationCommandOption,
+        ApplicationCommandBooleanOption,
+        ApplicationCommandUserOption,
+        ApplicationCommandRoleOption,
+        ApplicationCommandMentionableOption,
+        ApplicationCommandAttachmentOption,
+        ApplicationCommandIntegerOption,
+        ApplicationCommandStringOption,
+        ApplicationCommandChannelOption,
+        ApplicationCommandNumberOption,
+        ApplicationCommandSubCommandOption,
+        ApplicationCommandSubCommandGroupOption,
+    )
+    from .application_commands.ApplicationCommandOptionChoice import (
+        ApplicationCommandOptionChoice,
+        ApplicationCommandOptionChoiceForString,
+        ApplicationCommandOptionChoiceForInteger,
+        ApplicationCommandOptionChoiceForNumber,
+    )
+    from .application_commands.ApplicationCommandPermission import (
+        ApplicationCommandPermission,
+    )
+    from .application_commands.GetApplicationCommand import (
+        GetApplicationCommand,
+        GetApplicationCommandWithLocalizations,
+        GetApplicationCommandWithoutLocalizations,
+    )
+    from .application_commands.GuildApplicationCommandPermission import (
+        GuildApplicationCommandPermission,
+    )
+    from .application_commands.PatchApplicationCommand import (
+        PatchApplicationCommand,
+        PatchChatInputApplicationCommand,
+        PatchUserApplicationCommand,
+        PatchMessageApplicationCommand,
+    )
+    from .application_commands.PostApplicationCommand import (
+        PostApplicationCommand,
+        PostChatInputApplicationCommand,
+        PostUserApplicationCommand,
+        PostMessageApplicationCommand,
+    )
+    from .application_commands.PutGuildApplicationCommand import (
+        PutGuildApplicationCommand,
+        PutChatInputGuildApplicationCommand,
+        PutUserGuildApplicationCommand,
+        PutMessageGuildApplicationCommand,
+    )
+    from .arguments import (
+        ArgumentParser,
+        ArgumentParserCache,
+        AttachmentArgument,
+        ChannelArgument,
+        ParsedArguments,
+        RoleArgument,
+        UserArgument,
+        compile_leaf,
+    )
+    from .autocomplete import (
+        AutocompleteIndex,
+    )
+    from .bulk import (
+        BulkUpsertPlanner,
+        UpsertGroup,
+    )
+    from .channel_types import (
+        ChannelTypeMask,
+    )
+    from .command_permissions import (
+        CommandPermissionIndex,
+    )
+    from .dispatch import (
+        CommandRouter,
+        Route,
+    )
+    from .encoding import (
+        EncodingCache,
+        compile_encoder,
+        encode,
+    )
+    from .fake_api import (
+        FakeAPI,
+    )
+    from .fingerprints import (
+        FingerprintCache,
+    )
+    from .localizations import (
+        Localizations,
+    )
+    from .options import (
+        OPTION_CLASSES,
+        OptionVisitor,
+        is_attachment_option,
+        is_boolean_option,
+        is_channel_option,
+        is_integer_option,
+        is_mentionable_option,
+        is_number_option,
+        is_role_option,
+        is_string_option,
+        is_sub_command_group_option,
+        is_sub_command_option,
+        is_user_option,
+        option_class,
+    )
+    from .permissions import (
+        ALL_PERMISSIONS,
+        PermissionArray,
+        PermissionResolver,
+        decompose_permissions,
+        parse_permissions,
+        permission_names,
+        permissions_from_names,
+        serialize_permissions,
+    )
+    from .registry import (
+        CommandRegistry,
+        RegistryEntry,
+        RegistryStats,
+    )
+    from .scheduler import (
+        Checkpoint,
+        Job,
+        RegistrationReport,
+        RegistrationScheduler,
+        bulk_overwrite_job,
+        bulk_overwrite_jobs,
+        create_job,
+    )
+    from .snowflakes import (
+        IntSnowflake,
+    )
+    from .streaming import (
+        iter_commands,
+        iter_items,
+        iter_permissions,
+    )
+    from .structs import (
+        Struct,
+    )
+    from .stubs import (
+        generate_stubs,
+        verify_stubs,
+        write_stubs,
+    )
+    from .sync import (
+        SyncPlan,
+        SyncPlanner,
+        plan_sync,
+    )
+    from .transport import (
+        HTTPTransport,
+        ProtocolError,
+        Response,
+        Transport,
+    )
+    from .validators import (
+        ValidationError,
+        compile_validator,
+        is_valid,
+        validate,
+    )
+    from .views import (
+        PayloadView,
+    )
\ No newline at end of file
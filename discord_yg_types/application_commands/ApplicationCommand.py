@@ -1,7 +1,8 @@
-from enums import ApplicationCommandTypes, Permissions
-from typing import Literal, TypedDict
-from typings import ApplicationCommandName, Locales, Snowflake
-from ApplicationCommandOption import ApplicationCommandOption
+from ..enums import ApplicationCommandTypes, Permissions
+from ..restrictions import Length, MaxItems, OnlyFor, RequiredFirst
+from typing import Annotated, Literal, TypedDict
+from ..typings import ApplicationCommandName, Description, Locales, Snowflake
+from .ApplicationCommandOption import ApplicationCommandOption
 
 
 class _RequiredApplicationCommand(TypedDict):
@@ -16,7 +17,7 @@ class _RequiredApplicationCommand(TypedDict):
     changes."""
     name: ApplicationCommandName
     """Name of command."""
-    description: str
+    description: Annotated[str, Length(0, 100)]
     """Description for command.
     
     Restrictions:
@@ -46,7 +47,7 @@ class _NoOptionsApplicationCommandWithLocalizations(_NoOptionsApplicationCommand
     name_localizations: Locales[ApplicationCommandName]
     """Localization dictionary for `name` field. Values follow the same \
     restrictions as `name`."""
-    description_localizations: Locales[str]
+    description_localizations: Locales[Description]
     """Localization `dictionary` for description field. Values follow the same \
     restrictions as `description`."""
 
@@ -57,7 +58,7 @@ class ApplicationCommand(_NoOptionsApplicationCommandWithLocalizations, total=Fa
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-structure
     """
 
-    options: list[ApplicationCommandOption]
+    options: Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]
     """Parameters for the command.
     
     Restrictions:
@@ -74,7 +75,7 @@ class ChatInputApplicationCommand(ApplicationCommand):
     
     type: Literal[ApplicationCommandTypes.CHAT_INPUT]  # type: ignore
     """Type CHAT_INPUT."""
-    description: Literal[""]  # type: ignore
+    description: Description  # type: ignore
     """Description for command.
     
     Restrictions:
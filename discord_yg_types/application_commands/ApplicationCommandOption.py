@@ -1,7 +1,8 @@
-from ApplicationCommandOptionChoice import *
-from enums import ApplicationCommandOptionTypes, ChannelTypes
-from typing import Literal, TypedDict
-from typings import ApplicationCommandName, Locales
+from .ApplicationCommandOptionChoice import *
+from ..enums import ApplicationCommandOptionTypes, ChannelTypes
+from ..restrictions import MAX_SAFE_INTEGER, MaxItems, OnlyFor, Range, RequiredFirst
+from typing import Annotated, Literal, TypedDict
+from ..typings import ApplicationCommandName, Description, Locales
 
 
 # TODO Add `name_localized` and `description_localized`
@@ -15,7 +16,7 @@ class _RequiredApplicationCommandOption(TypedDict):
     """Type of option."""
     name: ApplicationCommandName
     """Name of command."""
-    description: str
+    description: Description
     """Description of Command.
     
     Restrictions:
@@ -34,7 +35,7 @@ class _NotRequiredWithRequiredApplicationCommandOption(_RequiredApplicationComma
     name_localizations: Locales[ApplicationCommandName] | None
     """Localization dictionary for the `name` field. Values follow the same \
     restrictions as `name`."""
-    description_localizations: Locales[str] | None
+    description_localizations: Locales[Description] | None
     """Localization dictionary for the `description` field. Values follow the \
     same restrictions as `description`."""
 
@@ -93,7 +94,7 @@ class _AutocompleteApplicationCommandIntegerOption(_NotRequiredWithRequiredAppli
     """Adds `autocomplete` field for some \
     :class:`~ApplicationCommandOption`s."""
 
-    autocomplete: bool
+    autocomplete: Annotated[bool, OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]
     """Autocomplete interactions.
     
     Restrictions:
@@ -115,19 +116,19 @@ class ApplicationCommandIntegerOption(_RequiredApplicationCommandIntegerOption,
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-structure
     """
 
-    choices: list[ApplicationCommandOptionChoiceForInteger]
+    choices: Annotated[list[ApplicationCommandOptionChoiceForInteger], MaxItems(25)]
     """INTEGER choices for the user to pick from.
 
     Restrictions:
     - Max 25 choices.
     """
-    min_value: int
+    min_value: Annotated[int, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)]
     """The minimum value permitted.
     
     Restrictions:
     - Any `int` between -2^53 and 2^53.
     """
-    max_value: int
+    max_value: Annotated[int, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)]
     """The maximum value permitted.
     
     Restrictions:
@@ -149,19 +150,19 @@ class ApplicationCommandStringOption(_RequiredApplicationCommandStringOption, to
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-structure
     """
 
-    choices: list[ApplicationCommandOptionChoiceForString]
+    choices: Annotated[list[ApplicationCommandOptionChoiceForString], MaxItems(25)]
     """STRING choices for the user to pick from.
 
     Restrictions:
     - Max 25 choices.
     """
-    min_length: int
+    min_length: Annotated[int, Range(0, 6000)]
     """The minimum allowed length.
     
     Restrictions:
     - Any `int` between 0 and 6000.
     """
-    max_length: int
+    max_length: Annotated[int, Range(0, 6000)]
     """The maximum allowed length.
     
     Restrictions:
@@ -201,19 +202,19 @@ class ApplicationCommandNumberOption(_RequiredApplicationCommandNumberOption, to
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-structure
     """
 
-    choices: list[ApplicationCommandOptionChoiceForNumber]
+    choices: Annotated[list[ApplicationCommandOptionChoiceForNumber], MaxItems(25)]
     """NUMBER choices for the user to pick from.
 
     Restrictions:
     - Max 25 choices.
     """
-    min_value: float
+    min_value: Annotated[float, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)]
     """The minimum value permitted.
     
     Restrictions:
     - Any `float` between -2^53 and 2^53.
     """
-    max_value: float
+    max_value: Annotated[float, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)]
     """The maximum value permitted.
     
     Restrictions:
@@ -227,48 +228,48 @@ class ApplicationCommandOption(_AutocompleteApplicationCommandIntegerOption, tot
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-structure
     """
 
-    options: list["ApplicationCommandOption"]
+    options: Annotated[list["ApplicationCommandOption"], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandOptionTypes.SUB_COMMAND, ApplicationCommandOptionTypes.SUB_COMMAND_GROUP)]
     """These nested options will be the parameters.
     
     Restrictions:
     - Only for SUB_COMMAND or SUB_COMMAND_GROUP option type.
     - Required options must be listed before optional options.
     """
-    choices: list[ApplicationCommandOptionChoice]
+    choices: Annotated[list[ApplicationCommandOptionChoice], MaxItems(25), OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]
     """Choices for the user to pick from.
 
     Restrictions:
     - Only for STRING, INTEGER, and NUMBER option type.
     - Max 25 choices.
     """
-    channel_types: list[ChannelTypes]
+    channel_types: Annotated[list[ChannelTypes], OnlyFor(ApplicationCommandOptionTypes.CHANNEL)]
     """The channels shown will be restricted to these types.
     
     Restrictions:
     - Only for CHANNEL option type.
     """
-    min_value: int | float
+    min_value: Annotated[int | float, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER), OnlyFor(ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]
     """The minimum value permitted.
     
     Restrictions:
     - Only for INTEGER or NUMBER option type.
     - Any number between -2^53 and 2^53.
     """
-    max_value: int | float
+    max_value: Annotated[int | float, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER), OnlyFor(ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]
     """The maximum value permitted.
     
     Restrictions:
     - Only for INTEGER or NUMBER option type.
     - Any number between -2^53 and 2^53.
     """
-    min_length: int
+    min_length: Annotated[int, Range(0, 6000), OnlyFor(ApplicationCommandOptionTypes.STRING)]
     """The minimum allowed length.
     
     Restrictions:
     - Only for STRING option type.
     - Any `int` between 0 and 6000.
     """
-    max_length: int
+    max_length: Annotated[int, Range(0, 6000), OnlyFor(ApplicationCommandOptionTypes.STRING)]
     """The maximum allowed length.
     
     Restrictions:
@@ -291,7 +292,7 @@ class ApplicationCommandSubCommandOption(_RequiredApplicationCommandSubCommandOp
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-structure
     """
 
-    options: list[ApplicationCommandOption]
+    options: Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst()]
     """These nested options will be the parameters.
     
     Restrictions:
@@ -1,17 +1,18 @@
-from typing import TypedDict
-from typings import Locales
+from ..restrictions import Length
+from typing import Annotated, TypedDict
+from ..typings import Locales
 
 
 class _RequiredApplicationCommandOptionChoice(TypedDict):
     """Required fields for :class:`~ApplicationCommandOptionChoice`."""
     
-    name: str
+    name: Annotated[str, Length(1, 100)]
     """Choice name.
     
     Requirements:
     - 1-100 character
     """
-    value: str | int | float
+    value: Annotated[str, Length(0, 100)] | int | float
     """Value for the choice; up to 100 characters if string."""
 
 
@@ -21,7 +22,7 @@ class ApplicationCommandOptionChoice(_RequiredApplicationCommandOptionChoice, to
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-choice-structure
     """
 
-    name_localizations: Locales[str]
+    name_localizations: Locales[Annotated[str, Length(1, 100)]]
     """Localization dictionary for the `name` field. Values follow the same \
     restrictions as `name`."""
 
@@ -32,7 +33,7 @@ class ApplicationCommandOptionChoiceForString(ApplicationCommandOptionChoice):
     https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-option-choice-structure
     """
 
-    value: str  # type: ignore
+    value: Annotated[str, Length(0, 100)]  # type: ignore
     """Value for the choice; up to 100 characters."""
 
 
@@ -1,6 +1,6 @@
-from enums import ApplicationCommandPermissionType, ApplicationCommandPermissionConstant
+from ..enums import ApplicationCommandPermissionType, ApplicationCommandPermissionConstant
 from typing import TypedDict
-from typings import Snowflake
+from ..typings import Snowflake
 
 
 class ApplicationCommandPermission(TypedDict):
@@ -1,5 +1,5 @@
-from typings import ApplicationCommandName
-from ApplicationCommand import _NoOptionsApplicationCommand, ApplicationCommand
+from ..typings import ApplicationCommandName
+from .ApplicationCommand import _NoOptionsApplicationCommand, ApplicationCommand
 
 
 class GetApplicationCommandWithLocalizations(ApplicationCommand):
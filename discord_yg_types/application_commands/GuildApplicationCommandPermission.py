@@ -1,6 +1,7 @@
-from ApplicationCommandPermission import ApplicationCommandPermission
-from typing import TypedDict
-from typings import Snowflake
+from .ApplicationCommandPermission import ApplicationCommandPermission
+from ..restrictions import MaxItems
+from typing import Annotated, TypedDict
+from ..typings import Snowflake
 
 
 class GuildApplicationCommandPermission(TypedDict):
@@ -15,7 +16,7 @@ class GuildApplicationCommandPermission(TypedDict):
     """ID of the application the command belongs to."""
     guild_id: Snowflake
     """ID of the guild"""
-    permissions: list[ApplicationCommandPermission]
+    permissions: Annotated[list[ApplicationCommandPermission], MaxItems(100)]
     """Permissions for the command in the guild
     
     Restrictions:
@@ -0,0 +1,54 @@
+from .ApplicationCommandOption import ApplicationCommandOption
+from ..enums import ApplicationCommandTypes, Permissions
+from ..restrictions import MaxItems, OnlyFor, RequiredFirst
+from typing import Annotated, TypedDict
+from ..typings import ApplicationCommandName, Description, Locales
+
+
+# Every field is optional: a PATCH only sends the fields that change
+class _NotRequiredPatchApplicationCommand(TypedDict, total=False):
+    name: ApplicationCommandName
+    """Name of command."""
+    name_localizations: Locales[ApplicationCommandName] | None
+    """Localization dictionary for the `name` field. Values follow the same \
+    restrictions as `name`."""
+    default_member_permissions: Permissions | None
+    """Set of permissions represented as a bit set."""
+    dm_permission: bool | None
+    """Indicates whether the command is available in DMs with the app or only \
+    for globally-scoped commands.
+    
+    Default: `True`
+    """
+
+
+class PatchApplicationCommand(_NotRequiredPatchApplicationCommand, total=False):
+    description: Description
+    """Description for commands.
+    
+    Restrictions:
+    - Only for CHAT_INPUT.
+    - 1-100 characters.
+    """
+    description_localizations: Locales[Description] | None
+    """Localization dictionary for the `description` field. Values follow the \
+    same restrictions as `description`."""
+    options: Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]
+    """The parameters for the command."""
+
+
+class PatchChatInputApplicationCommand(PatchApplicationCommand, total=False):
+    description: Description
+    """Description for commands.
+    
+    Restrictions:
+    - 1-100 characters.
+    """
+
+
+class PatchUserApplicationCommand(_NotRequiredPatchApplicationCommand, total=False):
+    pass
+
+
+class PatchMessageApplicationCommand(_NotRequiredPatchApplicationCommand, total=False):
+    pass
\ No newline at end of file
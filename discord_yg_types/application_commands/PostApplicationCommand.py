@@ -1,7 +1,8 @@
-from ApplicationCommandOption import ApplicationCommandOption
-from enums import ApplicationCommandTypes, Permissions
-from typing import Literal, TypedDict
-from typings import ApplicationCommandName, Locales
+from .ApplicationCommandOption import ApplicationCommandOption
+from ..enums import ApplicationCommandTypes, Permissions
+from ..restrictions import MaxItems, OnlyFor, RequiredFirst
+from typing import Annotated, Literal, TypedDict
+from ..typings import ApplicationCommandName, Description, Locales
 
 
 class _RequiredPostApplicationCommand(TypedDict):
@@ -34,17 +35,17 @@ class PostMessageApplicationCommand(_NotRequiredAndRequiredPostApplicationComman
 
 
 class PostApplicationCommand(_NotRequiredAndRequiredPostApplicationCommand, total=False):
-    description: str
+    description: Description
     """Description for commands.
     
     Restrictions:
     - Only for CHAT_INPUT.
     - 1-100 characters.
     """
-    description_localizations: Locales[str] | None
+    description_localizations: Locales[Description] | None
     """Localization dictionary for the `description` field. Values follow the \
     same restrictions as `description`."""
-    options: list[ApplicationCommandOption]
+    options: Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]
     """The parameters for the command."""
     type: ApplicationCommandTypes | None
     """Type of command.
@@ -55,7 +56,7 @@ class PostApplicationCommand(_NotRequiredAndRequiredPostApplicationCommand, tota
 
 # type is not required because, by default, it is CHAT_INPUT
 class PostChatInputApplicationCommand(PostApplicationCommand, total=False):
-    description: str
+    description: Description
     """Description for commands.
     
     Restrictions:
@@ -1,11 +1,11 @@
-from PostApplicationCommand import (
+from .PostApplicationCommand import (
     PostApplicationCommand,
     PostChatInputApplicationCommand,
     PostUserApplicationCommand,
     PostMessageApplicationCommand,
 )
 from typing import TypedDict
-from typings import Snowflake
+from ..typings import Snowflake
 
 
 class _Id(TypedDict, total=False):
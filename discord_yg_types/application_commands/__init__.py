@@ -0,0 +1,140 @@
+"""Types of the Application Commands API.
+
+https://discord.com/developers/docs/interactions/application-commands
+
+The TypedDicts are imported on first access, so importing this package does \
+not import every module.
+
+Every module is named like its first TypedDict, so that name is the module \
+here, like any submodule: `application_commands.ApplicationCommand` is the \
+module of :class:`ApplicationCommand`. Import these TypedDicts from \
+:mod:`discord_yg_types` or from their module.
+
+Usage:
+```
+from discord_yg_types import ApplicationCommand
+from discord_yg_types.application_commands import ChatInputApplicationCommand
+from discord_yg_types.application_commands.ApplicationCommand import ApplicationCommand
+```
+"""
+
+from importlib import import_module
+
+# `typing` is not imported so that importing the package is cheap
+TYPE_CHECKING = False
+
+
+_EXPORTS: dict[str, str] = {
+    # ApplicationCommand
+    "ChatInputApplicationCommand": ".ApplicationCommand",
+    "UserApplicationCommand": ".ApplicationCommand",
+    "MessageApplicationCommand": ".ApplicationCommand",
+    # ApplicationCommandOption
+    "ApplicationCommandBooleanOption": ".ApplicationCommandOption",
+    "ApplicationCommandUserOption": ".ApplicationCommandOption",
+    "ApplicationCommandRoleOption": ".ApplicationCommandOption",
+    "ApplicationCommandMentionableOption": ".ApplicationCommandOption",
+    "ApplicationCommandAttachmentOption": ".ApplicationCommandOption",
+    "ApplicationCommandIntegerOption": ".ApplicationCommandOption",
+    "ApplicationCommandStringOption": ".ApplicationCommandOption",
+    "ApplicationCommandChannelOption": ".ApplicationCommandOption",
+    "ApplicationCommandNumberOption": ".ApplicationCommandOption",
+    "ApplicationCommandSubCommandOption": ".ApplicationCommandOption",
+    "ApplicationCommandSubCommandGroupOption": ".ApplicationCommandOption",
+    # ApplicationCommandOptionChoice
+    "ApplicationCommandOptionChoiceForString": ".ApplicationCommandOptionChoice",
+    "ApplicationCommandOptionChoiceForInteger": ".ApplicationCommandOptionChoice",
+    "ApplicationCommandOptionChoiceForNumber": ".ApplicationCommandOptionChoice",
+    # GetApplicationCommand
+    "GetApplicationCommandWithLocalizations": ".GetApplicationCommand",
+    "GetApplicationCommandWithoutLocalizations": ".GetApplicationCommand",
+    # PatchApplicationCommand
+    "PatchChatInputApplicationCommand": ".PatchApplicationCommand",
+    "PatchUserApplicationCommand": ".PatchApplicationCommand",
+    "PatchMessageApplicationCommand": ".PatchApplicationCommand",
+    # PostApplicationCommand
+    "PostChatInputApplicationCommand": ".PostApplicationCommand",
+    "PostUserApplicationCommand": ".PostApplicationCommand",
+    "PostMessageApplicationCommand": ".PostApplicationCommand",
+    # PutGuildApplicationCommand
+    "PutChatInputGuildApplicationCommand": ".PutGuildApplicationCommand",
+    "PutUserGuildApplicationCommand": ".PutGuildApplicationCommand",
+    "PutMessageGuildApplicationCommand": ".PutGuildApplicationCommand",
+}
+"""Module of every lazily imported name."""
+
+_SUBMODULES = frozenset({
+    "ApplicationCommand",
+    "ApplicationCommandOption",
+    "ApplicationCommandOptionChoice",
+    "ApplicationCommandPermission",
+    "GetApplicationCommand",
+    "GuildApplicationCommandPermission",
+    "PatchApplicationCommand",
+    "PostApplicationCommand",
+    "PutGuildApplicationCommand",
+})
+"""Submodules imported on first access. Each is named like its first TypedDict."""
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is not None:
+        value = getattr(import_module(module, __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS, *_SUBMODULES})
+
+
+if TYPE_CHECKING:
+    from .ApplicationCommand import (
+        ChatInputApplicationCommand,
+        UserApplicationCommand,
+        MessageApplicationCommand,
+    )
+    from .ApplicationCommandOption import (
+        ApplicationCommandBooleanOption,
+        ApplicationCommandUserOption,
+        ApplicationCommandRoleOption,
+        ApplicationCommandMentionableOption,
+        ApplicationCommandAttachmentOption,
+        ApplicationCommandIntegerOption,
+        ApplicationCommandStringOption,
+        ApplicationCommandChannelOption,
+        ApplicationCommandNumberOption,
+        ApplicationCommandSubCommandOption,
+        ApplicationCommandSubCommandGroupOption,
+    )
+    from .ApplicationCommandOptionChoice import (
+        ApplicationCommandOptionChoiceForString,
+        ApplicationCommandOptionChoiceForInteger,
+        ApplicationCommandOptionChoiceForNumber,
+    )
+    from .GetApplicationCommand import (
+        GetApplicationCommandWithLocalizations,
+        GetApplicationCommandWithoutLocalizations,
+    )
+    from .PatchApplicationCommand import (
+        PatchChatInputApplicationCommand,
+        PatchUserApplicationCommand,
+        PatchMessageApplicationCommand,
+    )
+    from .PostApplicationCommand import (
+        PostChatInputApplicationCommand,
+        PostUserApplicationCommand,
+        PostMessageApplicationCommand,
+    )
+    from .PutGuildApplicationCommand import (
+        PutChatInputGuildApplicationCommand,
+        PutUserGuildApplicationCommand,
+        PutMessageGuildApplicationCommand,
+    )
\ No newline at end of file
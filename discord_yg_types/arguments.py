@@ -0,0 +1,358 @@
+"""Compiled argument parsers for application command invocations.
+
+Every command is compiled once into one specialized Python function per \
+subcommand, which converts the `options` of an invocation into typed \
+arguments in a single pass:
+- STRING, INTEGER, NUMBER and BOOLEAN values are checked against their \
+type, their `choices` (a `frozenset`), their `min_value`/`max_value` and \
+their `min_length`/`max_length`, with the bounds inlined in the code,
+- USER, ROLE, CHANNEL, MENTIONABLE and ATTACHMENT snowflakes become \
+:class:`UserArgument`, :class:`RoleArgument`, :class:`ChannelArgument` and \
+:class:`AttachmentArgument` holding the `resolved` data of the \
+invocation, and CHANNEL values are checked against `channel_types`.
+
+The first problem found raises a :class:`~validators.ValidationError` whose \
+path is the names of the subcommand group, the subcommand and the option, \
+like `config.set.value`.
+
+:class:`ArgumentParserCache` keeps the parser of every command and compiles \
+it again only when the `version` of the command changes.
+
+https://discord.com/developers/docs/interactions/receiving-and-responding#interaction-object-application-command-data-structure
+
+Usage:
+```
+parsers = ArgumentParserCache()
+route = router.resolve(interaction["data"])
+parsed = parsers.parse(route.command, interaction["data"])
+route.handler(interaction, **parsed.arguments)
+```
+"""
+
+from .application_commands.ApplicationCommand import ApplicationCommand
+from .application_commands.PostApplicationCommand import PostApplicationCommand
+from .enums import ApplicationCommandOptionTypes, ApplicationCommandTypes
+from .restrictions import MAX_SAFE_INTEGER
+from .snowflakes import IntSnowflake
+from typing import Any, Callable, Mapping, NamedTuple
+from .typings import Snowflake
+from .validators import ValidationError
+
+
+class UserArgument(NamedTuple):
+    """The value of a USER option, or of a MENTIONABLE option naming a \
+    user."""
+
+    id: IntSnowflake
+    user: Mapping[str, Any] | None
+    """The user in `resolved.users`, `None` if it is not there."""
+    member: Mapping[str, Any] | None
+    """The member in `resolved.members`, `None` outside of guilds."""
+
+
+class RoleArgument(NamedTuple):
+    """The value of a ROLE option, or of a MENTIONABLE option naming a role."""
+
+    id: IntSnowflake
+    role: Mapping[str, Any] | None
+    """The role in `resolved.roles`, `None` if it is not there."""
+
+
+class ChannelArgument(NamedTuple):
+    """The value of a CHANNEL option."""
+
+    id: IntSnowflake
+    channel: Mapping[str, Any] | None
+    """The partial channel in `resolved.channels`, `None` if it is not there."""
+
+
+class AttachmentArgument(NamedTuple):
+    """The value of an ATTACHMENT option."""
+
+    id: IntSnowflake
+    attachment: Mapping[str, Any] | None
+    """The attachment in `resolved.attachments`, `None` if it is not there."""
+
+
+class ParsedArguments(NamedTuple):
+    group: str | None
+    """Name of the subcommand group invoked, if any."""
+    subcommand: str | None
+    """Name of the subcommand invoked, if any."""
+    arguments: dict[str, Any]
+    """Converted values by option name. Optional options that were not \
+    given are absent. The value of the focused option of an autocomplete \
+    interaction is kept as sent, without checks."""
+
+
+Leaf = Callable[[Any, Mapping[str, Any]], dict[str, Any]]
+"""A compiled parser of the options of a command or a subcommand. Takes \
+the options of the invocation and its `resolved` data."""
+
+_EMPTY: Mapping[str, Any] = {}
+
+
+def _snowflake(value: Any, path: str) -> IntSnowflake:
+    """Parses the snowflake value of an option."""
+    if type(value) is str and value.isascii() and value.isdigit():
+        return IntSnowflake(value)
+    raise ValidationError(path, "must be a snowflake")
+
+
+_namespace: dict[str, Any] = {
+    "ValidationError": ValidationError,
+    "_snowflake": _snowflake,
+    "_User": UserArgument,
+    "_Role": RoleArgument,
+    "_Channel": ChannelArgument,
+    "_Attachment": AttachmentArgument,
+    "_EMPTY": _EMPTY,
+}
+"""Globals shared by the generated code. Every parser gets a copy with its \
+constants."""
+
+_TYPE_TESTS = {
+    ApplicationCommandOptionTypes.STRING: ("type(value) is str", "must be a string"),
+    ApplicationCommandOptionTypes.INTEGER: ("type(value) is int", "must be an integer"),
+    ApplicationCommandOptionTypes.NUMBER: ("type(value) is float or type(value) is int", "must be a number"),
+    ApplicationCommandOptionTypes.BOOLEAN: ("value is True or value is False", "must be a boolean"),
+}
+"""(test, error message) of the scalar option types."""
+
+_REFERENCE_TYPES = frozenset({
+    ApplicationCommandOptionTypes.USER,
+    ApplicationCommandOptionTypes.CHANNEL,
+    ApplicationCommandOptionTypes.ROLE,
+    ApplicationCommandOptionTypes.MENTIONABLE,
+    ApplicationCommandOptionTypes.ATTACHMENT,
+})
+"""Option types whose values are snowflakes of `resolved` objects."""
+
+
+class _Compiler:
+    """Generates the source of the parser of one command or subcommand."""
+
+    def __init__(self, namespace: dict[str, Any]) -> None:
+        self.namespace = namespace
+        self.lines: list[str] = []
+
+    def constant(self, value: Any) -> str:
+        """Stores `value` in the namespace and returns its name."""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent: int, path: str, message: str) -> None:
+        self.emit(indent, f"raise ValidationError({path!r}, {message!r})")
+
+    def option(self, option: Mapping[str, Any], path: str) -> None:
+        """Emits the conversion of `value` for `option`, at indent 3."""
+        option_type = option["type"]
+        name = option["name"]
+        test = _TYPE_TESTS.get(option_type)
+        if test is not None:
+            self.emit(3, f"if not ({test[0]}):")
+            self.error(4, path, test[1])
+            self.scalar(option, option_type, path)
+            value = "float(value)" if option_type == ApplicationCommandOptionTypes.NUMBER else "value"
+        elif option_type in _REFERENCE_TYPES:
+            # The snowflake is checked first, so that the value is a str when it is looked up
+            self.emit(3, f"snowflake = _snowflake(value, {path!r})")
+            if option_type == ApplicationCommandOptionTypes.USER:
+                value = "_User(snowflake, users.get(value), members.get(value))"
+            elif option_type == ApplicationCommandOptionTypes.ROLE:
+                value = "_Role(snowflake, roles.get(value))"
+            elif option_type == ApplicationCommandOptionTypes.ATTACHMENT:
+                value = "_Attachment(snowflake, attachments.get(value))"
+            elif option_type == ApplicationCommandOptionTypes.CHANNEL:
+                self.emit(3, "channel = channels.get(value)")
+                channel_types = option.get("channel_types")
+                if channel_types:
+                    allowed = self.constant(frozenset(int(channel_type) for channel_type in channel_types))
+                    self.emit(3, f"if channel is not None and channel.get('type') not in {allowed}:")
+                    self.error(4, path, f"must be a channel of type {sorted(int(channel_type) for channel_type in channel_types)}")
+                value = "_Channel(snowflake, channel)"
+            else:
+                self.emit(3, "if value in users:")
+                self.emit(4, "value = _User(snowflake, users[value], members.get(value))")
+                self.emit(3, "elif value in roles:")
+                self.emit(4, "value = _Role(snowflake, roles[value])")
+                self.emit(3, "else:")
+                self.error(4, path, "must be a resolved user or role")
+                value = "value"
+        else:
+            # Unknown types are passed through, like the API may add new ones
+            value = "value"
+        self.emit(3, f"arguments[{name!r}] = {value}")
+
+    def scalar(self, option: Mapping[str, Any], option_type: int, path: str) -> None:
+        """Emits the checks of the restrictions of a scalar option."""
+        choices = option.get("choices")
+        if choices:
+            values = self.constant(frozenset(choice["value"] for choice in choices))
+            self.emit(3, f"if value not in {values}:")
+            self.error(4, path, "must be one of the choices")
+        if option_type == ApplicationCommandOptionTypes.STRING:
+            minimum = option.get("min_length")
+            maximum = option.get("max_length")
+            if minimum is not None or maximum is not None:
+                minimum = minimum or 0
+                maximum = 6000 if maximum is None else maximum
+                self.emit(3, f"if not ({minimum!r} <= len(value) <= {maximum!r}):")
+                self.error(4, path, f"must be {minimum}-{maximum} characters")
+        elif option_type in (ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER):
+            minimum = option.get("min_value")
+            maximum = option.get("max_value")
+            minimum = -MAX_SAFE_INTEGER if minimum is None else minimum
+            maximum = MAX_SAFE_INTEGER if maximum is None else maximum
+            self.emit(3, f"if not ({minimum!r} <= value <= {maximum!r}):")
+            self.error(4, path, f"must be between {minimum} and {maximum}")
+
+    def compile(self, options: list[Mapping[str, Any]], prefix: str) -> str:
+        """The source of `_parse(options, resolved)`."""
+        self.emit(0, "def _parse(options, resolved):")
+        self.emit(1, "users = resolved.get('users') or _EMPTY")
+        self.emit(1, "members = resolved.get('members') or _EMPTY")
+        self.emit(1, "roles = resolved.get('roles') or _EMPTY")
+        self.emit(1, "channels = resolved.get('channels') or _EMPTY")
+        self.emit(1, "attachments = resolved.get('attachments') or _EMPTY")
+        self.emit(1, "arguments = {}")
+        self.emit(1, "for option in options:")
+        self.emit(2, "name = option['name']")
+        self.emit(2, "value = option.get('value')")
+        self.emit(2, "if option.get('focused'):")
+        self.emit(3, "arguments[name] = value")
+        self.emit(3, "continue")
+        keyword = "if"
+        for option in options:
+            self.emit(2, f"{keyword} name == {option['name']!r}:")
+            self.option(option, prefix + option["name"])
+            keyword = "elif"
+        unknown = f"raise ValidationError({f'{prefix!r} + name' if prefix else 'name'}, 'is not an option of the command')"
+        if options:
+            self.emit(2, "else:")
+            self.emit(3, unknown)
+        else:
+            self.emit(2, unknown)
+        for option in options:
+            if option.get("required"):
+                self.emit(1, f"if {option['name']!r} not in arguments:")
+                self.error(2, prefix + option["name"], "is required")
+        self.emit(1, "return arguments")
+        return "\n".join(self.lines)
+
+
+def compile_leaf(options: list[Mapping[str, Any]], prefix: str = "", name: str = "<arguments>") -> Leaf:
+    """Compiles the parser of the options of a command or a subcommand. \
+    `prefix` starts the paths of the errors, like `"config.set."`."""
+    namespace = dict(_namespace)
+    source = _Compiler(namespace).compile(options, prefix)
+    exec(compile(source, name, "exec"), namespace)
+    leaf = namespace["_parse"]
+    leaf.__source__ = source
+    return leaf
+
+
+class ArgumentParser:
+    """The parser of the invocations of one version of a command."""
+
+    __slots__ = ("version", "_leaves", "_subcommands")
+
+    def __init__(self, command: ApplicationCommand | PostApplicationCommand | Mapping[str, Any]) -> None:
+        self.version: Snowflake | None = command.get("version")
+        """Version of the command compiled."""
+        self._leaves: dict[tuple[str | None, str | None], Leaf] = {}
+        """Parser of every (subcommand group, subcommand)."""
+        self._subcommands = False
+        """Whether the command has subcommands."""
+
+        options = command.get("options") or []
+        if int(command.get("type") or ApplicationCommandTypes.CHAT_INPUT) != ApplicationCommandTypes.CHAT_INPUT:
+            options = []
+        label = f"<arguments {command['name']}>"
+        for option in options:
+            if option["type"] == ApplicationCommandOptionTypes.SUB_COMMAND_GROUP:
+                self._subcommands = True
+                for child in option.get("options") or []:
+                    prefix = f"{option['name']}.{child['name']}."
+                    self._leaves[option["name"], child["name"]] = compile_leaf(child.get("options") or [], prefix, label)
+            elif option["type"] == ApplicationCommandOptionTypes.SUB_COMMAND:
+                self._subcommands = True
+                self._leaves[None, option["name"]] = compile_leaf(option.get("options") or [], f"{option['name']}.", label)
+        if not self._subcommands:
+            self._leaves[None, None] = compile_leaf(options, "", label)
+
+    def parse(self, data: Mapping[str, Any]) -> ParsedArguments:
+        """Converts the options of an invocation, the `data` of an \
+        interaction.
+
+        Raises:
+        - :class:`~validators.ValidationError` if an option is unknown, \
+        missing, of the wrong type, or does not follow its restrictions.
+        """
+        options = data.get("options") or ()
+        resolved = data.get("resolved") or _EMPTY
+        if not self._subcommands:
+            return ParsedArguments(None, None, self._leaves[None, None](options, resolved))
+        if not options:
+            raise ValidationError("", "a subcommand is required")
+        option = options[0]
+        group = None
+        if option.get("type") == ApplicationCommandOptionTypes.SUB_COMMAND_GROUP:
+            group = option["name"]
+            options = option.get("options")
+            if not options:
+                raise ValidationError(group, "a subcommand is required")
+            option = options[0]
+        leaf = self._leaves.get((group, option["name"]))
+        if leaf is None:
+            path = option["name"] if group is None else f"{group}.{option['name']}"
+            raise ValidationError(path, "is not a subcommand of the command")
+        return ParsedArguments(group, option["name"], leaf(option.get("options") or (), resolved))
+
+    __call__ = parse
+
+
+class ArgumentParserCache:
+    """The parsers of the commands, compiled again only when the `version` \
+    of a command changes.
+
+    Commands are identified by `id`, or by type and name for local commands \
+    without an `id`. Once `maxsize` commands are cached, the oldest is \
+    dropped.
+    """
+
+    __slots__ = ("maxsize", "_parsers")
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.maxsize = maxsize
+        """Maximum number of commands cached."""
+        self._parsers: dict[Snowflake | tuple[int, str], ArgumentParser] = {}
+
+    def get(self, command: ApplicationCommand | PostApplicationCommand | Mapping[str, Any]) -> ArgumentParser:
+        """The parser of the current version of `command`."""
+        key = command.get("id") or (int(command.get("type") or ApplicationCommandTypes.CHAT_INPUT), command["name"])
+        parser = self._parsers.get(key)
+        if parser is None or parser.version != command.get("version"):
+            if parser is None and len(self._parsers) >= self.maxsize:
+                del self._parsers[next(iter(self._parsers))]
+            parser = self._parsers[key] = ArgumentParser(command)
+        return parser
+
+    def parse(self, command: ApplicationCommand | PostApplicationCommand | Mapping[str, Any], data: Mapping[str, Any]) -> ParsedArguments:
+        """Converts the options of an invocation of `command`, like \
+        :meth:`ArgumentParser.parse`."""
+        return self.get(command).parse(data)
+
+    def invalidate(self, command_id: Snowflake) -> None:
+        """Drops the parser of a command, like after it is deleted."""
+        self._parsers.pop(command_id, None)
+
+    def clear(self) -> None:
+        self._parsers.clear()
+
+    def __len__(self) -> int:
+        return len(self._parsers)
\ No newline at end of file
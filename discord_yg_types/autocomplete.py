@@ -0,0 +1,203 @@
+"""Candidate index for autocomplete interactions.
+
+An autocomplete response holds at most 25 choices. \
+:class:`AutocompleteIndex` answers with ready-made \
+:class:`~ApplicationCommandOptionChoice.ApplicationCommandOptionChoice` dicts: \
+prefix matches first, then fuzzy matches ranked by shared trigrams.
+
+https://discord.com/developers/docs/interactions/receiving-and-responding#interaction-response-object-autocomplete
+
+Usage:
+```
+index = AutocompleteIndex({"name": item.name, "value": item.id} for item in items)
+choices = index.search(focused_option["value"], locale=interaction["locale"])
+```
+"""
+
+import gzip
+import heapq
+import json
+from .application_commands.ApplicationCommandOptionChoice import (
+    ApplicationCommandOptionChoice,
+    ApplicationCommandOptionChoiceForInteger,
+    ApplicationCommandOptionChoiceForString,
+)
+from bisect import bisect_left, insort
+from collections import Counter
+from operator import itemgetter
+from os import PathLike
+from typing import Iterable
+
+
+MAX_CHOICES = 25
+"""Maximum number of choices of an autocomplete response."""
+
+FUZZY_BUDGET = 50_000
+"""Maximum number of trigram postings counted per fuzzy search."""
+
+Choice = ApplicationCommandOptionChoiceForString | ApplicationCommandOptionChoiceForInteger
+
+
+def _trigrams(text: str) -> set[str]:
+    text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AutocompleteIndex:
+    """Prefix and trigram index over choices.
+
+    Every name, including the localized names, is searchable. The choices \
+    returned are shared between searches and must not be modified.
+    """
+
+    __slots__ = ("_choices", "_by_value", "_keys", "_ids", "_trigrams", "_localized", "_size")
+
+    def __init__(self, choices: Iterable[ApplicationCommandOptionChoice] = ()) -> None:
+        self._choices: list[Choice | None] = []
+        """Choices by ID. `None` for a deleted choice."""
+        self._by_value: dict[str | int | float, int] = {}
+        """ID by value."""
+        self._keys: list[str] = []
+        """Sorted casefolded names."""
+        self._ids: list[int] = []
+        """ID of every name of `_keys`."""
+        self._trigrams: dict[str, set[int]] = {}
+        """IDs by trigram of their names."""
+        self._localized: dict[tuple[int, str], Choice] = {}
+        """Localized choice by (ID, locale)."""
+        self._size = 0
+
+        entries = []
+        for choice in choices:
+            id = self._add(choice)
+            for key in self._names(choice):
+                entries.append((key, id))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._ids = [id for _, id in entries]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._by_value
+
+    @staticmethod
+    def _names(choice: ApplicationCommandOptionChoice) -> set[str]:
+        names = {choice["name"].casefold()}
+        for name in (choice.get("name_localizations") or {}).values():
+            names.add(name.casefold())
+        return names
+
+    def _add(self, choice: ApplicationCommandOptionChoice) -> int:
+        if choice["value"] in self._by_value:
+            raise ValueError(f"Duplicate value {choice['value']!r}.")
+        id = len(self._choices)
+        stored: Choice = {"name": choice["name"], "value": choice["value"]}  # type: ignore
+        if choice.get("name_localizations"):
+            stored["name_localizations"] = dict(choice["name_localizations"])  # type: ignore
+        self._choices.append(stored)
+        self._by_value[choice["value"]] = id
+        for key in self._names(choice):
+            for trigram in _trigrams(key):
+                self._trigrams.setdefault(trigram, set()).add(id)
+        self._size += 1
+        return id
+
+    def insert(self, choice: ApplicationCommandOptionChoice) -> None:
+        """Adds a choice.
+
+        Raises:
+        - `ValueError` if a choice has the same value.
+        """
+        id = self._add(choice)
+        for key in self._names(choice):
+            position = bisect_left(self._keys, key)
+            self._keys.insert(position, key)
+            self._ids.insert(position, id)
+
+    def delete(self, value: str | int | float) -> None:
+        """Removes the choice with `value`.
+
+        Raises:
+        - `KeyError` if no choice has `value`.
+        """
+        id = self._by_value.pop(value)
+        choice = self._choices[id]
+        self._choices[id] = None
+        self._size -= 1
+        for key in self._names(choice):  # type: ignore
+            position = bisect_left(self._keys, key)
+            while self._ids[position] != id:
+                position += 1
+            del self._keys[position]
+            del self._ids[position]
+            for trigram in _trigrams(key):
+                self._trigrams[trigram].discard(id)
+        for locale in (choice.get("name_localizations") or {}):  # type: ignore
+            self._localized.pop((id, locale), None)
+
+    def _choice(self, id: int, locale: str | None) -> Choice:
+        choice: Choice = self._choices[id]  # type: ignore
+        if locale is None:
+            return choice
+        localizations = choice.get("name_localizations")
+        if not localizations or locale not in localizations:
+            return choice
+        localized = self._localized.get((id, locale))
+        if localized is None:
+            localized = self._localized[(id, locale)] = {"name": localizations[locale], "value": choice["value"]}  # type: ignore
+        return localized
+
+    def search(self, query: str, locale: str | None = None, limit: int = MAX_CHOICES) -> list[Choice]:
+        """The best choices for what the user typed: names starting with \
+        `query` in alphabetical order, then names sharing the most trigrams \
+        with `query`.
+
+        With a `locale`, the names of the choices are localized.
+        """
+        query = query.strip().casefold()
+        found: dict[int, None] = {}
+
+        keys = self._keys
+        ids = self._ids
+        position = bisect_left(keys, query)
+        while position < len(keys) and len(found) < limit and keys[position].startswith(query):
+            found[ids[position]] = None
+            position += 1
+
+        if len(found) < limit and len(query) >= 2:
+            postings = sorted(
+                (self._trigrams[trigram] for trigram in _trigrams(query) if trigram in self._trigrams),
+                key=len,
+            )
+            scores: Counter[int] = Counter()
+            budget = FUZZY_BUDGET
+            for posting in postings:
+                if len(posting) > budget:
+                    break
+                scores.update(posting)
+                budget -= len(posting)
+            for id in found:
+                scores.pop(id, None)
+            for id, _ in heapq.nlargest(limit - len(found), scores.items(), key=itemgetter(1)):
+                found[id] = None
+
+        return [self._choice(id, locale) for id in found]
+
+    # On-disk form
+
+    def save(self, path: str | PathLike[str]) -> None:
+        """Writes the choices as gzipped JSON lines. The index is rebuilt by \
+        :meth:`load`, so only the choices are stored."""
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            for choice in self._choices:
+                if choice is not None:
+                    file.write(json.dumps(choice, ensure_ascii=False, separators=(",", ":")))
+                    file.write("\n")
+
+    @classmethod
+    def load(cls, path: str | PathLike[str]) -> "AutocompleteIndex":
+        """Reads the choices written by :meth:`save`."""
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return cls(map(json.loads, file))
\ No newline at end of file
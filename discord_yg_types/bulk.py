@@ -0,0 +1,151 @@
+"""Deduplicated bulk upserts of guild commands.
+
+Most guilds usually get the same commands. :class:`BulkUpsertPlanner` \
+groups the guilds by the digest of their commands, so every distinct set is \
+validated and encoded once, and every guild of a group is sent the same \
+immutable body.
+
+The digest is the one of :meth:`~sync.SyncPlanner.digest`: it ignores the \
+order of the commands and their defaults. Lists are memoized by identity, \
+so sharing one list between guilds hashes it once. The digest ignores \
+command IDs, but the body sends them, so commands with IDs are grouped by \
+their IDs too.
+
+Usage:
+```
+planner = BulkUpsertPlanner()
+for guild_id, commands in commands_by_guild.items():
+    planner.add(guild_id, commands)
+for group in planner.groups():
+    if group.errors:
+        ...
+    for guild_id in group.guild_ids:
+        ...  # PUT /applications/{application.id}/guilds/{guild_id}/commands with group.body
+```
+"""
+
+import hashlib
+from .application_commands.PutGuildApplicationCommand import PutGuildApplicationCommand
+from .encoding import EncodingCache
+from .enums import ApplicationCommandTypes
+from .sync import SyncPlanner
+from typing import Iterator, NamedTuple, Sequence
+from .typings import Snowflake
+from .validators import ValidationError, validate
+
+
+class UpsertGroup(NamedTuple):
+    """Guilds that get the same commands."""
+
+    digest: str
+    """Digest of the commands and of their IDs."""
+    body: bytes
+    """JSON body of the bulk overwrite, shared by every guild of the group."""
+    guild_ids: tuple[Snowflake, ...]
+    """IDs of the guilds, in the order they were added."""
+    errors: tuple[ValidationError, ...]
+    """Validation errors of the commands. Paths start with the index of the \
+    command, like `[2].options[0].name`."""
+
+
+def _with_ids(digest: str, commands: Sequence[PutGuildApplicationCommand]) -> str:
+    """`digest`, extended with the IDs of the commands if any."""
+    ids = sorted(f"{int(command.get('type') or ApplicationCommandTypes.CHAT_INPUT)}:{command['name']}:{command['id']}" for command in commands if "id" in command)
+    if not ids:
+        return digest
+    return hashlib.sha256("\n".join([digest, *ids]).encode()).hexdigest()
+
+
+class _Group:
+    __slots__ = ("commands", "body", "errors", "guild_ids")
+
+    def __init__(self, commands: Sequence[PutGuildApplicationCommand], body: bytes, errors: tuple[ValidationError, ...]) -> None:
+        self.commands = commands
+        """The commands of the first guild of the group."""
+        self.body = body
+        self.errors = errors
+        self.guild_ids: dict[Snowflake, None] = {}
+        """IDs of the guilds, as keys so that removing one is O(1)."""
+
+
+class BulkUpsertPlanner:
+    """Groups guilds by the content of their commands, and validates and \
+    encodes every distinct set of commands once."""
+
+    __slots__ = ("_planner", "_encoder", "_groups", "_digests")
+
+    def __init__(self) -> None:
+        self._planner = SyncPlanner()
+        """Memoizes the digests by identity of the lists."""
+        self._encoder = EncodingCache()
+        """Reuses the encodings of the commands shared between sets."""
+        self._groups: dict[str, _Group] = {}
+        """Group by digest, in order of creation."""
+        self._digests: dict[Snowflake, str] = {}
+        """Digest of the commands by guild ID."""
+
+    def add(self, guild_id: Snowflake, commands: Sequence[PutGuildApplicationCommand]) -> str:
+        """Adds or replaces the commands of a guild, and returns the digest \
+        of its group.
+
+        Raises:
+        - `ValueError` if `commands` has two commands with the same type and \
+        name.
+        """
+        digest = _with_ids(self._planner.digest(commands), commands)
+        previous = self._digests.get(guild_id)
+        if previous is not None:
+            if previous == digest:
+                return digest
+            self._remove(guild_id, previous)
+
+        group = self._groups.get(digest)
+        if group is None:
+            errors = []
+            for index, command in enumerate(commands):
+                for error in validate(command, PutGuildApplicationCommand):
+                    path = f"[{index}]"
+                    errors.append(ValidationError(f"{path}.{error.path}" if error.path else path, error.message))
+            encode = self._encoder.encode
+            body = b"[" + b",".join([encode(command, PutGuildApplicationCommand) for command in commands]) + b"]"
+            group = self._groups[digest] = _Group(commands, body, tuple(errors))
+        group.guild_ids[guild_id] = None
+        self._digests[guild_id] = digest
+        return digest
+
+    def _remove(self, guild_id: Snowflake, digest: str) -> None:
+        group = self._groups[digest]
+        del group.guild_ids[guild_id]
+        if not group.guild_ids:
+            del self._groups[digest]
+            self._planner.forget(group.commands)
+
+    def remove(self, guild_id: Snowflake) -> None:
+        """Removes a guild, like after its upsert succeeded."""
+        digest = self._digests.pop(guild_id, None)
+        if digest is not None:
+            self._remove(guild_id, digest)
+
+    def _group(self, digest: str) -> UpsertGroup:
+        group = self._groups[digest]
+        return UpsertGroup(digest, group.body, tuple(group.guild_ids), group.errors)
+
+    def group(self, guild_id: Snowflake) -> UpsertGroup | None:
+        """The group of a guild, `None` if the guild was not added."""
+        digest = self._digests.get(guild_id)
+        return None if digest is None else self._group(digest)
+
+    def groups(self) -> Iterator[UpsertGroup]:
+        """Every group, in order of creation."""
+        for digest in list(self._groups):
+            yield self._group(digest)
+
+    def clear(self) -> None:
+        self._planner = SyncPlanner()
+        self._encoder.clear()
+        self._groups.clear()
+        self._digests.clear()
+
+    def __len__(self) -> int:
+        """Number of distinct sets of commands."""
+        return len(self._groups)
\ No newline at end of file
@@ -0,0 +1,161 @@
+"""Sets of :class:`~enums.ChannelTypes` as bitmasks.
+
+`channel_types` restricts a CHANNEL option to some types of channels, as a \
+list. :class:`ChannelTypeMask` packs the list into an `int` with the bit \
+`1 << type` set for every type, so a membership test is a shift and an \
+`and`, and :meth:`ChannelTypeMask.isin` tests a NumPy array of channel \
+types at once. NumPy is only needed for :meth:`ChannelTypeMask.isin`.
+
+https://discord.com/developers/docs/resources/channel#channel-object-channel-types
+
+Usage:
+```
+mask = ChannelTypeMask.for_option(option)
+if channel["type"] in mask:
+    ...
+allowed = mask.select(guild_channels)
+option["channel_types"] = (ChannelTypeMask.TEXT | ChannelTypeMask.THREAD).to_list()
+```
+"""
+
+from .enums import ChannelTypes
+from typing import Any, ClassVar, Iterable, Iterator, Mapping, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+def _numpy() -> Any:
+    """NumPy, imported on first use so that importing the module stays cheap."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for ChannelTypeMask.isin.") from None
+    return numpy
+
+
+_MEMBERS: tuple[ChannelTypes | None, ...] = tuple(ChannelTypes._value2member_map_.get(bit) for bit in range(max(ChannelTypes) + 1))  # type: ignore
+"""Member by value."""
+
+
+class ChannelTypeMask(int):
+    """A set of channel types, as an `int` with the bit `1 << type` set for \
+    every type.
+
+    It compares and hashes like an `int`. `|`, `&`, `^`, `-` and `~` give \
+    masks, and iterating gives the :class:`~enums.ChannelTypes`, in \
+    increasing order.
+    """
+
+    __slots__ = ()
+
+    ALL: ClassVar["ChannelTypeMask"]
+    """Every channel type. Also the types allowed by an option without \
+    `channel_types`."""
+    TEXT: ClassVar["ChannelTypeMask"]
+    """Channels holding messages directly: GUILD_TEXT, DM, GROUP_DM and \
+    GUILD_ANNOUNCEMENT."""
+    VOICE: ClassVar["ChannelTypeMask"]
+    """GUILD_VOICE and GUILD_STAGE_VOICE."""
+    THREAD: ClassVar["ChannelTypeMask"]
+    """ANNOUNCEMENT_THREAD, PUBLIC_THREAD and PRIVATE_THREAD."""
+    FORUM: ClassVar["ChannelTypeMask"]
+    """Channels holding threads only: GUILD_FORUM and GUILD_MEDIA."""
+
+    @classmethod
+    def from_list(cls, channel_types: Iterable[ChannelTypes | int]) -> "ChannelTypeMask":
+        """Packs a list of channel types, like `channel_types`.
+
+        Raises:
+        - `ValueError` if a channel type is negative.
+        """
+        mask = 0
+        for channel_type in channel_types:
+            if channel_type < 0:
+                raise ValueError(f"Invalid channel type {channel_type!r}.")
+            mask |= 1 << channel_type
+        return cls(mask)
+
+    @classmethod
+    def for_option(cls, option: Mapping[str, Any]) -> "ChannelTypeMask":
+        """The channel types allowed by a CHANNEL option. Every type if it \
+        has no `channel_types`."""
+        channel_types = option.get("channel_types")
+        return cls.from_list(channel_types) if channel_types else cls.ALL
+
+    def to_list(self) -> list[ChannelTypes]:
+        """The channel types, in increasing order, like `channel_types`. \
+        Types unknown to :class:`~enums.ChannelTypes` are kept as `int`s."""
+        return list(self)
+
+    def __contains__(self, channel_type: object) -> bool:
+        """Whether `channel_type` is in the mask. `False` for anything that \
+        is not a channel type, `bool` included."""
+        return isinstance(channel_type, int) and not isinstance(channel_type, bool) and channel_type >= 0 and (self >> channel_type) & 1 == 1
+
+    def __iter__(self) -> Iterator[ChannelTypes]:
+        value = int(self)
+        while value:
+            lowest = value & -value
+            bit = lowest.bit_length() - 1
+            member = _MEMBERS[bit] if bit < len(_MEMBERS) else None
+            yield member if member is not None else bit  # type: ignore
+            value ^= lowest
+
+    def __len__(self) -> int:
+        """Number of channel types."""
+        return self.bit_count()
+
+    def select(self, channels: Iterable[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+        """The channels whose `type` is in the mask, like the channels of a \
+        guild a CHANNEL option can take."""
+        mask = int(self)
+        return [channel for channel in channels if (mask >> channel["type"]) & 1]
+
+    def isin(self, channel_types: "ArrayLike") -> "NDArray[Any]":
+        """Mask of the channel types of an array that are in the mask, in \
+        one vectorized pass.
+
+        Raises:
+        - `ValueError` if a channel type is negative.
+        """
+        numpy = _numpy()
+        channel_types = numpy.asarray(channel_types, dtype=numpy.int64)
+        if channel_types.min(initial=0) < 0:
+            raise ValueError("Channel types must not be negative.")
+        # A lookup table instead of shifts, which are undefined past 63 bits
+        table = numpy.zeros(max(int(channel_types.max(initial=0)), self.bit_length()) + 1, dtype=bool)
+        table[[int(channel_type) for channel_type in self]] = True
+        return table[channel_types]
+
+    def __or__(self, other: int) -> "ChannelTypeMask":
+        return ChannelTypeMask(int(self) | other)
+
+    def __and__(self, other: int) -> "ChannelTypeMask":
+        return ChannelTypeMask(int(self) & other)
+
+    def __xor__(self, other: int) -> "ChannelTypeMask":
+        return ChannelTypeMask(int(self) ^ other)
+
+    def __sub__(self, other: int) -> "ChannelTypeMask":  # type: ignore[override]
+        """The channel types of the mask that are not in `other`."""
+        return ChannelTypeMask(int(self) & ~other)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> "ChannelTypeMask":
+        """The channel types of :attr:`ALL` not in the mask."""
+        return ChannelTypeMask(ChannelTypeMask.ALL & ~int(self))
+
+    def __repr__(self) -> str:
+        names = "|".join(getattr(channel_type, "name", str(channel_type)) for channel_type in self)
+        return f"ChannelTypeMask({names or 0})"
+
+
+ChannelTypeMask.ALL = ChannelTypeMask.from_list(ChannelTypes)
+ChannelTypeMask.TEXT = ChannelTypeMask.from_list((ChannelTypes.GUILD_TEXT, ChannelTypes.DM, ChannelTypes.GROUP_DM, ChannelTypes.GUILD_ANNOUNCEMENT))
+ChannelTypeMask.VOICE = ChannelTypeMask.from_list((ChannelTypes.GUILD_VOICE, ChannelTypes.GUILD_STAGE_VOICE))
+ChannelTypeMask.THREAD = ChannelTypeMask.from_list((ChannelTypes.ANNOUNCEMENT_THREAD, ChannelTypes.PUBLIC_THREAD, ChannelTypes.PRIVATE_THREAD))
+ChannelTypeMask.FORUM = ChannelTypeMask.from_list((ChannelTypes.GUILD_FORUM, ChannelTypes.GUILD_MEDIA))
\ No newline at end of file
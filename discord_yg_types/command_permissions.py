@@ -0,0 +1,187 @@
+"""Constant time checks of the permissions of the commands of a guild.
+
+:class:`CommandPermissionIndex` compiles every \
+:class:`~GuildApplicationCommandPermission` of a guild into sets of integer \
+IDs, so checking an invocation costs a few set lookups instead of a scan of \
+up to 100 :class:`~ApplicationCommandPermission`s. An update event \
+recompiles only the permissions of the updated command.
+
+The checks follow \
+https://discord.com/developers/docs/interactions/application-commands#permissions:
+1. The channel: the permission of the channel, else of all channels \
+(:meth:`~enums.ApplicationCommandPermissionConstant.ALL_CHANNELS`), for the \
+command, else for the application. A denied channel denies the invocation.
+2. The member: the permission of the user, else of any of their roles \
+(an allowed role wins over a denied role), else of `@everyone` \
+(:meth:`~enums.ApplicationCommandPermissionConstant.EVERYONE`), for the \
+command, else for the application.
+3. Without any permission for the member, the default, usually whether the \
+member has the `default_member_permissions` of the command.
+
+Usage:
+```
+index = CommandPermissionIndex(guild_id, application_id)
+index.set(guild_command_permissions)  # also for APPLICATION_COMMAND_PERMISSIONS_UPDATE
+index.can_invoke(command_id, user_id, role_ids, channel_id)
+```
+"""
+
+from .application_commands.GuildApplicationCommandPermission import GuildApplicationCommandPermission
+from collections.abc import Collection, Iterable
+from .enums import ApplicationCommandPermissionType
+from .typings import Snowflake
+
+
+class _Rules:
+    """The compiled permissions of a command, or of the application."""
+
+    __slots__ = (
+        "allowed_users",
+        "denied_users",
+        "allowed_roles",
+        "denied_roles",
+        "everyone",
+        "allowed_channels",
+        "denied_channels",
+        "all_channels",
+    )
+
+    def __init__(self, permissions: GuildApplicationCommandPermission, guild_id: int) -> None:
+        self.allowed_users: set[int] = set()
+        self.denied_users: set[int] = set()
+        self.allowed_roles: set[int] = set()
+        self.denied_roles: set[int] = set()
+        self.everyone: bool | None = None
+        """Permission of `@everyone`, `None` if there is none."""
+        self.allowed_channels: set[int] = set()
+        self.denied_channels: set[int] = set()
+        self.all_channels: bool | None = None
+        """Permission of all channels, `None` if there is none."""
+
+        all_channels_id = guild_id - 1
+        for entry in permissions["permissions"]:
+            target_id = int(entry["id"])
+            allowed = bool(entry["permission"])
+            entry_type = entry["type"]
+            if entry_type == ApplicationCommandPermissionType.ROLE:
+                if target_id == guild_id:
+                    self.everyone = allowed
+                else:
+                    (self.allowed_roles if allowed else self.denied_roles).add(target_id)
+            elif entry_type == ApplicationCommandPermissionType.USER:
+                (self.allowed_users if allowed else self.denied_users).add(target_id)
+            elif entry_type == ApplicationCommandPermissionType.CHANNEL:
+                if target_id == all_channels_id:
+                    self.all_channels = allowed
+                else:
+                    (self.allowed_channels if allowed else self.denied_channels).add(target_id)
+
+    def channel(self, channel_id: int) -> bool | None:
+        """Permission of a channel, `None` if there is none."""
+        if channel_id in self.allowed_channels:
+            return True
+        if channel_id in self.denied_channels:
+            return False
+        return self.all_channels
+
+    def member(self, user_id: int, role_ids: Iterable[int]) -> bool | None:
+        """Permission of a member, `None` if there is none."""
+        if user_id in self.allowed_users:
+            return True
+        if user_id in self.denied_users:
+            return False
+        if self.allowed_roles and not self.allowed_roles.isdisjoint(role_ids):
+            return True
+        if self.denied_roles and not self.denied_roles.isdisjoint(role_ids):
+            return False
+        return self.everyone
+
+
+class CommandPermissionIndex:
+    """The permissions of the commands of an application in a guild, \
+    compiled for constant time checks.
+
+    IDs are integers; snowflake strings are accepted too.
+    """
+
+    __slots__ = ("guild_id", "application_id", "_rules")
+
+    def __init__(self, guild_id: Snowflake | int, application_id: Snowflake | int) -> None:
+        self.guild_id = int(guild_id)
+        """ID of the guild. It is also the ID of `@everyone`."""
+        self.application_id = int(application_id)
+        """ID of the application. Permissions with this ID apply to all of \
+        its commands."""
+        self._rules: dict[int, _Rules] = {}
+        """Compiled permissions by command ID, or by application ID."""
+
+    def set(self, permissions: GuildApplicationCommandPermission) -> None:
+        """Adds or replaces the permissions of a command, or of the \
+        application. Use it for the entries of \
+        `GET /applications/{application.id}/guilds/{guild.id}/commands/permissions` \
+        and for `APPLICATION_COMMAND_PERMISSIONS_UPDATE` events.
+
+        Raises:
+        - `ValueError` if the permissions are for another guild or \
+        application.
+        """
+        if int(permissions["guild_id"]) != self.guild_id or int(permissions["application_id"]) != self.application_id:
+            raise ValueError(f"Permissions of command {permissions['id']} are not for this guild and application.")
+        command_id = int(permissions["id"])
+        if permissions["permissions"]:
+            self._rules[command_id] = _Rules(permissions, self.guild_id)
+        else:
+            self._rules.pop(command_id, None)
+
+    def set_all(self, permissions: Iterable[GuildApplicationCommandPermission]) -> None:
+        """Replaces the permissions of every command."""
+        self._rules.clear()
+        for entry in permissions:
+            self.set(entry)
+
+    def remove(self, command_id: Snowflake | int) -> None:
+        """Removes the permissions of a deleted command."""
+        self._rules.pop(int(command_id), None)
+
+    def clear(self) -> None:
+        self._rules.clear()
+
+    def can_invoke(
+        self,
+        command_id: Snowflake | int,
+        user_id: Snowflake | int,
+        role_ids: Collection[int],
+        channel_id: Snowflake | int,
+        default: bool = True,
+    ) -> bool:
+        """Whether a member can invoke a command in a channel.
+
+        `role_ids` are the integer IDs of the roles of the member, ideally a \
+        set. `default` is the result when no permission applies to the \
+        member, usually whether they have the `default_member_permissions` \
+        of the command.
+        """
+        command = self._rules.get(int(command_id))
+        application = self._rules.get(self.application_id)
+        if command is None and application is None:
+            return default
+        channel_id = int(channel_id)
+        user_id = int(user_id)
+
+        allowed = None if command is None else command.channel(channel_id)
+        if allowed is None and application is not None:
+            allowed = application.channel(channel_id)
+        if allowed is False:
+            return False
+
+        allowed = None if command is None else command.member(user_id, role_ids)
+        if allowed is None and application is not None:
+            allowed = application.member(user_id, role_ids)
+        return default if allowed is None else allowed
+
+    def __contains__(self, command_id: object) -> bool:
+        """Whether a command, or the application, has permissions."""
+        return int(command_id) in self._rules  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._rules)
\ No newline at end of file
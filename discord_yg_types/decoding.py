@@ -0,0 +1,202 @@
+"""Decodes raw JSON into :mod:`~discord_yg_types.structs`.
+
+The objects are built while the JSON is parsed, from the innermost \
+outwards, so the payload is walked only once. Every struct class gets a \
+generated builder that copies the present fields and converts:
+- `type` into :class:`~enums.ApplicationCommandTypes`, \
+:class:`~enums.ApplicationCommandOptionTypes` or \
+:class:`~enums.ApplicationCommandPermissionType`,
+- `channel_types` into :class:`~enums.ChannelTypes`,
+- `default_member_permissions` into :class:`~enums.Permissions`,
+- `name_localizations` and `description_localizations` into \
+:class:`~localizations.Localizations`.
+
+Enum values unknown to this version are kept as `int`. The option struct is \
+chosen by the `type` of the option, like :class:`ApplicationCommandStringOption` \
+for `ApplicationCommandOptionTypes.STRING`. Fields that the TypedDicts do \
+not define are dropped.
+
+Objects are recognized by their keys:
+- commands have a `name` and an `id` or `application_id`,
+- options have a `name` and a `type`,
+- choices have a `name` and no `type`,
+- permissions have a `permission`,
+- guild permissions have `permissions`.
+
+Any other object is kept as a dict.
+
+Usage:
+```
+commands = decode(response_body)
+commands[0].options[0].type is ApplicationCommandOptionTypes.STRING
+```
+"""
+
+import json
+from enum import IntEnum
+from .enums import ApplicationCommandOptionTypes, ApplicationCommandPermissionType, ApplicationCommandTypes, ChannelTypes
+from .localizations import Localizations
+from .permissions import parse_permissions
+from . import structs
+from .structs import Struct
+from typing import Any, Callable
+
+
+Builder = Callable[[dict[str, Any]], Struct]
+"""Builds a struct from the dict of a payload."""
+
+_builders: dict[type[Struct], Builder] = {}
+"""Generated builder by struct class."""
+
+_namespace: dict[str, Any] = {"_new": object.__new__}
+"""Globals of the generated code."""
+
+
+def _table(enum: type[IntEnum]) -> dict[int, IntEnum]:
+    """Member by value."""
+    return {member.value: member for member in enum}
+
+
+_LOCALIZATIONS_CACHE_SIZE = 4096
+_localizations_cache: dict[tuple[tuple[str, str], ...], Any] = {}
+"""Packed localizations by items of the dict, so that the many equal \
+localizations of a payload are packed once."""
+
+
+def _localizations(value: Any) -> Any:
+    """Packs localizations. Localizations with locales unknown to \
+    :class:`~enums.Locale` are kept as a dict."""
+    if value is None:
+        return None
+    items = tuple(value.items())
+    localizations = _localizations_cache.get(items)
+    if localizations is None:
+        try:
+            localizations = Localizations.from_dict(value)
+        except KeyError:
+            return value
+        if len(_localizations_cache) >= _LOCALIZATIONS_CACHE_SIZE:
+            _localizations_cache.clear()
+        _localizations_cache[items] = localizations
+    return localizations
+
+
+_namespace["_COMMAND_TYPES"] = _table(ApplicationCommandTypes)
+_namespace["_OPTION_TYPES"] = _table(ApplicationCommandOptionTypes)
+_namespace["_PERMISSION_TYPES"] = _table(ApplicationCommandPermissionType)
+_namespace["_CHANNEL_TYPES"] = _table(ChannelTypes)
+_namespace["_parse_permissions"] = parse_permissions
+_namespace["_localizations"] = _localizations
+
+_CONVERSIONS: dict[str, str] = {
+    "channel_types": "[_CHANNEL_TYPES.get(item, item) for item in value]",
+    "default_member_permissions": "None if value is None else _parse_permissions(value)",
+    "name_localizations": "_localizations(value)",
+    "description_localizations": "_localizations(value)",
+}
+"""Expression converting `value`, by field."""
+
+_TYPE_CONVERSIONS: dict[type[Struct], str] = {
+    structs.GetApplicationCommand: "_COMMAND_TYPES.get(value, value)",
+    structs.ApplicationCommandPermission: "_PERMISSION_TYPES.get(value, value)",
+}
+"""Expression converting the `type` field, by struct class. Defaults to \
+:class:`~enums.ApplicationCommandOptionTypes`."""
+
+
+def compile_builder(cls: type[Struct]) -> Builder:
+    """Generates the builder of a struct class. The builders are cached, so \
+    compiling a class twice returns the same function."""
+    builder = _builders.get(cls)
+    if builder is not None:
+        return builder
+
+    name = f"_build_{cls.__name__}"
+    _namespace[cls.__name__] = cls
+    lines = [f"def {name}(obj):", f"    self = _new({cls.__name__})"]
+    for field in cls.__fields__:
+        if field == "type":
+            conversion = _TYPE_CONVERSIONS.get(cls, "_OPTION_TYPES.get(value, value)")
+        else:
+            conversion = _CONVERSIONS.get(field)
+        lines.append(f"    if {field!r} in obj:")
+        if conversion is None:
+            lines.append(f"        self.{field} = obj[{field!r}]")
+        else:
+            lines.append(f"        value = obj[{field!r}]")
+            lines.append(f"        self.{field} = {conversion}")
+    lines.append("    return self")
+    source = "\n".join(lines)
+    exec(compile(source, f"<builder {cls.__name__}>", "exec"), _namespace)
+    builder = _builders[cls] = _namespace[name]
+    builder.__source__ = source  # type: ignore
+    return builder
+
+
+_build_command = compile_builder(structs.GetApplicationCommand)
+_build_option = compile_builder(structs.ApplicationCommandOption)
+_build_choice = compile_builder(structs.ApplicationCommandOptionChoice)
+_build_permission = compile_builder(structs.ApplicationCommandPermission)
+_build_guild_permission = compile_builder(structs.GuildApplicationCommandPermission)
+
+OPTION_STRUCTS: dict[ApplicationCommandOptionTypes, type[Struct]] = {
+    ApplicationCommandOptionTypes.SUB_COMMAND: structs.ApplicationCommandSubCommandOption,
+    ApplicationCommandOptionTypes.SUB_COMMAND_GROUP: structs.ApplicationCommandSubCommandGroupOption,
+    ApplicationCommandOptionTypes.STRING: structs.ApplicationCommandStringOption,
+    ApplicationCommandOptionTypes.INTEGER: structs.ApplicationCommandIntegerOption,
+    ApplicationCommandOptionTypes.BOOLEAN: structs.ApplicationCommandBooleanOption,
+    ApplicationCommandOptionTypes.USER: structs.ApplicationCommandUserOption,
+    ApplicationCommandOptionTypes.CHANNEL: structs.ApplicationCommandChannelOption,
+    ApplicationCommandOptionTypes.ROLE: structs.ApplicationCommandRoleOption,
+    ApplicationCommandOptionTypes.MENTIONABLE: structs.ApplicationCommandMentionableOption,
+    ApplicationCommandOptionTypes.NUMBER: structs.ApplicationCommandNumberOption,
+    ApplicationCommandOptionTypes.ATTACHMENT: structs.ApplicationCommandAttachmentOption,
+}
+"""Struct class of the options, by type. Options of other types are \
+:class:`~structs.ApplicationCommandOption`."""
+
+_option_builders: dict[int, Builder] = {int(type): compile_builder(cls) for type, cls in OPTION_STRUCTS.items()}
+"""Builder of the options, by type."""
+
+
+def object_hook(obj: dict[str, Any]) -> Any:
+    """Builds the struct of a JSON object, recognized by its keys. Can be \
+    the `object_hook` of `json.loads`."""
+    if "name" in obj:
+        if "id" in obj or "application_id" in obj:
+            return _build_command(obj)
+        option_type = obj.get("type")
+        if option_type is None:
+            return _build_choice(obj)
+        return _option_builders.get(option_type, _build_option)(obj)
+    if "permission" in obj:
+        return _build_permission(obj)
+    if "permissions" in obj:
+        return _build_guild_permission(obj)
+    return obj
+
+
+_decoder = json.JSONDecoder(object_hook=object_hook)
+
+
+def decode(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decodes a JSON payload, like the body of a response, building the \
+    structs of the commands, options, choices and permissions it contains.
+
+    Raises:
+    - `json.JSONDecodeError` if `data` is not valid JSON.
+    - `UnicodeDecodeError` if `data` is not valid UTF-8.
+    """
+    if not isinstance(data, str):
+        data = str(data, "utf-8")
+    return _decoder.decode(data)
+
+
+def to_struct(payload: Any) -> Any:
+    """Builds the structs of a payload already decoded into dicts and \
+    lists, like :func:`decode` does."""
+    if isinstance(payload, dict):
+        return object_hook({key: to_struct(value) for key, value in payload.items()})
+    if isinstance(payload, list):
+        return [to_struct(item) for item in payload]
+    return payload
\ No newline at end of file
@@ -0,0 +1,167 @@
+"""Routes application command invocations to their handlers.
+
+An invocation is the `data` of an APPLICATION_COMMAND interaction: its \
+`type`, its `name`, and its `options`, where a SUB_COMMAND_GROUP or a \
+SUB_COMMAND is the first option and holds the next level.
+
+https://discord.com/developers/docs/interactions/receiving-and-responding#interaction-object-application-command-data-structure
+
+Usage:
+```
+router = CommandRouter(commands, {
+    (ApplicationCommandTypes.CHAT_INPUT, "ping", "all", "users"): ping_all_users,
+    (ApplicationCommandTypes.USER, "Info", None, None): info,
+})
+router.dispatch(interaction["data"], interaction)
+```
+"""
+
+from .application_commands.ApplicationCommand import ApplicationCommand
+from .enums import ApplicationCommandOptionTypes, ApplicationCommandTypes
+from .application_commands.PostApplicationCommand import PostApplicationCommand
+from typing import Any, Callable, Iterable, Mapping, NamedTuple
+
+
+RouteKey = tuple[int, str, str | None, str | None]
+"""(command type, command name, subcommand group name, subcommand name)."""
+
+Handler = Callable[..., Any]
+
+
+class Route(NamedTuple):
+    """A leaf of the routing index."""
+
+    key: RouteKey
+    """Where the route is."""
+    handler: Handler
+    """Called for the invocations of the route."""
+    command: ApplicationCommand | PostApplicationCommand
+    """The command of the route."""
+    depth: int
+    """0 for a command, 1 for a subcommand, 2 for a subcommand of a group."""
+
+    def options(self, data: Mapping[str, Any]) -> list[dict[str, Any]]:
+        """The options of the invocation given to the command or the \
+        subcommand of the route."""
+        options = data.get("options") or []
+        for _ in range(self.depth):
+            options = options[0].get("options") or []
+        return options
+
+
+_Node = dict[str, "Route | _Node"]
+
+
+def _leaves(command: ApplicationCommand | PostApplicationCommand) -> Iterable[tuple[str | None, str | None]]:
+    """(group, subcommand) of every route of a command."""
+    options = command.get("options") or []
+    subcommands = False
+    for option in options:
+        if option["type"] == ApplicationCommandOptionTypes.SUB_COMMAND_GROUP:
+            subcommands = True
+            for child in option.get("options") or []:
+                yield option["name"], child["name"]
+        elif option["type"] == ApplicationCommandOptionTypes.SUB_COMMAND:
+            subcommands = True
+            yield None, option["name"]
+    if not subcommands:
+        yield None, None
+
+
+def build_index(
+    commands: Iterable[ApplicationCommand | PostApplicationCommand],
+    handlers: Mapping[RouteKey, Handler],
+) -> dict[int, _Node]:
+    """Compiles the routing index: nested dicts keyed by command type, then \
+    by name at every level, with a :class:`Route` at every leaf.
+
+    Routes without a handler are left out.
+
+    Raises:
+    - `ValueError` if two commands have the same type and name.
+    """
+    index: dict[int, _Node] = {}
+    # Commands without handlers are not in the index, but still count as duplicates
+    seen: set[tuple[int, str]] = set()
+    for command in commands:
+        command_type = int(command.get("type") or ApplicationCommandTypes.CHAT_INPUT)
+        names = index.setdefault(command_type, {})
+        if (command_type, command["name"]) in seen:
+            raise ValueError(f"Duplicate command {command['name']!r} of type {ApplicationCommandTypes(command_type).name}.")
+        seen.add((command_type, command["name"]))
+
+        node: Route | _Node | None = None
+        for group, subcommand in _leaves(command):
+            key = (command_type, command["name"], group, subcommand)
+            handler = handlers.get(key)
+            if handler is None:
+                continue
+            route = Route(key, handler, command, (group is not None) + (subcommand is not None))
+            if subcommand is None:
+                node = route
+                break
+            node = node if isinstance(node, dict) else {}
+            parent = node.setdefault(group, {}) if group is not None else node
+            parent[subcommand] = route  # type: ignore
+        if node is not None:
+            names[command["name"]] = node
+    return index
+
+
+class CommandRouter:
+    """Resolves invocations in O(depth) with nested dict lookups and no \
+    allocation.
+
+    :meth:`rebuild` replaces the index in one assignment, so invocations \
+    resolved concurrently see either the old or the new commands.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(
+        self,
+        commands: Iterable[ApplicationCommand | PostApplicationCommand] = (),
+        handlers: Mapping[RouteKey, Handler] | None = None,
+    ) -> None:
+        self._index = build_index(commands, handlers or {})
+
+    def rebuild(
+        self,
+        commands: Iterable[ApplicationCommand | PostApplicationCommand],
+        handlers: Mapping[RouteKey, Handler],
+    ) -> None:
+        """Replaces every route, for example after registering the commands \
+        again."""
+        self._index = build_index(commands, handlers)
+
+    def resolve(self, data: Mapping[str, Any]) -> Route | None:
+        """The route of an invocation, or `None` if there is none."""
+        node = self._index.get(data.get("type", 1))
+        if node is None:
+            return None
+        node = node.get(data["name"])
+        options = data.get("options")
+        while node.__class__ is dict:
+            if not options:
+                return None
+            option = options[0]
+            node = node.get(option["name"])  # type: ignore
+            options = option.get("options")
+        return node  # type: ignore
+
+    def dispatch(self, data: Mapping[str, Any], *args: Any, **kwargs: Any) -> Any:
+        """Calls the handler of an invocation with `args` and `kwargs`.
+
+        Raises:
+        - `LookupError` if no route matches the invocation.
+        """
+        route = self.resolve(data)
+        if route is None:
+            raise LookupError(f"No route for the command {data.get('name')!r}.")
+        return route.handler(*args, **kwargs)
+
+    def __len__(self) -> int:
+        """Number of routes."""
+        def count(node: Route | _Node) -> int:
+            return 1 if isinstance(node, Route) else sum(map(count, node.values()))
+        return sum(count(names) for names in self._index.values())
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""Compiled JSON encoders for the bodies sent to the API.
+
+Every TypedDict is compiled once into a function that writes the compact \
+JSON of a payload field by field, following the annotation of each field:
+- :class:`~enums.Permissions` are written as decimal strings,
+- other enums are written as integers,
+- :class:`~localizations.Localizations` are written as dicts,
+- options are written with the TypedDict of their `type`.
+
+Absent keys are skipped and keys set to `None` are written as `null`, so \
+that `total=False` bodies like :class:`~PatchApplicationCommand` reset only \
+the fields set to `None`. Keys that the TypedDict does not define are \
+dropped. Payloads can be dicts, :mod:`~discord_yg_types.structs` or \
+:mod:`~discord_yg_types.views`.
+
+:class:`EncodingCache` also reuses the encodings of the options, \
+choices and localizations that did not change. Like with \
+:class:`~fingerprints.FingerprintCache`, they are memoized by identity, so \
+they must not be modified in place; use :func:`~fingerprints.replace`.
+
+Usage:
+```
+body = encode(command, PostApplicationCommand)
+cache = EncodingCache()
+body = cache.encode(command, PutGuildApplicationCommand)
+```
+"""
+
+from .application_commands.ApplicationCommandOption import ApplicationCommandOption
+from enum import IntEnum, IntFlag
+from functools import lru_cache
+from itertools import islice
+from json import JSONEncoder
+from json.encoder import encode_basestring
+from .localizations import Localizations
+from math import isfinite
+from .options import OPTION_CLASSES
+from types import NoneType, UnionType
+from typing import Annotated, Any, Callable, Literal, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+
+Encoder = Callable[[Any, "dict[int, tuple[Any, str]] | None"], str]
+"""A compiled encoder. Takes the payload and the memo of the encodings of \
+the sub-objects, or `None`."""
+
+_encoders: dict[type, Encoder] = {}
+"""Compiled encoder by TypedDict class."""
+
+_namespace: dict[str, Any] = {}
+"""Globals of the generated code."""
+
+
+def _number(value: int | float) -> str:
+    """Encodes a number. NaN and the infinities are rejected, like \
+    `json.dumps(allow_nan=False)` does, as they are not valid JSON."""
+    if type(value) is float:
+        if not isfinite(value):
+            raise ValueError(f"Out of range float values are not JSON compliant: {value!r}")
+        return float.__repr__(value)
+    return int.__repr__(value)
+
+
+def _permissions(value: int | str) -> str:
+    """Encodes permissions as a decimal string. Strings are kept."""
+    return encode_basestring(value) if type(value) is str else '"' + int.__repr__(value) + '"'
+
+
+def _scalar(value: Any) -> str:
+    """Encodes a string, a boolean, a number or `None`."""
+    if type(value) is str:
+        return encode_basestring(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    return _number(value)
+
+
+def _mapping(value: Any, memo: "dict[int, tuple[Any, str]] | None") -> str:
+    """Encodes a dict of strings, like localizations, reusing its encoding \
+    from `memo`."""
+    if type(value) is Localizations:
+        return _encode_localizations(value)
+    if memo is not None:
+        entry = memo.get(id(value))
+        if entry is not None and entry[0] is value:
+            return entry[1]
+    encoding = "{" + ",".join([encode_basestring(key) + ":" + encode_basestring(string) for key, string in value.items()]) + "}"
+    if memo is not None:
+        memo[id(value)] = (value, encoding)
+    return encoding
+
+
+@lru_cache(maxsize=4096)
+def _encode_localizations(localizations: Localizations) -> str:
+    """Encodes shared :class:`~localizations.Localizations` once."""
+    return "{" + ",".join([encode_basestring(key) + ":" + encode_basestring(string) for key, string in localizations.items()]) + "}"
+
+
+def _cached(encoder: Encoder, value: Any, memo: "dict[int, tuple[Any, str]] | None") -> str:
+    """Encodes a sub-object, reusing its encoding from `memo`."""
+    if memo is None:
+        return encoder(value, None)
+    entry = memo.get(id(value))
+    if entry is not None and entry[0] is value:
+        return entry[1]
+    encoding = encoder(value, memo)
+    memo[id(value)] = (value, encoding)
+    return encoding
+
+
+def _encode_option(option: Any, memo: "dict[int, tuple[Any, str]] | None") -> str:
+    """Encodes an option with the encoder of its type."""
+    return _option_encoders.get(option["type"], _generic_option_encoder)(option, memo)
+
+
+_dumps = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+_namespace.update({
+    "_MISSING": object(),
+    "_string": encode_basestring,
+    "_int": int.__repr__,
+    "_number": _number,
+    "_permissions": _permissions,
+    "_scalar": _scalar,
+    "_mapping": _mapping,
+    "_cached": _cached,
+    "_encode_option": _encode_option,
+    "_dumps": _dumps,
+})
+
+
+def _function_name(cls: type) -> str:
+    return f"_encode_{cls.__name__}_{id(cls):x}"
+
+
+def _expression(annotation: Any, value: str, dependencies: list[type]) -> str:
+    """Expression encoding `value`, following `annotation`."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        arguments = [argument for argument in get_args(annotation) if argument is not NoneType]
+        if len(arguments) == 1:
+            expression = _expression(arguments[0], value, dependencies)
+        else:
+            expression = f"_scalar({value})" if all(
+                (get_args(argument)[0] if get_origin(argument) is Annotated else argument) in (str, int, float, bool)
+                for argument in arguments
+            ) else f"_dumps({value})"
+        if len(arguments) < len(get_args(annotation)):
+            return f'("null" if {value} is None else {expression})'
+        return expression
+    if origin is Literal:
+        literal = get_args(annotation)[0]
+        return _expression(type(literal), value, dependencies)
+    if origin is dict:
+        return f"_mapping({value}, memo)"
+    if origin is list:
+        item = get_args(annotation)[0]
+        if get_origin(item) is Annotated:
+            item = get_args(item)[0]
+        if is_typeddict(item):
+            if item is ApplicationCommandOption or item in OPTION_CLASSES.values():
+                encoder = "_encode_option"
+            else:
+                dependencies.append(item)
+                encoder = _function_name(item)
+            return f'"[" + ",".join([_cached({encoder}, item, memo) for item in {value}]) + "]"'
+        return f'"[" + ",".join([{_expression(item, "item", dependencies)} for item in {value}]) + "]"'
+
+    if annotation is bool:
+        return f'("true" if {value} else "false")'
+    if isinstance(annotation, type):
+        if issubclass(annotation, IntFlag):
+            return f"_permissions({value})"
+        if issubclass(annotation, IntEnum):
+            return f"_int({value})"
+        if issubclass(annotation, (int, float)):
+            return f"_number({value})"
+        if issubclass(annotation, str):
+            return f"_string({value})"
+    return f"_dumps({value})"
+
+
+def compile_encoder(cls: type) -> Encoder:
+    """Compiles the encoder of a TypedDict class and of the TypedDicts it \
+    contains. The encoders are cached, so compiling a class twice returns the \
+    same function.
+
+    Raises:
+    - `TypeError` if `cls` is not a TypedDict.
+    """
+    encoder = _encoders.get(cls)
+    if encoder is not None:
+        return encoder
+    if not is_typeddict(cls):
+        raise TypeError(f"{cls!r} is not a TypedDict.")
+
+    dependencies: list[type] = []
+    name = _function_name(cls)
+    lines = [f"def {name}(obj, memo):", "    parts = []", "    get = obj.get"]
+    for key, annotation in get_type_hints(cls, include_extras=True).items():
+        lines.append(f"    value = get({key!r}, _MISSING)")
+        lines.append("    if value is not _MISSING:")
+        lines.append(f"        parts.append({encode_basestring(key) + ':'!r} + {_expression(annotation, 'value', dependencies)})")
+    lines.append('    return "{" + ",".join(parts) + "}"')
+    source = "\n".join(lines)
+    exec(compile(source, f"<encoder {cls.__name__}>", "exec"), _namespace)
+    encoder = _encoders[cls] = _namespace[name]
+    encoder.__source__ = source  # type: ignore
+    for dependency in dependencies:
+        compile_encoder(dependency)
+    return encoder
+
+
+_option_encoders: dict[int, Encoder] = {int(option_type): compile_encoder(cls) for option_type, cls in OPTION_CLASSES.items()}
+"""Encoder of the options, by type."""
+_generic_option_encoder = compile_encoder(ApplicationCommandOption)
+"""Encoder of the options of unknown types."""
+
+
+def encode(payload: Any, cls: type) -> bytes:
+    """The compact JSON of `payload`, encoded as the TypedDict `cls`.
+
+    Raises:
+    - `ValueError` if a float is NaN or infinite.
+    """
+    return compile_encoder(cls)(payload, None).encode()
+
+
+class EncodingCache:
+    """Encodes payloads, reusing the encodings of the options, choices and \
+    localizations that did not change.
+
+    The memo holds about `maxsize` sub-objects. Once full, the oldest \
+    quarter is dropped.
+    """
+
+    __slots__ = ("maxsize", "_memo")
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.maxsize = maxsize
+        """Maximum number of memoized sub-objects."""
+        self._memo: dict[int, tuple[Any, str]] = {}
+        """(sub-object, encoding) by `id()` of the sub-object. The \
+        sub-object is kept so that its `id()` is not reused."""
+
+    def encode(self, payload: Any, cls: type) -> bytes:
+        """Like :func:`encode`."""
+        memo = self._memo
+        encoding = compile_encoder(cls)(payload, memo)
+        if len(memo) > self.maxsize:
+            for key in list(islice(memo, len(memo) - self.maxsize + self.maxsize // 4)):
+                del memo[key]
+        return encoding.encode()
+
+    def clear(self) -> None:
+        self._memo.clear()
\ No newline at end of file
@@ -1,5 +1,11 @@
+from __future__ import annotations
+
 from enum import auto, Enum, IntEnum, IntFlag, unique
-from typings import Snowflake
+
+# `typing` is not imported so that the enums are cheap to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .typings import Snowflake
 
 
 @unique
@@ -271,4 +277,111 @@ class ApplicationCommandOptionTypes(IntEnum):
     - /upload file:`cute_cat.png`
 
     The `file` is an ATTACHMENT option type.
-    """
\ No newline at end of file
+    """
+
+
+@unique
+class Locale(IntEnum):
+    """Locales of Discord. The value is a stable index, from 0 to 24, and \
+    :attr:`code` is the string used by the API.
+    
+    https://discord.com/developers/docs/reference#locales
+    """
+
+    ID = 0
+    """Indonesian. `id`."""
+    DA = 1
+    """Danish. `da`."""
+    DE = 2
+    """German. `de`."""
+    EN_GB = 3
+    """English, UK. `en-GB`."""
+    EN_US = 4
+    """English, US. `en-US`."""
+    ES_ES = 5
+    """Spanish. `es-ES`."""
+    FR = 6
+    """French. `fr`."""
+    HR = 7
+    """Croatian. `hr`."""
+    IT = 8
+    """Italian. `it`."""
+    LT = 9
+    """Lithuanian. `lt`."""
+    HU = 10
+    """Hungarian. `hu`."""
+    NL = 11
+    """Dutch. `nl`."""
+    NO = 12
+    """Norwegian. `no`."""
+    PT_BR = 13
+    """Portuguese, Brazilian. `pt-BR`."""
+    RO = 14
+    """Romanian, Romania. `ro`."""
+    FI = 15
+    """Finnish. `fi`."""
+    SV_SE = 16
+    """Swedish. `sv-SE`."""
+    VI = 17
+    """Vietnamese. `vi`."""
+    TR = 18
+    """Turkish. `tr`."""
+    CS = 19
+    """Czech. `cs`."""
+    EL = 20
+    """Greek. `el`."""
+    BG = 21
+    """Bulgarian. `bg`."""
+    RU = 22
+    """Russian. `ru`."""
+    UK = 23
+    """Ukrainian. `uk`."""
+    KO = 24
+    """Korean. `ko`."""
+
+    @property
+    def code(self) -> str:
+        """The locale as used by the API, like `en-US`."""
+        return _LOCALE_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: str) -> "Locale":
+        """The locale of a code used by the API, like `en-US`.
+        
+        Raises:
+        - `KeyError` if the locale is unknown.
+        """
+        return _LOCALES_BY_CODE[code]
+
+
+_LOCALE_CODES: tuple[str, ...] = (
+    "id",
+    "da",
+    "de",
+    "en-GB",
+    "en-US",
+    "es-ES",
+    "fr",
+    "hr",
+    "it",
+    "lt",
+    "hu",
+    "nl",
+    "no",
+    "pt-BR",
+    "ro",
+    "fi",
+    "sv-SE",
+    "vi",
+    "tr",
+    "cs",
+    "el",
+    "bg",
+    "ru",
+    "uk",
+    "ko",
+)
+"""Code by :class:`Locale` value."""
+
+_LOCALES_BY_CODE: dict[str, Locale] = {code: Locale(index) for index, code in enumerate(_LOCALE_CODES)}
+"""Locale by code."""
\ No newline at end of file
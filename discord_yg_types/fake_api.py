@@ -0,0 +1,479 @@
+"""An in-process stand-in for the application command endpoints of the \
+API, for load tests of syncing and registration.
+
+:class:`FakeAPI` is a :class:`~transport.Transport`: it answers requests \
+from memory, without a socket or a sleep, so that it is never the \
+bottleneck of a load test. It follows the documented behavior of the \
+endpoints:
+- request bodies are validated against the TypedDicts, with the \
+:mod:`restrictions` like the maximum of 25 options or choices, and errors \
+are answered with a 400 shaped like the API's `Invalid Form Body`,
+- commands get Snowflake IDs and a `version` that changes when the command \
+changes, a PATCH cannot change the type of a command, and a bulk overwrite \
+cannot hold two commands with the same type and name,
+- a scope holds at most 100 CHAT_INPUT, 5 USER and 5 MESSAGE commands, and \
+a command at most 100 permissions,
+- every bucket allows `rate_limit` requests per `per` seconds, with the \
+`X-RateLimit-*` headers, and answers a 429 with `retry_after` once it is \
+exhausted.
+
+Supported endpoints, global and guild:
+- `GET`, `POST` and `PUT` (bulk overwrite) of `.../commands`,
+- `GET`, `PATCH` and `DELETE` of `.../commands/{command.id}`,
+- `GET .../guilds/{guild.id}/commands/permissions`,
+- `GET` and `PUT` of `.../guilds/{guild.id}/commands/{command.id}/permissions`.
+
+Usage:
+```
+api = FakeAPI(rate_limit=50)
+scheduler = RegistrationScheduler(api)
+report = await scheduler.run(bulk_overwrite_jobs(application_id, planner.groups()))
+api.commands(application_id, guild_id)
+```
+"""
+
+import json
+import time
+from .application_commands.ApplicationCommand import ApplicationCommand
+from .application_commands.ApplicationCommandPermission import ApplicationCommandPermission
+from .application_commands.PatchApplicationCommand import PatchApplicationCommand
+from .application_commands.PostApplicationCommand import PostApplicationCommand
+from .application_commands.PutGuildApplicationCommand import PutGuildApplicationCommand
+from collections.abc import Mapping
+from .encoding import EncodingCache
+from .enums import ApplicationCommandTypes
+from hashlib import blake2b
+from .permissions import parse_permissions
+from .snowflakes import DISCORD_EPOCH, TIMESTAMP_SHIFT
+from .sync import normalize_command
+from .transport import Response
+from typing import Any, Callable
+from .typings import Snowflake
+from .validators import ValidationError, validate
+
+
+MAX_COMMANDS = {
+    ApplicationCommandTypes.CHAT_INPUT: 100,
+    ApplicationCommandTypes.USER: 5,
+    ApplicationCommandTypes.MESSAGE: 5,
+}
+"""Maximum number of commands of each type in a scope, global or guild."""
+
+MAX_PERMISSIONS = 100
+"""Maximum number of permissions of a command in a guild."""
+
+_JSON = {"content-type": "application/json"}
+
+_MAX_BODIES = 1024
+"""Maximum number of request bodies kept parsed and validated."""
+
+_Scope = tuple[Snowflake, Snowflake | None]
+"""(application ID, guild ID or `None` for global commands)."""
+
+
+class _Error(Exception):
+    """Ends the handling of a request with an error response."""
+
+    def __init__(self, status: int, code: int, message: str, errors: dict[str, Any] | None = None) -> None:
+        body: dict[str, Any] = {"message": message, "code": code}
+        if errors:
+            body["errors"] = errors
+        self.status = status
+        self.body = body
+
+
+def _form_errors(errors: list[ValidationError], prefix: str = "") -> dict[str, Any]:
+    """Nests validation errors by path, like the `errors` of the API: \
+    `options[0].name` becomes `{"options": {"0": {"name": {"_errors": [...]}}}}`."""
+    tree: dict[str, Any] = {}
+    for error in errors:
+        node = tree
+        path = prefix + error.path
+        for part in path.replace("[", ".").replace("]", "").split(".") if path else ():
+            node = node.setdefault(part, {})
+        node.setdefault("_errors", []).append({"code": "BASE_TYPE_INVALID", "message": error.message})
+    return tree
+
+
+def _typed(command: dict[str, Any]) -> dict[str, Any]:
+    """`command` with `default_member_permissions` parsed into \
+    :class:`~enums.Permissions`, as the TypedDicts describe it, for the \
+    validators."""
+    permissions = command.get("default_member_permissions")
+    if isinstance(permissions, str):
+        try:
+            return dict(command, default_member_permissions=parse_permissions(permissions))
+        except ValueError:
+            pass
+    return command
+
+
+class FakeAPI:
+    """In-memory application command endpoints, behind the \
+    :class:`~transport.Transport` interface."""
+
+    __slots__ = ("rate_limit", "per", "validate", "clock", "requests", "_commands", "_permissions", "_buckets", "_last_snowflake", "_bodies", "_valid", "_encoder")
+
+    def __init__(
+        self,
+        rate_limit: int | None = 50,
+        per: float = 1.0,
+        validate: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate_limit = rate_limit
+        """Requests allowed per bucket in `per` seconds. `None` to never \
+        answer a 429."""
+        self.per = per
+        """Length of a rate limit window in seconds."""
+        self.validate = validate
+        """Whether request bodies are validated. Disable it to measure \
+        the client alone."""
+        self.clock = clock
+        """Time in seconds of the rate limit windows."""
+        self.requests = 0
+        """Number of requests answered."""
+        self._commands: dict[_Scope, dict[Snowflake, dict[str, Any]]] = {}
+        """Commands of every scope, by ID, in creation order."""
+        self._permissions: dict[tuple[Snowflake, Snowflake], dict[Snowflake, list[ApplicationCommandPermission]]] = {}
+        """Permissions by (application ID, guild ID), by command ID."""
+        self._buckets: dict[tuple[str, str], list[float]] = {}
+        """[window end, remaining] by (bucket hash, major parameter)."""
+        self._last_snowflake = 0
+        self._bodies: dict[bytes, Any] = {}
+        """Parsed request bodies by bytes. A load test sends the same body \
+        to many guilds, so it is parsed once."""
+        self._valid: dict[tuple[int, type], Any] = {}
+        """Payloads already validated, by (`id()`, TypedDict). The payload \
+        is kept alive so that its `id()` is not reused."""
+        self._encoder = EncodingCache()
+        """Encodes the commands of the responses. The options come from \
+        the parsed bodies, so guilds sent the same body share their \
+        encodings."""
+
+    def commands(self, application_id: Snowflake, guild_id: Snowflake | None = None) -> list[dict[str, Any]]:
+        """Commands of a scope, like `GET .../commands` returns them."""
+        return list(self._commands.get((application_id, guild_id), {}).values())
+
+    def permissions(self, application_id: Snowflake, guild_id: Snowflake) -> dict[Snowflake, list[ApplicationCommandPermission]]:
+        """Permissions of the commands of a guild, by command ID."""
+        return dict(self._permissions.get((application_id, guild_id), {}))
+
+    def reset(self) -> None:
+        """Forgets every command, permission and rate limit."""
+        self._commands.clear()
+        self._permissions.clear()
+        self._buckets.clear()
+        self._bodies.clear()
+        self._valid.clear()
+        self._encoder.clear()
+        self.requests = 0
+
+    async def request(self, method: str, path: str, body: bytes | None = None, headers: Mapping[str, str] | None = None) -> Response:
+        return self.handle(method, path, body)
+
+    async def close(self) -> None:
+        pass
+
+    def handle(self, method: str, path: str, body: bytes | None = None) -> Response:
+        """Answers a request synchronously."""
+        self.requests += 1
+        path = path.partition("?")[0]
+        parts = path.strip("/").split("/")
+        # applications/{application.id}[/guilds/{guild.id}]/commands[/{command.id}][/permissions]
+        if len(parts) < 3 or parts[0] != "applications":
+            return _response(404, {"message": "404: Not Found", "code": 0})
+        application_id = parts[1]
+        guild_id = None
+        rest = parts[2:]
+        if rest[0] == "guilds" and len(rest) >= 3:
+            guild_id = rest[1]
+            rest = rest[2:]
+        if rest[0] != "commands" or len(rest) > 3 or (len(rest) == 3 and rest[2] != "permissions"):
+            return _response(404, {"message": "404: Not Found", "code": 0})
+
+        if len(rest) == 1:
+            endpoint = "/commands"
+        elif rest[1] == "permissions" and len(rest) == 2:
+            endpoint = "/commands/permissions"
+        elif len(rest) == 2:
+            endpoint = "/commands/{command.id}"
+        else:
+            endpoint = "/commands/{command.id}/permissions"
+        if guild_id is None:
+            route = "/applications/{application.id}" + endpoint
+        else:
+            route = "/applications/{application.id}/guilds/{guild.id}" + endpoint
+
+        headers = self._rate_limit(f"{method} {route}", guild_id or application_id)
+        if headers is not None and "retry-after" in headers:
+            return _response(429, {"message": "You are being rate limited.", "retry_after": float(headers["retry-after"]), "global": False}, headers)
+
+        handler = _ROUTES.get((method, endpoint))
+        if handler is None or (endpoint.endswith("permissions") and guild_id is None):
+            return _response(405, {"message": "405: Method Not Allowed", "code": 0}, headers)
+        try:
+            payload = self._parse(body) if body else None
+            status, result = handler(self, application_id, guild_id, rest[1] if len(rest) > 1 else None, payload)
+        except _Error as error:
+            return _response(error.status, error.body, headers)
+        except ValueError:
+            return _response(400, {"message": "400: Bad Request", "code": 50109}, headers)
+        return _response(status, result, headers)
+
+    def _rate_limit(self, route: str, major: str) -> dict[str, str] | None:
+        """The rate limit headers of a request, with `x-ratelimit-scope` and \
+        `retry-after` if the bucket is exhausted. `None` without rate \
+        limits."""
+        if self.rate_limit is None:
+            return None
+        bucket_hash = _bucket_hash(route)
+        key = (bucket_hash, major)
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket[0] <= now:
+            bucket = self._buckets[key] = [now + self.per, self.rate_limit]
+        reset_after = bucket[0] - now
+        headers = {
+            "content-type": "application/json",
+            "x-ratelimit-bucket": bucket_hash,
+            "x-ratelimit-limit": str(self.rate_limit),
+            "x-ratelimit-reset-after": f"{reset_after:.3f}",
+        }
+        if bucket[1] <= 0:
+            headers["x-ratelimit-remaining"] = "0"
+            headers["x-ratelimit-scope"] = "user"
+            headers["retry-after"] = f"{reset_after:.3f}"
+            return headers
+        bucket[1] -= 1
+        headers["x-ratelimit-remaining"] = str(int(bucket[1]))
+        return headers
+
+    def _snowflake(self) -> Snowflake:
+        """A new Snowflake, unique in this API and increasing."""
+        value = max((int(time.time() * 1000) - DISCORD_EPOCH) << TIMESTAMP_SHIFT, self._last_snowflake + 1)
+        self._last_snowflake = value
+        return str(value)
+
+    def _scope(self, application_id: Snowflake, guild_id: Snowflake | None) -> dict[Snowflake, dict[str, Any]]:
+        scope = self._commands.get((application_id, guild_id))
+        if scope is None:
+            scope = self._commands[(application_id, guild_id)] = {}
+        return scope
+
+    def _command(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: Snowflake | None) -> dict[str, Any]:
+        command = self._commands.get((application_id, guild_id), {}).get(command_id)  # type: ignore
+        if command is None:
+            raise _Error(404, 10063, "Unknown application command")
+        return command
+
+    def _parse(self, body: bytes) -> Any:
+        payload = self._bodies.get(body)
+        if payload is None:
+            payload = json.loads(body)
+            if len(self._bodies) >= _MAX_BODIES:
+                del self._bodies[next(iter(self._bodies))]
+            self._bodies[body] = payload
+        return payload
+
+    def _validate(self, payload: Any, cls: type, prefix: str = "", memoize: bool = True) -> None:
+        if not self.validate or (id(payload), cls) in self._valid:
+            return
+        if not isinstance(payload, dict):
+            raise _Error(400, 50035, "Invalid Form Body", {"_errors": [{"code": "DICT_TYPE_CONVERT", "message": "Only dictionaries may be used in a DictType"}]})
+        errors = validate(_typed(payload), cls)
+        if errors:
+            raise _Error(400, 50035, "Invalid Form Body", _form_errors(errors, prefix))
+        if memoize:
+            if len(self._valid) >= _MAX_BODIES:
+                del self._valid[next(iter(self._valid))]
+            self._valid[(id(payload), cls)] = payload
+
+    def _build(self, application_id: Snowflake, guild_id: Snowflake | None, payload: dict[str, Any], current: dict[str, Any] | None) -> dict[str, Any]:
+        """The command stored for `payload`. Keeps the ID of `current`, and \
+        its version if nothing changed."""
+        command: dict[str, Any] = {
+            "id": current["id"] if current is not None else self._snowflake(),
+            "application_id": application_id,
+            "version": "",
+            "type": int(payload.get("type") or ApplicationCommandTypes.CHAT_INPUT),
+            "name": payload["name"],
+            "description": payload.get("description") or "",
+            "default_member_permissions": payload.get("default_member_permissions"),
+        }
+        if guild_id is not None:
+            command["guild_id"] = guild_id
+        for key in ("name_localizations", "description_localizations"):
+            if payload.get(key) is not None:
+                command[key] = payload[key]
+        if payload.get("options"):
+            command["options"] = payload["options"]
+        if current is not None:
+            command["version"] = current["version"]
+            # Resent commands are usually equal dicts, which is faster to check than normalizing
+            if command == current or normalize_command(current) == normalize_command(command):  # type: ignore
+                return command
+        command["version"] = self._snowflake()
+        return command
+
+    def _encode(self, commands: dict[str, Any] | list[dict[str, Any]]) -> bytes:
+        """The JSON of a command or a list of commands, as \
+        :class:`~ApplicationCommand`s."""
+        if isinstance(commands, dict):
+            return self._encoder.encode(commands, ApplicationCommand)
+        return b"[" + b",".join([self._encoder.encode(command, ApplicationCommand) for command in commands]) + b"]"
+
+    def _check_limits(self, commands: Mapping[Any, dict[str, Any]]) -> None:
+        counts: dict[int, int] = {}
+        for command in commands.values():
+            counts[command["type"]] = counts.get(command["type"], 0) + 1
+        for command_type, count in counts.items():
+            maximum = MAX_COMMANDS.get(command_type)  # type: ignore
+            if maximum is not None and count > maximum:
+                raise _Error(400, 30032, f"Maximum number of application commands reached ({maximum})")
+
+    # Handlers, by method and route. They return the status and the body, as JSON bytes or to encode.
+
+    def _get_commands(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: None, payload: Any) -> tuple[int, Any]:
+        return 200, self._encode(self.commands(application_id, guild_id))
+
+    def _create_command(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: None, payload: Any) -> tuple[int, Any]:
+        self._validate(payload, PostApplicationCommand)
+        scope = self._scope(application_id, guild_id)
+        command_type = int(payload.get("type") or ApplicationCommandTypes.CHAT_INPUT)
+        current = next((command for command in scope.values() if command["type"] == command_type and command["name"] == payload["name"]), None)
+        command = self._build(application_id, guild_id, payload, current)
+        # Creating a command with the name of an existing one overwrites it
+        if current is None:
+            self._check_limits({**scope, command["id"]: command})
+        scope[command["id"]] = command
+        return (201 if current is None else 200), self._encode(command)
+
+    def _bulk_overwrite(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: None, payload: Any) -> tuple[int, Any]:
+        if not isinstance(payload, list):
+            raise _Error(400, 50035, "Invalid Form Body", {"_errors": [{"code": "LIST_TYPE_CONVERT", "message": "Only iterables may be used in a ListType"}]})
+        errors: dict[str, Any] = {}
+        if self.validate:
+            for index, item in enumerate(payload):
+                try:
+                    self._validate(item, PutGuildApplicationCommand)
+                except _Error as error:
+                    errors[str(index)] = error.body["errors"]
+            if errors:
+                raise _Error(400, 50035, "Invalid Form Body", errors)
+        keys: set[tuple[int, str]] = set()
+        for index, item in enumerate(payload):
+            key = (int(item.get("type") or ApplicationCommandTypes.CHAT_INPUT), item.get("name"))
+            if key in keys:
+                errors[str(index)] = {"name": {"_errors": [{"code": "APPLICATION_COMMANDS_DUPLICATE_NAME", "message": "Application command names must be unique"}]}}
+            keys.add(key)  # type: ignore
+        if errors:
+            raise _Error(400, 50035, "Invalid Form Body", errors)
+        scope = self._scope(application_id, guild_id)
+        by_key = {(command["type"], command["name"]): command for command in scope.values()}
+        commands: dict[Snowflake, dict[str, Any]] = {}
+        for item in payload:
+            current = scope.get(item["id"]) if item.get("id") else by_key.get((int(item.get("type") or ApplicationCommandTypes.CHAT_INPUT), item["name"]))
+            command = self._build(application_id, guild_id, item, current)
+            commands[command["id"]] = command
+        self._check_limits(commands)
+        self._commands[(application_id, guild_id)] = commands
+        if guild_id is not None:
+            permissions = self._permissions.get((application_id, guild_id))
+            if permissions:
+                for removed in scope.keys() - commands.keys():
+                    permissions.pop(removed, None)
+        return 200, self._encode(list(commands.values()))
+
+    def _get_command(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: Snowflake | None, payload: Any) -> tuple[int, Any]:
+        return 200, self._encode(self._command(application_id, guild_id, command_id))
+
+    def _edit_command(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: Snowflake | None, payload: Any) -> tuple[int, Any]:
+        current = self._command(application_id, guild_id, command_id)
+        if not isinstance(payload, dict):
+            raise _Error(400, 50035, "Invalid Form Body", {"_errors": [{"code": "DICT_TYPE_CONVERT", "message": "Only dictionaries may be used in a DictType"}]})
+        self._validate(payload, PatchApplicationCommand)
+        if "type" in payload and int(payload["type"] or ApplicationCommandTypes.CHAT_INPUT) != current["type"]:
+            raise _Error(400, 50035, "Invalid Form Body", {"type": {"_errors": [{"code": "APPLICATION_COMMAND_TYPE_IMMUTABLE", "message": "The type of an application command cannot be changed"}]}})
+        fields = {key: value for key, value in current.items() if key not in ("id", "application_id", "version", "guild_id")}
+        fields.update(payload)
+        # The fields of a PATCH are all optional, so the edited command is validated too
+        self._validate(fields, PostApplicationCommand, memoize=False)
+        command = self._build(application_id, guild_id, fields, current)
+        self._commands[(application_id, guild_id)][command["id"]] = command
+        return 200, self._encode(command)
+
+    def _delete_command(self, application_id: Snowflake, guild_id: Snowflake | None, command_id: Snowflake | None, payload: Any) -> tuple[int, Any]:
+        self._command(application_id, guild_id, command_id)
+        del self._commands[(application_id, guild_id)][command_id]  # type: ignore
+        if guild_id is not None:
+            self._permissions.get((application_id, guild_id), {}).pop(command_id, None)  # type: ignore
+        return 204, None
+
+    def _get_guild_permissions(self, application_id: Snowflake, guild_id: Snowflake, command_id: None, payload: Any) -> tuple[int, Any]:
+        permissions = self._permissions.get((application_id, guild_id), {})
+        return 200, [_guild_permissions(command_id, application_id, guild_id, entries) for command_id, entries in permissions.items()]
+
+    def _get_permissions(self, application_id: Snowflake, guild_id: Snowflake, command_id: Snowflake, payload: Any) -> tuple[int, Any]:
+        entries = self._permissions.get((application_id, guild_id), {}).get(command_id)
+        if entries is None:
+            raise _Error(404, 10066, "Unknown application command permissions")
+        return 200, _guild_permissions(command_id, application_id, guild_id, entries)
+
+    def _edit_permissions(self, application_id: Snowflake, guild_id: Snowflake, command_id: Snowflake, payload: Any) -> tuple[int, Any]:
+        # The ID of the application sets the permissions of all the commands
+        if command_id != application_id:
+            self._command(application_id, guild_id, command_id)
+        if not isinstance(payload, dict) or not isinstance(payload.get("permissions"), list):
+            raise _Error(400, 50035, "Invalid Form Body", {"permissions": {"_errors": [{"code": "BASE_TYPE_REQUIRED", "message": "This field is required"}]}})
+        entries = payload["permissions"]
+        if len(entries) > MAX_PERMISSIONS:
+            raise _Error(400, 50035, "Invalid Form Body", {"permissions": {"_errors": [{"code": "BASE_TYPE_MAX_LENGTH", "message": f"Must be {MAX_PERMISSIONS} or fewer in length."}]}})
+        if self.validate:
+            for index, entry in enumerate(entries):
+                self._validate(entry, ApplicationCommandPermission, f"permissions[{index}].")
+        permissions = self._permissions.get((application_id, guild_id))
+        if permissions is None:
+            permissions = self._permissions[(application_id, guild_id)] = {}
+        permissions[command_id] = entries
+        return 200, _guild_permissions(command_id, application_id, guild_id, entries)
+
+
+_Handler = Callable[[FakeAPI, Snowflake, Any, Any, Any], tuple[int, Any]]
+
+_ROUTES: dict[tuple[str, str], _Handler] = {
+    ("GET", "/commands"): FakeAPI._get_commands,
+    ("POST", "/commands"): FakeAPI._create_command,
+    ("PUT", "/commands"): FakeAPI._bulk_overwrite,
+    ("GET", "/commands/{command.id}"): FakeAPI._get_command,
+    ("PATCH", "/commands/{command.id}"): FakeAPI._edit_command,
+    ("DELETE", "/commands/{command.id}"): FakeAPI._delete_command,
+    ("GET", "/commands/permissions"): FakeAPI._get_guild_permissions,
+    ("GET", "/commands/{command.id}/permissions"): FakeAPI._get_permissions,
+    ("PUT", "/commands/{command.id}/permissions"): FakeAPI._edit_permissions,
+}
+"""Handlers by method and route, without the application and the guild."""
+
+_bucket_hashes: dict[str, str] = {}
+
+
+def _bucket_hash(route: str) -> str:
+    """A stable bucket hash of "method route", like the API sends in \
+    `X-RateLimit-Bucket`."""
+    bucket_hash = _bucket_hashes.get(route)
+    if bucket_hash is None:
+        bucket_hash = _bucket_hashes[route] = blake2b(route.encode(), digest_size=16).hexdigest()
+    return bucket_hash
+
+
+def _guild_permissions(command_id: Snowflake, application_id: Snowflake, guild_id: Snowflake, entries: list[ApplicationCommandPermission]) -> dict[str, Any]:
+    return {"id": command_id, "application_id": application_id, "guild_id": guild_id, "permissions": entries}
+
+
+def _response(status: int, body: Any, headers: dict[str, str] | None = None) -> Response:
+    """A response with `body` encoded as JSON, unless it already is."""
+    if body is None:
+        body = b""
+    elif not isinstance(body, bytes):
+        body = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode()
+    return Response(status, headers if headers is not None else _JSON, body)
\ No newline at end of file
@@ -0,0 +1,176 @@
+"""Content fingerprints of command subtrees, with memoized validation and \
+encoding.
+
+A command is a tree: commands hold options, options hold options and \
+choices. :class:`FingerprintCache` hashes every subtree once, Merkle style, \
+and memoizes the validation errors and the JSON encoding of each subtree by \
+its fingerprint.
+
+Subtrees are memoized by identity, so they must not be modified in place \
+once fingerprinted. Use :func:`replace` instead: it copies only the path from \
+the root to the edited value, so only that path is hashed, validated and \
+encoded again.
+
+Usage:
+```
+cache = FingerprintCache()
+cache.validate(command, PostApplicationCommand)
+body = cache.encode(command)
+command = replace(command, ("options", 0, "choices", 3, "name"), "new name")
+body = cache.encode(command)  # only the command, option 0 and choice 3 are encoded again
+```
+"""
+
+import json
+from functools import lru_cache
+from hashlib import blake2b
+from types import NoneType, UnionType
+from typing import Annotated, Any, Sequence, Union, get_args, get_origin, get_type_hints, is_typeddict
+from .validators import ValidationError, compile_validator
+
+
+CHILD_KEYS = frozenset({"options", "choices"})
+"""Keys holding subtrees."""
+
+_dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_canonical = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode
+
+
+@lru_cache(maxsize=None)
+def _children(cls: type) -> dict[str, type]:
+    """TypedDict class of the items of each list of TypedDicts of `cls`."""
+    children = {}
+    for key, annotation in get_type_hints(cls, include_extras=True).items():
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+        if get_origin(annotation) in (Union, UnionType):
+            arguments = [argument for argument in get_args(annotation) if argument is not NoneType]
+            if len(arguments) != 1:
+                continue
+            annotation = arguments[0]
+            if get_origin(annotation) is Annotated:
+                annotation = get_args(annotation)[0]
+        if get_origin(annotation) is list:
+            item = get_args(annotation)[0]
+            if get_origin(item) is Annotated:
+                item = get_args(item)[0]
+            if is_typeddict(item):
+                children[key] = item
+    return children
+
+
+class FingerprintCache:
+    """Memoizes fingerprints by identity, and validation errors and encodings \
+    by fingerprint.
+
+    Every memo holds at most `maxsize` entries; the oldest entries are \
+    dropped first.
+    """
+
+    __slots__ = ("maxsize", "_fingerprints", "_encodings", "_validations")
+
+    def __init__(self, maxsize: int = 65536) -> None:
+        self.maxsize = maxsize
+        """Maximum number of entries of every memo."""
+        self._fingerprints: dict[int, tuple[dict[str, Any], bytes]] = {}
+        """(subtree, fingerprint) by `id()` of the subtree. The subtree is \
+        kept so that its `id()` is not reused."""
+        self._encodings: dict[bytes, bytes] = {}
+        """JSON encoding by fingerprint."""
+        self._validations: dict[tuple[bytes, type], tuple[ValidationError, ...]] = {}
+        """Validation errors by (fingerprint, TypedDict class)."""
+
+    def _store(self, memo: dict[Any, Any], key: Any, value: Any) -> None:
+        if len(memo) >= self.maxsize:
+            del memo[next(iter(memo))]
+        memo[key] = value
+
+    def clear(self) -> None:
+        """Drops every memoized result."""
+        self._fingerprints.clear()
+        self._encodings.clear()
+        self._validations.clear()
+
+    def fingerprint(self, node: dict[str, Any]) -> bytes:
+        """A 16-byte digest of the content of a command, an option or a \
+        choice. Key order does not matter; the order of options and choices \
+        does."""
+        entry = self._fingerprints.get(id(node))
+        if entry is not None and entry[0] is node:
+            return entry[1]
+
+        digest = blake2b(digest_size=16)
+        for key in sorted(node):
+            value = node[key]
+            if key in CHILD_KEYS and type(value) is list:
+                digest.update(f"{key}[{len(value)}]".encode())
+                for child in value:
+                    digest.update(self.fingerprint(child) if type(child) is dict else _canonical(child).encode())
+            else:
+                digest.update(_canonical([key, value]).encode())
+        fingerprint = digest.digest()
+        self._store(self._fingerprints, id(node), (node, fingerprint))
+        return fingerprint
+
+    def encode(self, node: dict[str, Any]) -> bytes:
+        """The compact JSON encoding of a command, an option or a choice, \
+        reusing the encodings of unchanged subtrees."""
+        fingerprint = self.fingerprint(node)
+        encoding = self._encodings.get(fingerprint)
+        if encoding is not None:
+            return encoding
+
+        parts = []
+        for key, value in node.items():
+            if key in CHILD_KEYS and type(value) is list:
+                children = b",".join(self.encode(child) if type(child) is dict else _dumps(child).encode() for child in value)
+                parts.append(_dumps(key).encode() + b":[" + children + b"]")
+            else:
+                parts.append(_dumps(key).encode() + b":" + _dumps(value).encode())
+        encoding = b"{" + b",".join(parts) + b"}"
+        self._store(self._encodings, fingerprint, encoding)
+        return encoding
+
+    def validate(self, node: Any, cls: type) -> list[ValidationError]:
+        """Like :func:`~validators.validate`, reusing the errors of unchanged \
+        subtrees."""
+        if type(node) is not dict:
+            errors: list[ValidationError] = []
+            compile_validator(cls)(node, "", errors)
+            return errors
+
+        key = (self.fingerprint(node), cls)
+        cached = self._validations.get(key)
+        if cached is None:
+            errors = []
+            compile_validator(cls, shallow=True)(node, "", errors)
+            for field, child_cls in _children(cls).items():
+                children = node.get(field)
+                if type(children) is not list:
+                    continue
+                for index, child in enumerate(children):
+                    for error in self.validate(child, child_cls):
+                        path = f"{field}[{index}]"
+                        errors.append(ValidationError(f"{path}.{error.path}" if error.path else path, error.message))
+            cached = tuple(errors)
+            self._store(self._validations, key, cached)
+        return list(cached)
+
+
+def replace(node: dict[str, Any], path: Sequence[str | int], value: Any) -> dict[str, Any]:
+    """A copy of `node` where the value at `path` is `value`. Only the dicts \
+    and lists on the path are copied; every other subtree is shared.
+
+    Raises:
+    - `KeyError` or `IndexError` if a parent of the value does not exist.
+    """
+    if not path:
+        return value
+    head, rest = path[0], path[1:]
+    if isinstance(node, list):
+        copy: Any = list(node)
+        copy[head] = replace(node[head], rest, value) if rest else value  # type: ignore
+    else:
+        copy = dict(node)
+        copy[head] = replace(node[head], rest, value) if rest else value
+    return copy
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""Compact, deduplicated storage for :data:`~typings.Locales` dicts.
+
+Every `name_localizations` and `description_localizations` dict holds the \
+same keys and, across guilds, mostly the same strings. \
+:class:`Localizations` stores one string per :class:`~enums.Locale` in a \
+fixed-size tuple, interns the strings, and shares one instance between equal \
+localizations.
+
+Usage:
+```
+localizations = Localizations.from_dict(command["name_localizations"])
+localizations["fr"]
+localizations[Locale.FR]
+command["name_localizations"] = localizations.to_dict()
+```
+"""
+
+from collections.abc import Mapping
+from .enums import Locale, _LOCALE_CODES, _LOCALES_BY_CODE
+from sys import intern
+from typing import Iterator
+from .typings import Locales
+from weakref import WeakValueDictionary
+
+
+class Localizations(Mapping[str, str]):
+    """Immutable localizations, readable like the dict sent by the API.
+
+    Equal localizations are the same instance, so comparing them is an \
+    identity check and storing them again costs nothing.
+    """
+
+    __slots__ = ("_values", "_length", "__weakref__")
+
+    _values: tuple[str | None, ...]
+    """String by :class:`~enums.Locale` value. `None` for a missing locale."""
+    _length: int
+
+    _instances: "WeakValueDictionary[tuple[str | None, ...], Localizations]" = WeakValueDictionary()
+    """Shared instances by values."""
+
+    def __new__(cls, values: tuple[str | None, ...]) -> "Localizations":
+        """Use :meth:`from_dict` instead."""
+        instance = cls._instances.get(values)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._values = values
+            instance._length = len(values) - values.count(None)
+            cls._instances[values] = instance
+        return instance
+
+    @classmethod
+    def from_dict(cls, localizations: Locales[str] | Mapping[str, str] | None) -> "Localizations":
+        """Packs a localization dict sent by the API. `None` gives empty \
+        localizations.
+
+        Raises:
+        - `KeyError` if a locale is unknown.
+        """
+        if isinstance(localizations, Localizations):
+            return localizations
+        values: list[str | None] = [None] * len(_LOCALE_CODES)
+        if localizations:
+            for code, string in localizations.items():
+                values[_LOCALES_BY_CODE[code]] = intern(string)
+        return cls(tuple(values))
+
+    def to_dict(self) -> Locales[str]:
+        """Unpacks into the dict form used by the API."""
+        return {code: string for code, string in zip(_LOCALE_CODES, self._values) if string is not None}  # type: ignore
+
+    def __getitem__(self, locale: str | Locale) -> str:
+        """The string of a locale, by :class:`~enums.Locale` or by code."""
+        string = self._values[locale if isinstance(locale, Locale) else _LOCALES_BY_CODE[locale]]
+        if string is None:
+            raise KeyError(locale)
+        return string
+
+    def get(self, locale: str | Locale, default: str | None = None) -> str | None:  # type: ignore
+        index = locale if isinstance(locale, Locale) else _LOCALES_BY_CODE.get(locale)
+        if index is None:
+            return default
+        string = self._values[index]
+        return default if string is None else string
+
+    def __contains__(self, locale: object) -> bool:
+        if not isinstance(locale, Locale):
+            locale = _LOCALES_BY_CODE.get(locale)  # type: ignore
+            if locale is None:
+                return False
+        return self._values[locale] is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Codes of the locales, like `en-US`."""
+        return (code for code, string in zip(_LOCALE_CODES, self._values) if string is not None)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Localizations):
+            return self is other
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self._values)
+
+    def __reduce__(self) -> tuple[type, tuple[tuple[str | None, ...]]]:
+        return Localizations, (self._values,)
+
+    def __repr__(self) -> str:
+        return f"Localizations({self.to_dict()!r})"
+
+
+EMPTY = Localizations.from_dict(None)
+"""Localizations without any locale. Kept alive so that it is always shared."""
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""Table-driven handling of :class:`~ApplicationCommandOption`s by `type`.
+
+An option is a tagged union: its `type` selects the TypedDict describing \
+it. :data:`OPTION_CLASSES` maps every type to its TypedDict, the `is_*` \
+functions narrow an option to the TypedDict of its type, and \
+:class:`OptionVisitor` walks every option of a command through a table of \
+bound methods instead of a chain of `if option["type"] == ...`.
+
+Usage:
+```
+if is_string_option(option):
+    option.get("max_length")
+
+class Counter(OptionVisitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.strings = 0
+
+    def visit_string(self, option, parent) -> None:
+        self.strings += 1
+
+counter = Counter()
+counter.visit(command)
+```
+"""
+
+from collections.abc import Mapping
+from .application_commands.ApplicationCommandOption import (
+    ApplicationCommandOption,
+    ApplicationCommandBooleanOption,
+    ApplicationCommandUserOption,
+    ApplicationCommandRoleOption,
+    ApplicationCommandMentionableOption,
+    ApplicationCommandAttachmentOption,
+    ApplicationCommandIntegerOption,
+    ApplicationCommandStringOption,
+    ApplicationCommandChannelOption,
+    ApplicationCommandNumberOption,
+    ApplicationCommandSubCommandOption,
+    ApplicationCommandSubCommandGroupOption,
+)
+from .enums import ApplicationCommandOptionTypes
+from typing import Any, Callable, TypeGuard
+
+
+OPTION_CLASSES: dict[ApplicationCommandOptionTypes, type] = {
+    ApplicationCommandOptionTypes.SUB_COMMAND: ApplicationCommandSubCommandOption,
+    ApplicationCommandOptionTypes.SUB_COMMAND_GROUP: ApplicationCommandSubCommandGroupOption,
+    ApplicationCommandOptionTypes.STRING: ApplicationCommandStringOption,
+    ApplicationCommandOptionTypes.INTEGER: ApplicationCommandIntegerOption,
+    ApplicationCommandOptionTypes.BOOLEAN: ApplicationCommandBooleanOption,
+    ApplicationCommandOptionTypes.USER: ApplicationCommandUserOption,
+    ApplicationCommandOptionTypes.CHANNEL: ApplicationCommandChannelOption,
+    ApplicationCommandOptionTypes.ROLE: ApplicationCommandRoleOption,
+    ApplicationCommandOptionTypes.MENTIONABLE: ApplicationCommandMentionableOption,
+    ApplicationCommandOptionTypes.NUMBER: ApplicationCommandNumberOption,
+    ApplicationCommandOptionTypes.ATTACHMENT: ApplicationCommandAttachmentOption,
+}
+"""TypedDict of the options, by type."""
+
+
+def option_class(option: Mapping[str, Any]) -> type:
+    """TypedDict of `option`, :class:`~ApplicationCommandOption` for an \
+    unknown type."""
+    return OPTION_CLASSES.get(option["type"], ApplicationCommandOption)
+
+
+def _guard(option_type: ApplicationCommandOptionTypes) -> Callable[[Any], bool]:
+    """Generates the function checking that an option has the type \
+    `option_type`."""
+    value = int(option_type)
+
+    def guard(option: Any) -> bool:
+        return option["type"] == value
+
+    guard.__name__ = guard.__qualname__ = f"is_{option_type.name.lower()}_option"
+    guard.__doc__ = f"Whether `option` is a {option_type.name} option."
+    return guard
+
+
+is_sub_command_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandSubCommandOption]]
+is_sub_command_option = _guard(ApplicationCommandOptionTypes.SUB_COMMAND)  # type: ignore
+is_sub_command_group_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandSubCommandGroupOption]]
+is_sub_command_group_option = _guard(ApplicationCommandOptionTypes.SUB_COMMAND_GROUP)  # type: ignore
+is_string_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandStringOption]]
+is_string_option = _guard(ApplicationCommandOptionTypes.STRING)  # type: ignore
+is_integer_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandIntegerOption]]
+is_integer_option = _guard(ApplicationCommandOptionTypes.INTEGER)  # type: ignore
+is_boolean_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandBooleanOption]]
+is_boolean_option = _guard(ApplicationCommandOptionTypes.BOOLEAN)  # type: ignore
+is_user_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandUserOption]]
+is_user_option = _guard(ApplicationCommandOptionTypes.USER)  # type: ignore
+is_channel_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandChannelOption]]
+is_channel_option = _guard(ApplicationCommandOptionTypes.CHANNEL)  # type: ignore
+is_role_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandRoleOption]]
+is_role_option = _guard(ApplicationCommandOptionTypes.ROLE)  # type: ignore
+is_mentionable_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandMentionableOption]]
+is_mentionable_option = _guard(ApplicationCommandOptionTypes.MENTIONABLE)  # type: ignore
+is_number_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandNumberOption]]
+is_number_option = _guard(ApplicationCommandOptionTypes.NUMBER)  # type: ignore
+is_attachment_option: Callable[[ApplicationCommandOption], TypeGuard[ApplicationCommandAttachmentOption]]
+is_attachment_option = _guard(ApplicationCommandOptionTypes.ATTACHMENT)  # type: ignore
+
+GUARDS: dict[ApplicationCommandOptionTypes, Callable[[Any], bool]] = {
+    option_type: globals()[f"is_{option_type.name.lower()}_option"] for option_type in OPTION_CLASSES
+}
+"""Narrowing function of the options, by type."""
+
+_METHODS: dict[int, str] = {int(option_type): f"visit_{option_type.name.lower()}" for option_type in OPTION_CLASSES}
+"""Name of the visitor method, by type."""
+
+Visit = Callable[[Any, Any], None]
+"""A visitor method. Takes the option and its parent, the command or the \
+option holding it."""
+
+
+class OptionVisitor:
+    """Walks the options of a command, calling the method of the type of \
+    every option, like `visit_string` for a STRING option.
+
+    Methods that are not overridden and unknown types call \
+    :meth:`generic_visit`. Every option is visited before its own options, \
+    in order.
+    """
+
+    __slots__ = ("_table",)
+
+    def __init__(self) -> None:
+        cls = type(self)
+        self._table: dict[int, Visit] = {
+            option_type: self.generic_visit if getattr(cls, name) is getattr(OptionVisitor, name) else getattr(self, name)
+            for option_type, name in _METHODS.items()
+        }
+        """Bound method by type, built once per visitor."""
+
+    def visit(self, command: Mapping[str, Any]) -> None:
+        """Visits every option of `command`, at any depth."""
+        table = self._table
+        generic_visit = self.generic_visit
+        stack: list[tuple[Any, Any]] = [(option, command) for option in reversed(command.get("options") or ())]
+        while stack:
+            option, parent = stack.pop()
+            table.get(option["type"], generic_visit)(option, parent)
+            children = option.get("options")
+            if children:
+                stack.extend([(child, option) for child in reversed(children)])
+
+    def generic_visit(self, option: Any, parent: Any) -> None:
+        """Called for the options whose method is not overridden."""
+
+    def visit_sub_command(self, option: ApplicationCommandSubCommandOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_sub_command_group(self, option: ApplicationCommandSubCommandGroupOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_string(self, option: ApplicationCommandStringOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_integer(self, option: ApplicationCommandIntegerOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_boolean(self, option: ApplicationCommandBooleanOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_user(self, option: ApplicationCommandUserOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_channel(self, option: ApplicationCommandChannelOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_role(self, option: ApplicationCommandRoleOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_mentionable(self, option: ApplicationCommandMentionableOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_number(self, option: ApplicationCommandNumberOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
+
+    def visit_attachment(self, option: ApplicationCommandAttachmentOption, parent: Any) -> None:
+        self.generic_visit(option, parent)
\ No newline at end of file
@@ -0,0 +1,504 @@
+"""Helpers for :class:`~enums.Permissions`.
+
+https://discord.com/developers/docs/topics/permissions
+"""
+
+from .enums import Permissions
+from functools import lru_cache
+from numbers import Integral
+from typing import Any, Iterable, Iterator, TYPE_CHECKING
+from .typings import Snowflake
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+
+ALL_PERMISSIONS = Permissions(0)
+"""Every permission."""
+for _permission in Permissions:
+    ALL_PERMISSIONS |= _permission
+del _permission
+
+_MEMBERS: tuple[Permissions | None, ...] = tuple(Permissions._value2member_map_.get(1 << bit) for bit in range(64))  # type: ignore
+"""Member by bit index."""
+_NAMES: tuple[str | None, ...] = tuple(member.name if member else None for member in _MEMBERS)
+"""Member name by bit index."""
+_BY_NAME: dict[str, int] = {member.name: member.value for member in Permissions}  # type: ignore
+"""Value by member name."""
+
+
+@lru_cache(maxsize=4096)
+def to_permissions(value: int) -> Permissions:
+    """`Permissions(value)`, memoized so that recurring values skip the enum \
+    machinery."""
+    return Permissions(value)
+
+
+@lru_cache(maxsize=4096)
+def parse_permissions(string: str) -> Permissions:
+    """Parses a permission set sent by the API as a decimal string. Memoized \
+    for recurring strings.
+
+    Raises:
+    - `ValueError` if `string` is not a decimal integer.
+    """
+    return to_permissions(int(string))
+
+
+def serialize_permissions(permissions: Permissions | int) -> str:
+    """A permission set as the decimal string used by the API."""
+    return int.__repr__(permissions)
+
+
+@lru_cache(maxsize=4096)
+def permission_names(permissions: Permissions | int) -> tuple[str, ...]:
+    """Names of the permissions set, lowest bit first, like iterating over \
+    `Permissions(permissions)`. Unknown bits are ignored."""
+    names = []
+    value = int(permissions)
+    while value:
+        lowest = value & -value
+        name = _NAMES[lowest.bit_length() - 1] if lowest.bit_length() <= 64 else None
+        if name is not None:
+            names.append(name)
+        value ^= lowest
+    return tuple(names)
+
+
+@lru_cache(maxsize=4096)
+def decompose_permissions(permissions: Permissions | int) -> tuple[Permissions, ...]:
+    """The permissions set, lowest bit first, like `list(Permissions(permissions))`. \
+    Unknown bits are ignored."""
+    members = []
+    value = int(permissions)
+    while value:
+        lowest = value & -value
+        member = _MEMBERS[lowest.bit_length() - 1] if lowest.bit_length() <= 64 else None
+        if member is not None:
+            members.append(member)
+        value ^= lowest
+    return tuple(members)
+
+
+def permissions_from_names(names: Iterable[str]) -> Permissions:
+    """Combines permissions by name.
+
+    Raises:
+    - `KeyError` if a name is not a permission.
+    """
+    value = 0
+    for name in names:
+        value |= _BY_NAME[name]
+    return to_permissions(value)
+
+
+class PermissionResolver:
+    """Computes the effective permissions of the members of a guild in its \
+    channels.
+
+    The results are cached per (channel, member). When a role, a member or an \
+    overwrite changes, only the cached results that depend on it are dropped.
+
+    The computation follows \
+    https://discord.com/developers/docs/topics/permissions#permission-overwrites:
+    1. The permissions of `@everyone` and of the roles of the member.
+    2. The overwrite of `@everyone` in the channel.
+    3. The overwrites of the roles of the member in the channel.
+    4. The overwrite of the member in the channel.
+
+    The owner of the guild and members with ADMINISTRATOR have every permission.
+
+    Usage:
+    ```
+    resolver = PermissionResolver(guild_id)
+    resolver.set_role(guild_id, Permissions.VIEW_CHANNEL)  # @everyone
+    resolver.set_member(member_id, [moderator_role_id])
+    resolver.set_overwrite(channel_id, moderator_role_id, allow=Permissions.MANAGE_MESSAGES)
+    resolver.permissions(member_id, channel_id)
+    ```
+    """
+
+    __slots__ = (
+        "guild_id",
+        "owner_id",
+        "_roles",
+        "_members",
+        "_members_by_role",
+        "_overwrites",
+        "_base",
+        "_cache",
+        "_channels_by_member",
+    )
+
+    def __init__(self, guild_id: Snowflake, owner_id: Snowflake | None = None) -> None:
+        self.guild_id = guild_id
+        """ID of the guild. It is also the ID of the `@everyone` role."""
+        self.owner_id = owner_id
+        """ID of the owner of the guild."""
+
+        self._roles: dict[Snowflake, int] = {}
+        """Permissions by role ID."""
+        self._members: dict[Snowflake, frozenset[Snowflake]] = {}
+        """Role IDs by member ID."""
+        self._members_by_role: dict[Snowflake, set[Snowflake]] = {}
+        """Member IDs by role ID."""
+        self._overwrites: dict[Snowflake, dict[Snowflake, tuple[int, int]]] = {}
+        """(allow, deny) by role or member ID by channel ID."""
+
+        self._base: dict[Snowflake, int] = {}
+        """Cached guild permissions by member ID."""
+        self._cache: dict[Snowflake, dict[Snowflake, Permissions]] = {}
+        """Cached channel permissions by member ID by channel ID."""
+        self._channels_by_member: dict[Snowflake, set[Snowflake]] = {}
+        """IDs of the channels with a cached result by member ID."""
+
+    # Invalidation
+
+    def clear(self) -> None:
+        """Drops every cached result."""
+        self._base.clear()
+        self._cache.clear()
+        self._channels_by_member.clear()
+
+    def _invalidate_member(self, member_id: Snowflake) -> None:
+        self._base.pop(member_id, None)
+        channels = self._channels_by_member.pop(member_id, None)
+        if channels:
+            cache = self._cache
+            for channel_id in channels:
+                cache[channel_id].pop(member_id, None)
+
+    def _invalidate_channel(self, channel_id: Snowflake) -> None:
+        results = self._cache.pop(channel_id, None)
+        if results:
+            channels_by_member = self._channels_by_member
+            for member_id in results:
+                channels_by_member[member_id].discard(channel_id)
+
+    def _invalidate_overwrite(self, channel_id: Snowflake, target_id: Snowflake) -> None:
+        if target_id == self.guild_id:
+            self._invalidate_channel(channel_id)
+            return
+
+        results = self._cache.get(channel_id)
+        if not results:
+            return
+        members = self._members_by_role.get(target_id)
+        if members is None:
+            # A member overwrite
+            members = (target_id,)  # type: ignore
+        elif len(members) > len(results):
+            members = members.intersection(results)
+        channels_by_member = self._channels_by_member
+        for member_id in members:
+            if results.pop(member_id, None) is not None:
+                channels_by_member[member_id].discard(channel_id)
+
+    # Updates
+
+    def set_role(self, role_id: Snowflake, permissions: Permissions | int) -> None:
+        """Adds or updates a role. The ID of `@everyone` is the guild ID."""
+        permissions = int(permissions)
+        if self._roles.get(role_id) == permissions:
+            return
+        self._roles[role_id] = permissions
+        if role_id == self.guild_id:
+            self.clear()
+        else:
+            for member_id in self._members_by_role.get(role_id, ()):
+                self._invalidate_member(member_id)
+
+    def remove_role(self, role_id: Snowflake) -> None:
+        """Removes a role from the guild, its members and the overwrites."""
+        self._roles.pop(role_id, None)
+        for overwrites in self._overwrites.values():
+            overwrites.pop(role_id, None)
+        if role_id == self.guild_id:
+            # Every member has `@everyone` without being listed in `_members_by_role`
+            self.clear()
+            return
+        for member_id in self._members_by_role.pop(role_id, ()):
+            self._members[member_id] -= {role_id}
+            self._invalidate_member(member_id)
+
+    def set_member(self, member_id: Snowflake, role_ids: list[Snowflake] | frozenset[Snowflake]) -> None:
+        """Adds a member or updates the roles of a member. `@everyone` is \
+        implied."""
+        role_ids = frozenset(role_ids)
+        previous = self._members.get(member_id)
+        if previous == role_ids:
+            return
+        self._members[member_id] = role_ids
+        members_by_role = self._members_by_role
+        for role_id in previous or ():
+            if role_id not in role_ids:
+                members_by_role[role_id].discard(member_id)
+        for role_id in role_ids:
+            members_by_role.setdefault(role_id, set()).add(member_id)
+        self._invalidate_member(member_id)
+
+    def remove_member(self, member_id: Snowflake) -> None:
+        """Removes a member from the guild."""
+        for role_id in self._members.pop(member_id, ()):
+            self._members_by_role[role_id].discard(member_id)
+        self._invalidate_member(member_id)
+
+    def set_overwrite(
+        self,
+        channel_id: Snowflake,
+        target_id: Snowflake,
+        allow: Permissions | int = 0,
+        deny: Permissions | int = 0,
+    ) -> None:
+        """Adds or updates the overwrite of a role or of a member in a \
+        channel. The ID of `@everyone` is the guild ID."""
+        overwrite = (int(allow), int(deny))
+        overwrites = self._overwrites.setdefault(channel_id, {})
+        if overwrites.get(target_id) == overwrite:
+            return
+        overwrites[target_id] = overwrite
+        self._invalidate_overwrite(channel_id, target_id)
+
+    def remove_overwrite(self, channel_id: Snowflake, target_id: Snowflake) -> None:
+        """Removes the overwrite of a role or of a member in a channel."""
+        overwrites = self._overwrites.get(channel_id)
+        if overwrites is not None and overwrites.pop(target_id, None) is not None:
+            self._invalidate_overwrite(channel_id, target_id)
+
+    def set_overwrites(self, channel_id: Snowflake, overwrites: dict[Snowflake, tuple[Permissions | int, Permissions | int]]) -> None:
+        """Replaces every overwrite of a channel with `overwrites`, as \
+        (allow, deny) by role or member ID."""
+        self._overwrites[channel_id] = {target_id: (int(allow), int(deny)) for target_id, (allow, deny) in overwrites.items()}
+        self._invalidate_channel(channel_id)
+
+    def remove_channel(self, channel_id: Snowflake) -> None:
+        """Removes a channel and its overwrites."""
+        self._overwrites.pop(channel_id, None)
+        self._invalidate_channel(channel_id)
+
+    def set_owner(self, owner_id: Snowflake | None) -> None:
+        """Changes the owner of the guild."""
+        if owner_id == self.owner_id:
+            return
+        previous, self.owner_id = self.owner_id, owner_id
+        for member_id in (previous, owner_id):
+            if member_id is not None:
+                self._invalidate_member(member_id)
+
+    # Computation
+
+    def _base_permissions(self, member_id: Snowflake) -> int:
+        permissions = self._base.get(member_id)
+        if permissions is not None:
+            return permissions
+
+        if member_id == self.owner_id:
+            permissions = ALL_PERMISSIONS.value
+        else:
+            roles = self._roles
+            permissions = roles.get(self.guild_id, 0)
+            for role_id in self._members.get(member_id, ()):
+                permissions |= roles.get(role_id, 0)
+            if permissions & Permissions.ADMINISTRATOR.value:
+                permissions = ALL_PERMISSIONS.value
+        self._base[member_id] = permissions
+        return permissions
+
+    def guild_permissions(self, member_id: Snowflake) -> Permissions:
+        """The permissions of a member in the guild, without overwrites."""
+        return to_permissions(self._base_permissions(member_id))
+
+    def permissions(self, member_id: Snowflake, channel_id: Snowflake) -> Permissions:
+        """The permissions of a member in a channel."""
+        results = self._cache.get(channel_id)
+        if results is not None:
+            cached = results.get(member_id)
+            if cached is not None:
+                return cached
+        else:
+            results = self._cache[channel_id] = {}
+
+        permissions = self._base_permissions(member_id)
+        if permissions != ALL_PERMISSIONS.value:
+            overwrites = self._overwrites.get(channel_id)
+            if overwrites:
+                overwrite = overwrites.get(self.guild_id)
+                if overwrite is not None:
+                    permissions = (permissions & ~overwrite[1]) | overwrite[0]
+
+                allow = deny = 0
+                for role_id in self._members.get(member_id, ()):
+                    overwrite = overwrites.get(role_id)
+                    if overwrite is not None:
+                        allow |= overwrite[0]
+                        deny |= overwrite[1]
+                permissions = (permissions & ~deny) | allow
+
+                overwrite = overwrites.get(member_id)
+                if overwrite is not None:
+                    permissions = (permissions & ~overwrite[1]) | overwrite[0]
+
+        result = results[member_id] = to_permissions(permissions)
+        self._channels_by_member.setdefault(member_id, set()).add(channel_id)
+        return result
+
+    def has(self, member_id: Snowflake, channel_id: Snowflake, permission: Permissions) -> bool:
+        """Whether a member has all of `permission` in a channel."""
+        return self.permissions(member_id, channel_id) & permission == permission
+
+
+def _numpy() -> Any:
+    """NumPy, imported on first use so that importing the module stays cheap."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for PermissionArray.") from None
+    return numpy
+
+
+def _is_uint64(string: str) -> bool:
+    """Whether `string` is a decimal integer that fits in 64 bits."""
+    return len(string) <= 20 and string.isascii() and string.isdigit() and int(string) < 1 << 64
+
+
+class PermissionArray:
+    """Many permission sets stored in one `uint64` array.
+
+    The queries are vectorized, so checking millions of permission sets does \
+    not loop in Python. NumPy is required.
+
+    Usage:
+    ```
+    roles = PermissionArray.from_strings([role["permissions"] for role in roles])
+    dangerous = roles.any(Permissions.ADMINISTRATOR | Permissions.MANAGE_GUILD)
+    roles.counts()[Permissions.MENTION_EVERYONE]
+    ```
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: "ArrayLike") -> None:
+        """Wraps the permission sets in `values`. A `uint64` array is not \
+        copied."""
+        numpy = _numpy()
+        self.values: "NDArray[Any]" = numpy.asarray(values, dtype=numpy.uint64)
+        """The permission sets."""
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> "PermissionArray":
+        """Parses the permission sets sent by the API as decimal strings, \
+        checked in one pass over their concatenation and parsed by NumPy \
+        instead of one `int()` per string.
+
+        Raises:
+        - `ValueError` if a string is not a decimal integer that fits in 64 \
+        bits.
+        """
+        numpy = _numpy()
+        if not isinstance(strings, (list, tuple)):
+            strings = list(strings)
+        if not strings:
+            return cls(numpy.empty(0, numpy.uint64))
+
+        text = ",".join(strings)
+        # Only digits and separators, so NumPy cannot skip a blank or a comment; it rejects values of more than 64 bits
+        if text.isascii() and not text.encode().translate(None, b"0123456789,") and "" not in strings:
+            try:
+                return cls(numpy.loadtxt(strings, numpy.uint64, ndmin=1))
+            except ValueError:
+                pass
+        invalid = next(string for string in strings if not _is_uint64(string))
+        raise ValueError(f"Permissions must be decimal integers of at most 64 bits, not {invalid!r}.")
+
+    @classmethod
+    def from_permissions(cls, permissions: Iterable[Permissions | int]) -> "PermissionArray":
+        """Packs permission sets."""
+        numpy = _numpy()
+        if not isinstance(permissions, (list, tuple)):
+            permissions = list(permissions)
+        return cls(numpy.fromiter(permissions, numpy.uint64, len(permissions)))
+
+    def to_permissions(self) -> list[Permissions]:
+        """Unpacks the permission sets."""
+        return list(map(to_permissions, self.values.tolist()))
+
+    def to_strings(self) -> list[str]:
+        """The permission sets as the decimal strings used by the API."""
+        return list(map(str, self.values.tolist()))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Permissions]:
+        return iter(self.to_permissions())
+
+    def __getitem__(self, index: Any) -> "Permissions | PermissionArray":
+        """The permission set at `index`, or a :class:`PermissionArray` for a \
+        slice, a mask or an array of indices."""
+        if isinstance(index, Integral) and not isinstance(index, bool):
+            return to_permissions(int(self.values[index]))
+        return PermissionArray(self.values[index])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PermissionArray):
+            return NotImplemented
+        return bool(_numpy().array_equal(self.values, other.values))
+
+    def __repr__(self) -> str:
+        return f"PermissionArray({self.values!r})"
+
+    # Queries
+
+    def has(self, permission: Permissions | int) -> "NDArray[Any]":
+        """Mask of the permission sets with all of `permission`."""
+        mask = _numpy().uint64(permission)
+        return self.values & mask == mask
+
+    all = has
+
+    def any(self, permissions: Permissions | int) -> "NDArray[Any]":
+        """Mask of the permission sets with at least one of `permissions`."""
+        return self.values & _numpy().uint64(permissions) != 0
+
+    def missing(self, permissions: Permissions | int) -> "PermissionArray":
+        """The permissions of `permissions` that each permission set does not \
+        have."""
+        return PermissionArray(~self.values & _numpy().uint64(permissions))
+
+    def counts(self) -> dict[Permissions, int]:
+        """Number of permission sets having each permission."""
+        numpy = _numpy()
+        values = self.values
+        return {
+            permission: int(numpy.count_nonzero(values & numpy.uint64(permission.value)))
+            for permission in Permissions
+        }
+
+    # Bitwise operations
+
+    def _other(self, other: "PermissionArray | Permissions | int") -> Any:
+        if isinstance(other, PermissionArray):
+            return other.values
+        if isinstance(other, int):
+            return _numpy().uint64(other)
+        return NotImplemented
+
+    def __and__(self, other: "PermissionArray | Permissions | int") -> "PermissionArray":
+        values = self._other(other)
+        return NotImplemented if values is NotImplemented else PermissionArray(self.values & values)
+
+    def __or__(self, other: "PermissionArray | Permissions | int") -> "PermissionArray":
+        values = self._other(other)
+        return NotImplemented if values is NotImplemented else PermissionArray(self.values | values)
+
+    def __xor__(self, other: "PermissionArray | Permissions | int") -> "PermissionArray":
+        values = self._other(other)
+        return NotImplemented if values is NotImplemented else PermissionArray(self.values ^ values)
+
+    __rand__ = __and__
+    __ror__ = __or__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> "PermissionArray":
+        """The permissions each permission set does not have."""
+        return PermissionArray(~self.values & _numpy().uint64(ALL_PERMISSIONS.value))
\ No newline at end of file
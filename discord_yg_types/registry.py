@@ -0,0 +1,198 @@
+"""A bounded cache of the commands of applications, per guild, that only \
+decodes the commands whose `version` changed.
+
+Every listing fetched from the API is read through a \
+:class:`~views.PayloadView`: the `id` and the `version` of each command are \
+compared with the cached ones, and only new or updated commands are decoded \
+into :mod:`~discord_yg_types.structs`. A listing where nothing changed keeps \
+its cached entry and indexes as is.
+
+Entries are evicted least recently used first, once there are more than \
+`max_entries` entries or more than `max_commands` commands in total.
+
+Usage:
+```
+registry = CommandRegistry(max_commands=100_000)
+entry = registry.get(application_id, guild_id)
+if entry is None:
+    entry = registry.update(application_id, guild_id, response_body)
+entry.find("ping")
+registry.stats()
+```
+"""
+
+from collections import OrderedDict
+from .enums import ApplicationCommandTypes
+from typing import Any, Iterator, NamedTuple
+from .typings import Snowflake
+from .views import view
+
+
+RegistryKey = tuple[Snowflake, Snowflake | None]
+"""(application ID, guild ID). `None` for global commands."""
+
+
+class RegistryStats(NamedTuple):
+    """Counters of a :class:`CommandRegistry`."""
+
+    hits: int
+    """Lookups that found an entry."""
+    misses: int
+    """Lookups that did not."""
+    evictions: int
+    """Entries evicted to stay within the bounds."""
+    decoded: int
+    """Commands decoded because they were new or their version changed."""
+    reused: int
+    """Commands kept because their version did not change."""
+    entries: int
+    """Entries in the registry."""
+    commands: int
+    """Commands in all the entries."""
+
+
+class RegistryEntry:
+    """The commands of an application in a guild, or global."""
+
+    __slots__ = ("commands", "versions", "_by_name")
+
+    def __init__(self, commands: dict[Snowflake, Any], versions: dict[Snowflake, Snowflake]) -> None:
+        self.commands = commands
+        """Decoded command by ID, in the order of the listing."""
+        self.versions = versions
+        """Version by command ID."""
+        self._by_name: dict[tuple[int, str], Any] | None = None
+        """Command by (type, name), built on first use."""
+
+    def get(self, command_id: Snowflake) -> Any:
+        """A command by ID, `None` if it does not exist."""
+        return self.commands.get(command_id)
+
+    def find(self, name: str, type: ApplicationCommandTypes | int = ApplicationCommandTypes.CHAT_INPUT) -> Any:
+        """A command by name and type, `None` if it does not exist."""
+        by_name = self._by_name
+        if by_name is None:
+            by_name = self._by_name = {
+                (int(command.get("type") or ApplicationCommandTypes.CHAT_INPUT), command["name"]): command
+                for command in self.commands.values()
+            }
+        return by_name.get((int(type), name))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.commands.values())
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+
+class CommandRegistry:
+    """Caches the commands of applications per guild, with LRU eviction."""
+
+    __slots__ = (
+        "max_entries",
+        "max_commands",
+        "_entries",
+        "_commands",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "_decoded",
+        "_reused",
+    )
+
+    def __init__(self, max_entries: int = 10_000, max_commands: int = 1_000_000) -> None:
+        self.max_entries = max_entries
+        """Maximum number of entries."""
+        self.max_commands = max_commands
+        """Maximum number of commands in all the entries."""
+        self._entries: OrderedDict[RegistryKey, RegistryEntry] = OrderedDict()
+        """Entry by key, least recently used first."""
+        self._commands = 0
+        """Commands in all the entries."""
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._decoded = 0
+        self._reused = 0
+
+    def get(self, application_id: Snowflake, guild_id: Snowflake | None = None) -> RegistryEntry | None:
+        """The cached commands of an application in a guild (`None` for \
+        global commands), `None` if they are not cached."""
+        key = (application_id, guild_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def update(self, application_id: Snowflake, guild_id: Snowflake | None, data: bytes | bytearray | memoryview | str) -> RegistryEntry:
+        """Caches a listing fetched from the API, like the response of \
+        `GET /applications/{application.id}/guilds/{guild.id}/commands`, and \
+        returns its entry. Only new commands and commands whose version \
+        changed are decoded.
+
+        Raises:
+        - `json.JSONDecodeError` if `data` is not a valid listing.
+        """
+        key = (application_id, guild_id)
+        previous = self._entries.pop(key, None)
+        old_commands = previous.commands if previous is not None else {}
+        old_versions = previous.versions if previous is not None else {}
+        if previous is not None:
+            self._commands -= len(previous)
+
+        commands: dict[Snowflake, Any] = {}
+        versions: dict[Snowflake, Snowflake] = {}
+        changed = previous is None
+        for command in view(data):
+            command_id = command["id"]
+            version = command["version"]
+            if old_versions.get(command_id) == version:
+                commands[command_id] = old_commands[command_id]
+                self._reused += 1
+            else:
+                commands[command_id] = command.to_struct()
+                self._decoded += 1
+                changed = True
+            versions[command_id] = version
+        if changed or len(commands) != len(old_commands) or list(commands) != list(old_commands):
+            entry = RegistryEntry(commands, versions)
+        else:
+            entry = previous  # type: ignore
+
+        self._entries[key] = entry
+        self._commands += len(entry)
+        self._evict()
+        return entry
+
+    def invalidate(self, application_id: Snowflake, guild_id: Snowflake | None = None) -> None:
+        """Drops the cached commands of an application in a guild."""
+        entry = self._entries.pop((application_id, guild_id), None)
+        if entry is not None:
+            self._commands -= len(entry)
+
+    def _evict(self) -> None:
+        entries = self._entries
+        # The most recent entry is kept, even if it is over the bounds alone
+        while len(entries) > 1 and (len(entries) > self.max_entries or self._commands > self.max_commands):
+            _, entry = entries.popitem(last=False)
+            self._commands -= len(entry)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drops every entry. The counters are kept."""
+        self._entries.clear()
+        self._commands = 0
+
+    def stats(self) -> RegistryStats:
+        return RegistryStats(self._hits, self._misses, self._evictions, self._decoded, self._reused, len(self._entries), self._commands)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether (application ID, guild ID) is cached. Does not count as a \
+        lookup."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""Machine-readable restrictions of fields, used as `Annotated` metadata.
+
+The markers are small immutable classes instead of dataclasses so that \
+importing the types stays cheap.
+"""
+
+from typing import Any
+
+
+MAX_SAFE_INTEGER = 2 ** 53
+"""Largest magnitude allowed for INTEGER and NUMBER values."""
+
+
+class _Restriction:
+    """Base of the markers. Immutable, compared and hashed by fields."""
+
+    __slots__ = ()
+
+    def _fields(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()  # type: ignore
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._fields()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class Length(_Restriction):
+    """Restricts the length of a `str`.
+
+    Usage: `Annotated[str, Length(1, 100)]`
+    """
+
+    __slots__ = ("min", "max")
+
+    min: int
+    """Minimum length (inclusive)."""
+    max: int | None
+    """Maximum length (inclusive). `None` for no maximum."""
+
+    def __init__(self, min: int = 0, max: int | None = None) -> None:
+        object.__setattr__(self, "min", min)
+        object.__setattr__(self, "max", max)
+
+
+class Range(_Restriction):
+    """Restricts the value of an `int` or a `float`.
+
+    Usage: `Annotated[int, Range(-MAX_SAFE_INTEGER, MAX_SAFE_INTEGER)]`
+    """
+
+    __slots__ = ("min", "max")
+
+    min: int | float | None
+    """Minimum value (inclusive). `None` for no minimum."""
+    max: int | float | None
+    """Maximum value (inclusive). `None` for no maximum."""
+
+    def __init__(self, min: int | float | None = None, max: int | float | None = None) -> None:
+        object.__setattr__(self, "min", min)
+        object.__setattr__(self, "max", max)
+
+
+class MaxItems(_Restriction):
+    """Restricts the number of items of a `list`.
+
+    Usage: `Annotated[list[ApplicationCommandOptionChoice], MaxItems(25)]`
+    """
+
+    __slots__ = ("max",)
+
+    max: int
+    """Maximum number of items (inclusive)."""
+
+    def __init__(self, max: int) -> None:
+        object.__setattr__(self, "max", max)
+
+
+class Pattern(_Restriction):
+    """Restricts a `str` to match a regular expression.
+
+    Usage: `Annotated[str, Pattern(r"^[-\\w]{1,32}$")]`
+    """
+
+    __slots__ = ("regex",)
+
+    regex: str
+    """The regular expression. Matched with unicode."""
+
+    def __init__(self, regex: str) -> None:
+        object.__setattr__(self, "regex", regex)
+
+
+class Lowercase(_Restriction):
+    """Restricts a `str` to lowercase characters only.
+
+    Characters without a lowercase variant are allowed.
+    """
+
+    __slots__ = ()
+
+
+class RequiredFirst(_Restriction):
+    """Restricts a `list` of options so that required options are listed \
+    before optional options."""
+
+    __slots__ = ()
+
+
+class OnlyFor(_Restriction):
+    """Restricts a field to objects whose `type` is one of `types`.
+
+    Usage: `Annotated[list[ChannelTypes], OnlyFor(ApplicationCommandOptionTypes.CHANNEL)]`
+    """
+
+    __slots__ = ("types",)
+
+    types: tuple[Any, ...]
+    """The allowed values of the sibling `type` field."""
+
+    def __init__(self, *types: Any) -> None:
+        object.__setattr__(self, "types", types)
\ No newline at end of file
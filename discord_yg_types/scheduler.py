@@ -0,0 +1,317 @@
+"""Concurrent registration of commands in many guilds, within the rate \
+limits of the API.
+
+:class:`RegistrationScheduler` sends :class:`Job`s through a \
+:class:`~transport.Transport` with a bounded number of workers:
+- requests of the same rate limit bucket are sent one at a time, and wait \
+for the reset of the bucket once it is exhausted, following the \
+`X-RateLimit-*` headers,
+- a 429 waits for its `Retry-After`, and a global 429 pauses every worker,
+- server errors and transport errors are retried with exponential backoff, \
+and any other exception fails the job. A timeout or an invalid response \
+fails a job whose method is not in :data:`IDEMPOTENT_METHODS`, such as the \
+POST of :func:`create_job`, since the request may have been processed,
+- finished jobs are recorded in a :class:`Checkpoint`, so that an \
+interrupted run resumes where it stopped.
+
+https://discord.com/developers/docs/topics/rate-limits
+
+Usage:
+```
+transport = HTTPTransport(token)
+scheduler = RegistrationScheduler(transport, checkpoint=Checkpoint("progress.txt"))
+report = await scheduler.run(bulk_overwrite_jobs(application_id, planner.groups()))
+await transport.close()
+```
+"""
+
+import asyncio
+import json
+import random
+from .bulk import UpsertGroup
+from hashlib import blake2b
+from pathlib import Path
+from .transport import ProtocolError, Response, Transport
+from typing import IO, Iterable, Iterator, NamedTuple
+from .typings import Snowflake
+
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+"""Methods whose requests are sent again after a timeout or an invalid \
+response. The PUT of :func:`bulk_overwrite_job` replaces every command, so \
+sending it twice has the effect of sending it once."""
+
+
+class Job(NamedTuple):
+    """A request to send."""
+
+    method: str
+    path: str
+    """Path relative to the API URL."""
+    body: bytes | None
+    route: str
+    """Path template, like `/applications/{application.id}/guilds/{guild.id}/commands`. \
+    Requests with the same method, route and major parameter share a rate \
+    limit bucket."""
+    major: str
+    """Major parameter of the route, the guild ID. Empty for global \
+    commands."""
+
+    @property
+    def key(self) -> str:
+        """Identifies the job and its body in a :class:`Checkpoint`."""
+        digest = blake2b(self.body or b"", digest_size=8).hexdigest()
+        return f"{self.method} {self.path} {digest}"
+
+
+def _commands_path(application_id: Snowflake, guild_id: Snowflake | None) -> tuple[str, str]:
+    if guild_id is None:
+        return f"/applications/{application_id}/commands", "/applications/{application.id}/commands"
+    return f"/applications/{application_id}/guilds/{guild_id}/commands", "/applications/{application.id}/guilds/{guild.id}/commands"
+
+
+def bulk_overwrite_job(application_id: Snowflake, guild_id: Snowflake | None, body: bytes) -> Job:
+    """A bulk overwrite of the commands of a guild (`None` for global \
+    commands), with a body like :attr:`~bulk.UpsertGroup.body`."""
+    path, route = _commands_path(application_id, guild_id)
+    return Job("PUT", path, body, route, guild_id or "")
+
+
+def bulk_overwrite_jobs(application_id: Snowflake, groups: Iterable[UpsertGroup]) -> Iterator[Job]:
+    """The bulk overwrites of the guilds of :class:`~bulk.UpsertGroup`s. \
+    Groups with validation errors are skipped."""
+    for group in groups:
+        if group.errors:
+            continue
+        for guild_id in group.guild_ids:
+            yield bulk_overwrite_job(application_id, guild_id, group.body)
+
+
+def create_job(application_id: Snowflake, guild_id: Snowflake | None, body: bytes) -> Job:
+    """The creation of one command, with the body of a \
+    :class:`~PostApplicationCommand`. Not sent again after a timeout, which \
+    would create the command twice if the first request was processed."""
+    path, route = _commands_path(application_id, guild_id)
+    return Job("POST", path, body, route, guild_id or "")
+
+
+class Checkpoint:
+    """The keys of the finished jobs, appended to a file if there is one so \
+    that they are skipped when the run is resumed."""
+
+    __slots__ = ("path", "_done", "_file")
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = None if path is None else Path(path)
+        """File of the keys, one per line. `None` to keep them in memory."""
+        self._done: set[str] = set()
+        self._file: IO[str] | None = None
+        if self.path is not None and self.path.exists():
+            self._done.update(line for line in self.path.read_text().splitlines() if line)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._done
+
+    def __len__(self) -> int:
+        return len(self._done)
+
+    def mark(self, key: str) -> None:
+        """Records a finished job."""
+        if key in self._done:
+            return
+        self._done.add(key)
+        if self.path is not None:
+            if self._file is None:
+                self._file = self.path.open("a")
+            self._file.write(key + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RegistrationReport(NamedTuple):
+    succeeded: int
+    """Jobs answered with a 2xx."""
+    skipped: int
+    """Jobs already in the checkpoint."""
+    failed: list[tuple[Job, Response | BaseException]]
+    """Jobs answered with an error, or not answered after every retry, with \
+    the last response or exception."""
+    retries: int
+    """Requests sent again, after a 429, a server error or a transport error."""
+
+
+class _Bucket:
+    """The state of a rate limit bucket."""
+
+    __slots__ = ("lock", "remaining", "reset_at")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        """Held while a request of the bucket is in flight."""
+        self.remaining = 1
+        """Requests left before the reset."""
+        self.reset_at = 0.0
+        """Loop time of the reset."""
+
+
+class RegistrationScheduler:
+    """Sends jobs with at most `concurrency` requests in flight, within the \
+    rate limits."""
+
+    __slots__ = (
+        "transport",
+        "concurrency",
+        "max_retries",
+        "backoff",
+        "checkpoint",
+        "_buckets",
+        "_bucket_ids",
+        "_global_reset_at",
+        "_retries",
+    )
+
+    def __init__(
+        self,
+        transport: Transport,
+        concurrency: int = 16,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        checkpoint: Checkpoint | None = None,
+    ) -> None:
+        self.transport = transport
+        self.concurrency = concurrency
+        """Maximum number of requests in flight."""
+        self.max_retries = max_retries
+        """Retries of a job before it fails."""
+        self.backoff = backoff
+        """Seconds before the first retry after a server or transport \
+        error, doubled at every retry."""
+        self.checkpoint = checkpoint if checkpoint is not None else Checkpoint()
+        self._buckets: dict[tuple[str, str], _Bucket] = {}
+        """Bucket by (bucket ID, major parameter)."""
+        self._bucket_ids: dict[str, str] = {}
+        """Bucket ID sent by the API, by "method route". Until it is known, \
+        the route is the bucket ID."""
+        self._global_reset_at = 0.0
+        """Loop time of the end of a global rate limit."""
+        self._retries = 0
+
+    def _bucket(self, job: Job) -> _Bucket:
+        route = f"{job.method} {job.route}"
+        key = (self._bucket_ids.get(route, route), job.major)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket()
+        return bucket
+
+    def _update(self, job: Job, bucket: _Bucket, headers: dict[str, str], now: float) -> None:
+        """Updates the bucket from the rate limit headers of a response."""
+        bucket_id = headers.get("x-ratelimit-bucket")
+        if bucket_id is not None:
+            route = f"{job.method} {job.route}"
+            if self._bucket_ids.get(route) != bucket_id:
+                self._bucket_ids[route] = bucket_id
+                self._buckets.setdefault((bucket_id, job.major), bucket)
+        remaining = headers.get("x-ratelimit-remaining")
+        reset_after = headers.get("x-ratelimit-reset-after")
+        if remaining is not None and reset_after is not None:
+            bucket.remaining = int(remaining)
+            bucket.reset_at = now + float(reset_after)
+
+    async def _send(self, job: Job) -> Response | BaseException:
+        """Sends a job until it is answered without a 429 or a server error, \
+        or until every retry is used."""
+        loop = asyncio.get_running_loop()
+        attempt = 0
+        while True:
+            delay = self._global_reset_at - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            bucket = self._bucket(job)
+            result: Response | BaseException
+            async with bucket.lock:
+                delay = bucket.reset_at - loop.time()
+                if bucket.remaining <= 0 and delay > 0:
+                    await asyncio.sleep(delay)
+                    bucket.remaining = 1
+                try:
+                    result = await self.transport.request(job.method, job.path, job.body)
+                except (OSError, asyncio.TimeoutError) as error:
+                    if job.method not in IDEMPOTENT_METHODS and isinstance(error, (asyncio.TimeoutError, ProtocolError)):
+                        # The request may have been processed, so sending it again could apply it twice
+                        return error
+                    result = error
+                except Exception as error:
+                    # Not a transport error, so a retry would fail the same way
+                    return error
+                else:
+                    self._update(job, bucket, result.headers, loop.time())
+
+            if isinstance(result, BaseException):
+                delay = self.backoff * 2 ** attempt * (0.5 + random.random())
+            elif result.status == 429:
+                delay = _retry_after(result)
+                if result.headers.get("x-ratelimit-global", "").lower() == "true" or result.headers.get("x-ratelimit-scope") == "global":
+                    self._global_reset_at = max(self._global_reset_at, loop.time() + delay)
+                    delay = 0
+                else:
+                    bucket.remaining = 0
+                    bucket.reset_at = max(bucket.reset_at, loop.time() + delay)
+                    delay = 0
+            elif result.status >= 500:
+                delay = self.backoff * 2 ** attempt * (0.5 + random.random())
+            else:
+                return result
+
+            if attempt >= self.max_retries:
+                return result
+            attempt += 1
+            self._retries += 1
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def run(self, jobs: Iterable[Job]) -> RegistrationReport:
+        """Sends every job that is not in the checkpoint.
+
+        Jobs are taken from `jobs` as workers become free, so a generator \
+        of jobs is not materialized.
+        """
+        iterator = iter(jobs)
+        checkpoint = self.checkpoint
+        succeeded = 0
+        skipped = 0
+        failed: list[tuple[Job, Response | BaseException]] = []
+        retries = self._retries
+
+        async def worker() -> None:
+            nonlocal succeeded, skipped
+            for job in iterator:
+                key = job.key
+                if key in checkpoint:
+                    skipped += 1
+                    continue
+                try:
+                    result = await self._send(job)
+                except Exception as error:
+                    result = error
+                if isinstance(result, Response) and 200 <= result.status < 300:
+                    checkpoint.mark(key)
+                    succeeded += 1
+                else:
+                    failed.append((job, result))
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        return RegistrationReport(succeeded, skipped, failed, self._retries - retries)
+
+
+def _retry_after(response: Response) -> float:
+    """Seconds to wait after a 429, from the body or the `Retry-After` \
+    header."""
+    try:
+        return float(json.loads(response.body)["retry_after"])
+    except (ValueError, KeyError, TypeError):
+        return float(response.headers.get("retry-after", 1))
\ No newline at end of file
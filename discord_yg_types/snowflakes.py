@@ -0,0 +1,180 @@
+"""Integer-backed Snowflakes.
+
+:data:`~typings.Snowflake` is the string form used by the API. \
+:class:`IntSnowflake` parses it once and exposes its parts. The batch \
+functions decode many Snowflakes at once into NumPy `uint64` arrays. NumPy is \
+only needed for the batch functions.
+
+https://discord.com/developers/docs/reference#snowflakes
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Iterable, TYPE_CHECKING
+from .typings import Snowflake
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+DISCORD_EPOCH = 1420070400000
+"""The first second of 2015 in milliseconds since the Unix epoch."""
+
+TIMESTAMP_SHIFT = 22
+WORKER_ID_SHIFT = 17
+PROCESS_ID_SHIFT = 12
+WORKER_ID_MASK = 0x3E0000
+PROCESS_ID_MASK = 0x1F000
+INCREMENT_MASK = 0xFFF
+
+
+class IntSnowflake(int):
+    """A Snowflake parsed once into an `int`.
+
+    It compares, hashes and sorts like an `int`, and `str()` gives back the \
+    :data:`~typings.Snowflake` sent by the API.
+
+    Usage:
+    ```
+    snowflake = IntSnowflake("175928847299117063")
+    snowflake.timestamp  # 1462015105796
+    ```
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_timestamp(cls, timestamp: int) -> "IntSnowflake":
+        """The smallest Snowflake created at `timestamp` (milliseconds since \
+        the Unix epoch). Useful for filtering by creation time."""
+        return cls((timestamp - DISCORD_EPOCH) << TIMESTAMP_SHIFT)
+
+    @classmethod
+    def from_datetime(cls, time: datetime) -> "IntSnowflake":
+        """The smallest Snowflake created at `time`."""
+        return cls.from_timestamp(int(time.timestamp() * 1000))
+
+    @property
+    def timestamp(self) -> int:
+        """Milliseconds since the Unix epoch."""
+        return (self >> TIMESTAMP_SHIFT) + DISCORD_EPOCH
+
+    @property
+    def created_at(self) -> datetime:
+        """When the Snowflake was created."""
+        return datetime.fromtimestamp(((self >> TIMESTAMP_SHIFT) + DISCORD_EPOCH) / 1000, timezone.utc)
+
+    @property
+    def worker_id(self) -> int:
+        """Internal worker ID."""
+        return (self & WORKER_ID_MASK) >> WORKER_ID_SHIFT
+
+    @property
+    def process_id(self) -> int:
+        """Internal process ID."""
+        return (self & PROCESS_ID_MASK) >> PROCESS_ID_SHIFT
+
+    @property
+    def increment(self) -> int:
+        """Incremented for every ID generated on the process."""
+        return self & INCREMENT_MASK
+
+    def __str__(self) -> Snowflake:
+        return int.__repr__(self)
+
+    def __repr__(self) -> str:
+        return f"IntSnowflake({int.__repr__(self)})"
+
+
+def _numpy() -> Any:
+    """NumPy, imported on first use so that importing the module stays cheap."""
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required for the batch Snowflake functions.") from None
+    return numpy
+
+
+def _is_snowflake(snowflake: str) -> bool:
+    """Whether `snowflake` is a decimal integer that fits in 64 bits."""
+    return len(snowflake) <= 20 and snowflake.isascii() and snowflake.isdigit() and int(snowflake) < 1 << 64
+
+
+def decode(snowflakes: Iterable[Snowflake | int]) -> "NDArray[Any]":
+    """Decodes Snowflakes into a `uint64` array.
+
+    Strings are checked in one pass over their concatenation and parsed by \
+    NumPy instead of one `int()` per Snowflake.
+
+    Raises:
+    - `ValueError` if a Snowflake is not a decimal integer that fits in 64 \
+    bits.
+    """
+    numpy = _numpy()
+    if isinstance(snowflakes, numpy.ndarray):
+        return snowflakes.astype(numpy.uint64, copy=False)
+    if not isinstance(snowflakes, (list, tuple)):
+        snowflakes = list(snowflakes)
+    if not snowflakes:
+        return numpy.empty(0, numpy.uint64)
+    if isinstance(snowflakes[0], int):
+        return numpy.fromiter(snowflakes, numpy.uint64, len(snowflakes))
+
+    text = ",".join(snowflakes)  # type: ignore
+    # Only digits and separators, so NumPy cannot skip a blank or a comment; it rejects values of more than 64 bits
+    if text.isascii() and not text.encode().translate(None, b"0123456789,") and "" not in snowflakes:
+        try:
+            return numpy.loadtxt(snowflakes, numpy.uint64, ndmin=1)
+        except ValueError:
+            pass
+    invalid = next(snowflake for snowflake in snowflakes if not _is_snowflake(snowflake))  # type: ignore
+    raise ValueError(f"Snowflakes must be decimal integers of at most 64 bits, not {invalid!r}.")
+
+
+def encode(snowflakes: "NDArray[Any]") -> list[Snowflake]:
+    """Encodes a `uint64` array back into :data:`~typings.Snowflake` strings."""
+    return list(map(str, snowflakes.tolist()))
+
+
+def timestamps(snowflakes: "NDArray[Any]") -> "NDArray[Any]":
+    """Milliseconds since the Unix epoch of every Snowflake, as `int64`."""
+    numpy = _numpy()
+    return (snowflakes >> numpy.uint64(TIMESTAMP_SHIFT)).astype(numpy.int64) + DISCORD_EPOCH
+
+
+def worker_ids(snowflakes: "NDArray[Any]") -> "NDArray[Any]":
+    """Internal worker ID of every Snowflake."""
+    numpy = _numpy()
+    return ((snowflakes & numpy.uint64(WORKER_ID_MASK)) >> numpy.uint64(WORKER_ID_SHIFT)).astype(numpy.uint8)
+
+
+def process_ids(snowflakes: "NDArray[Any]") -> "NDArray[Any]":
+    """Internal process ID of every Snowflake."""
+    numpy = _numpy()
+    return ((snowflakes & numpy.uint64(PROCESS_ID_MASK)) >> numpy.uint64(PROCESS_ID_SHIFT)).astype(numpy.uint8)
+
+
+def increments(snowflakes: "NDArray[Any]") -> "NDArray[Any]":
+    """Increment of every Snowflake."""
+    numpy = _numpy()
+    return (snowflakes & numpy.uint64(INCREMENT_MASK)).astype(numpy.uint16)
+
+
+def created_between(snowflakes: "NDArray[Any]", start: int | None = None, end: int | None = None) -> "NDArray[Any]":
+    """Mask of the Snowflakes created between `start` (inclusive) and `end` \
+    (exclusive), in milliseconds since the Unix epoch.
+
+    Compares the raw Snowflakes with the bounds, so no timestamp is extracted.
+    """
+    numpy = _numpy()
+    mask = numpy.ones(len(snowflakes), bool)
+    if start is not None:
+        mask &= snowflakes >= numpy.uint64(max(IntSnowflake.from_timestamp(start), 0))
+    if end is not None:
+        mask &= snowflakes < numpy.uint64(max(IntSnowflake.from_timestamp(end), 0))
+    return mask
+
+
+def filter_created_between(snowflakes: "NDArray[Any]", start: int | None = None, end: int | None = None) -> "NDArray[Any]":
+    """The Snowflakes created between `start` (inclusive) and `end` \
+    (exclusive), in milliseconds since the Unix epoch."""
+    return snowflakes[created_between(snowflakes, start, end)]
\ No newline at end of file
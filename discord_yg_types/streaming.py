@@ -0,0 +1,201 @@
+"""Incremental parsing of large JSON arrays, like the commands or the \
+permissions of thousands of guilds.
+
+:func:`iter_items` reads the array chunk by chunk and yields its items one \
+at a time, so the memory used does not depend on the length of the array: \
+only the unparsed part of the last chunk and the item being parsed are \
+kept. The source is a binary or text file-like object, or an iterable of \
+`bytes` or `str` chunks, like the body of a streamed HTTP response.
+
+Usage:
+```
+with open("commands.json", "rb") as file:
+    for command in iter_commands(file):
+        ...
+for entry in iter_permissions(response.iter_bytes(), structs=True):
+    entry.permissions
+```
+"""
+
+import codecs
+from .application_commands.GetApplicationCommand import GetApplicationCommand
+from .application_commands.GuildApplicationCommandPermission import GuildApplicationCommandPermission
+from .decoding import object_hook
+from json import JSONDecodeError, JSONDecoder
+from json.scanner import make_scanner
+from typing import Any, Callable, Iterable, Iterator, Protocol
+
+
+CHUNK_SIZE = 65536
+"""Characters or bytes read from a file at once."""
+
+_TRUNCATION_MARGIN = 32
+"""An error this close to the end of the buffer may be caused by an item \
+cut by the end of the chunk, like `tr` of `true`."""
+
+_WHITESPACE = frozenset(" \t\n\r")
+_NUMBER = frozenset("0123456789.eE+-")
+"""Characters that may continue a number cut by the end of the buffer, like \
+`1.5e` of `1.5e3`."""
+_scan: Callable[[str, int], tuple[Any, int]] = make_scanner(JSONDecoder())
+_scan_structs: Callable[[str, int], tuple[Any, int]] = make_scanner(JSONDecoder(object_hook=object_hook))
+
+
+class Readable(Protocol):
+    """A binary or text file-like object."""
+
+    def read(self, size: int, /) -> bytes | str: ...
+
+
+Source = Readable | Iterable[bytes] | Iterable[str]
+"""Where the JSON is read from."""
+
+
+def _chunks(source: Source, chunk_size: int) -> Iterator[str]:
+    """Text of the chunks of `source`. Bytes are decoded as UTF-8, even \
+    when a character is split between two chunks."""
+    is_file = hasattr(source, "read")
+    if is_file:
+        read = source.read  # type: ignore
+        chunks: Iterable[bytes | str] = iter(lambda: read(chunk_size), None)
+    else:
+        chunks = source  # type: ignore
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        if not chunk:
+            # An empty read is the end of a file
+            if is_file:
+                break
+            continue
+        yield chunk if isinstance(chunk, str) else decoder.decode(chunk)
+    yield decoder.decode(b"", True)
+
+
+class _Buffer:
+    """Unparsed text, refilled from the chunks."""
+
+    __slots__ = ("chunks", "text", "position", "eof")
+
+    def __init__(self, chunks: Iterator[str]) -> None:
+        self.chunks = chunks
+        self.text = ""
+        """Text read and not dropped yet."""
+        self.position = 0
+        """Index of the first unparsed character of :attr:`text`."""
+        self.eof = False
+        """Whether every chunk was read."""
+
+    def fill(self, minimum: int = 1) -> bool:
+        """Drops the parsed text and reads chunks until at least `minimum` \
+        more characters are unparsed. Returns `False` if the source is \
+        exhausted first."""
+        parts = [self.text[self.position:]]
+        length = target = len(parts[0])
+        target += minimum
+        while length < target:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.eof = True
+                break
+            parts.append(chunk)
+            length += len(chunk)
+        self.text = "".join(parts)
+        self.position = 0
+        return length >= target
+
+    def skip_whitespace(self) -> str:
+        """Skips whitespace and returns the next character, `""` at the end \
+        of the source."""
+        while True:
+            text = self.text
+            position = self.position
+            length = len(text)
+            while position < length and text[position] in _WHITESPACE:
+                position += 1
+            self.position = position
+            if position < length:
+                return text[position]
+            if not self.fill():
+                return ""
+
+    def error(self, message: str) -> JSONDecodeError:
+        return JSONDecodeError(message, self.text, self.position)
+
+
+def _truncated(buffer: _Buffer, error: Exception) -> bool:
+    """Whether `error` may be caused by the end of the buffer rather than by \
+    invalid JSON."""
+    if buffer.eof:
+        return False
+    if isinstance(error, StopIteration):
+        position = error.value
+    else:
+        if error.msg.startswith("Unterminated string"):  # type: ignore
+            return True
+        position = error.pos  # type: ignore
+    return len(buffer.text) - position <= _TRUNCATION_MARGIN
+
+
+def _item(buffer: _Buffer, scan: Callable[[str, int], tuple[Any, int]]) -> Any:
+    """Parses the item at the position of the buffer, reading chunks until \
+    it is complete."""
+    while True:
+        try:
+            item, end = scan(buffer.text, buffer.position)
+        except (StopIteration, JSONDecodeError) as error:
+            if not _truncated(buffer, error):
+                if isinstance(error, StopIteration):
+                    raise buffer.error("Expecting value") from None
+                raise
+        else:
+            if buffer.eof or (end < len(buffer.text) and buffer.text[end] not in _NUMBER):
+                buffer.position = end
+                return item
+        # Doubles the unparsed text, so that a large item is parsed a
+        # logarithmic number of times
+        buffer.fill(max(len(buffer.text) - buffer.position, 1))
+
+
+def iter_items(source: Source, structs: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yields the items of the JSON array read from `source`.
+
+    With `structs`, the items are decoded into :mod:`~discord_yg_types.structs` \
+    like :func:`~decoding.decode` does.
+
+    Raises:
+    - `json.JSONDecodeError` if the JSON is invalid or is not an array.
+    - `UnicodeDecodeError` if `source` is not valid UTF-8.
+    """
+    scan = _scan_structs if structs else _scan
+    buffer = _Buffer(_chunks(source, chunk_size))
+    if buffer.skip_whitespace() != "[":
+        raise buffer.error("Expecting '['")
+    buffer.position += 1
+    if buffer.skip_whitespace() == "]":
+        buffer.position += 1
+    else:
+        while True:
+            yield _item(buffer, scan)
+            character = buffer.skip_whitespace()
+            buffer.position += 1
+            if character == "]":
+                break
+            if character != ",":
+                buffer.position -= 1
+                raise buffer.error("Expecting ',' delimiter")
+            buffer.skip_whitespace()
+    if buffer.skip_whitespace():
+        raise buffer.error("Extra data")
+
+
+def iter_commands(source: Source, structs: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[GetApplicationCommand]:
+    """Yields the commands of a listing, like the response of \
+    `GET /applications/{application.id}/commands`. See :func:`iter_items`."""
+    return iter_items(source, structs, chunk_size)
+
+
+def iter_permissions(source: Source, structs: bool = False, chunk_size: int = CHUNK_SIZE) -> Iterator[GuildApplicationCommandPermission]:
+    """Yields the permissions of a listing, like the response of \
+    `GET /applications/{application.id}/guilds/{guild.id}/commands/permissions`. \
+    See :func:`iter_items`."""
+    return iter_items(source, structs, chunk_size)
\ No newline at end of file
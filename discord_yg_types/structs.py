@@ -0,0 +1,152 @@
+"""Compact runtime objects mirroring the TypedDicts.
+
+A :class:`Struct` stores the fields of a payload in `__slots__` instead of a \
+dict, so it is several times smaller, and it reads like the payload: \
+`struct["name"]`, `struct.get("options")`, `"options" in struct`. Fields \
+missing from the payload are missing from the struct.
+
+Structs are built by :mod:`~discord_yg_types.decoding`. Every struct class \
+has the name of the TypedDict that it mirrors.
+
+Usage:
+```
+command = decode(data)[0]
+command.name
+command["name"]
+command.to_dict()
+```
+"""
+
+from .application_commands.ApplicationCommandOption import (
+    ApplicationCommandOption as _ApplicationCommandOption,
+    ApplicationCommandBooleanOption as _ApplicationCommandBooleanOption,
+    ApplicationCommandUserOption as _ApplicationCommandUserOption,
+    ApplicationCommandRoleOption as _ApplicationCommandRoleOption,
+    ApplicationCommandMentionableOption as _ApplicationCommandMentionableOption,
+    ApplicationCommandAttachmentOption as _ApplicationCommandAttachmentOption,
+    ApplicationCommandIntegerOption as _ApplicationCommandIntegerOption,
+    ApplicationCommandStringOption as _ApplicationCommandStringOption,
+    ApplicationCommandChannelOption as _ApplicationCommandChannelOption,
+    ApplicationCommandNumberOption as _ApplicationCommandNumberOption,
+    ApplicationCommandSubCommandOption as _ApplicationCommandSubCommandOption,
+    ApplicationCommandSubCommandGroupOption as _ApplicationCommandSubCommandGroupOption,
+)
+from .application_commands.ApplicationCommandOptionChoice import ApplicationCommandOptionChoice as _ApplicationCommandOptionChoice
+from .application_commands.ApplicationCommandPermission import ApplicationCommandPermission as _ApplicationCommandPermission
+from .application_commands.GetApplicationCommand import GetApplicationCommand as _GetApplicationCommand
+from .application_commands.GuildApplicationCommandPermission import GuildApplicationCommandPermission as _GuildApplicationCommandPermission
+from .enums import Permissions
+from .localizations import Localizations
+from .permissions import serialize_permissions
+from typing import Any, ClassVar, Iterator
+
+
+_MISSING: Any = object()
+"""Default of `getattr` for missing fields."""
+
+
+class Struct:
+    """Base class of the structs. Reads like the dict of the TypedDict in \
+    :attr:`__typeddict__`."""
+
+    __slots__ = ()
+
+    __typeddict__: ClassVar[type]
+    """The mirrored TypedDict."""
+    __fields__: ClassVar[tuple[str, ...]]
+    """Every field of the TypedDict, in order."""
+    __keys__: ClassVar[frozenset[str]]
+    """Every field of the TypedDict."""
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__keys__:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.__keys__:
+            return getattr(self, key, default)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__keys__ and hasattr(self, key)  # type: ignore
+
+    def keys(self) -> list[str]:
+        """Fields present in the payload."""
+        return [key for key in self.__fields__ if hasattr(self, key)]
+
+    def values(self) -> list[Any]:
+        return [value for key in self.__fields__ if (value := getattr(self, key, _MISSING)) is not _MISSING]
+
+    def items(self) -> list[tuple[str, Any]]:
+        return [(key, value) for key in self.__fields__ if (value := getattr(self, key, _MISSING)) is not _MISSING]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def to_dict(self) -> dict[str, Any]:
+        """The payload of the struct, in the form sent by the API. Nested \
+        structs and :class:`~localizations.Localizations` are converted too, \
+        and :class:`~enums.Permissions` are serialized back into strings."""
+        return {key: _to_payload(value) for key, value in self.items()}
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, key, _MISSING) == getattr(other, key, _MISSING) for key in self.__fields__)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+def _to_payload(value: Any) -> Any:
+    """Converts a field of a struct back into its payload form."""
+    if isinstance(value, Struct):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_payload(item) for item in value]
+    if isinstance(value, Localizations):
+        return value.to_dict()
+    if isinstance(value, Permissions):
+        return serialize_permissions(value)
+    return value
+
+
+def struct(typeddict: type, name: str | None = None) -> type[Struct]:
+    """Creates the struct class mirroring `typeddict`, named like it by \
+    default."""
+    fields = tuple(typeddict.__annotations__)
+    return type(name or typeddict.__name__, (Struct,), {
+        "__slots__": fields,
+        "__typeddict__": typeddict,
+        "__fields__": fields,
+        "__keys__": frozenset(fields),
+        "__module__": __name__,
+        "__doc__": f"Struct mirroring :class:`~{typeddict.__module__}.{typeddict.__name__}`.",
+    })
+
+
+GetApplicationCommand = struct(_GetApplicationCommand)
+ApplicationCommandOption = struct(_ApplicationCommandOption)
+ApplicationCommandBooleanOption = struct(_ApplicationCommandBooleanOption)
+ApplicationCommandUserOption = struct(_ApplicationCommandUserOption)
+ApplicationCommandRoleOption = struct(_ApplicationCommandRoleOption)
+ApplicationCommandMentionableOption = struct(_ApplicationCommandMentionableOption)
+ApplicationCommandAttachmentOption = struct(_ApplicationCommandAttachmentOption)
+ApplicationCommandIntegerOption = struct(_ApplicationCommandIntegerOption)
+ApplicationCommandStringOption = struct(_ApplicationCommandStringOption)
+ApplicationCommandChannelOption = struct(_ApplicationCommandChannelOption)
+ApplicationCommandNumberOption = struct(_ApplicationCommandNumberOption)
+ApplicationCommandSubCommandOption = struct(_ApplicationCommandSubCommandOption)
+ApplicationCommandSubCommandGroupOption = struct(_ApplicationCommandSubCommandGroupOption)
+ApplicationCommandOptionChoice = struct(_ApplicationCommandOptionChoice)
+ApplicationCommandPermission = struct(_ApplicationCommandPermission)
+GuildApplicationCommandPermission = struct(_GuildApplicationCommandPermission)
\ No newline at end of file
@@ -0,0 +1,250 @@
+"""Flattened type stubs of the TypedDicts of :mod:`application_commands`.
+
+The TypedDicts are built from deep chains of private bases, with fields \
+overridden under `# type: ignore` and a diamond in \
+:class:`~GetApplicationCommand.GetApplicationCommand`, which type checkers \
+resolve again in every project. The generated stubs list the final fields \
+of every public TypedDict directly, with `NotRequired` for the optional \
+ones and no base but `TypedDict`, so there is nothing left to resolve.
+
+The stubs form the partial stub-only package `discord_yg_types-stubs` \
+(PEP 561): modules without a stub are read from the sources. \
+:func:`verify_stubs` executes the stubs and checks that every TypedDict has \
+the same fields, annotations and required keys as its source class.
+
+Usage:
+```
+python -m discord_yg_types.stubs stubs          # write stubs/discord_yg_types-stubs
+python -m discord_yg_types.stubs stubs --check  # exit 1 if the stubs are stale or differ
+```
+"""
+
+import argparse
+import sys
+import typing
+from enum import Enum
+from importlib import import_module
+from pathlib import Path
+from . import application_commands, restrictions, typings
+from types import NoneType, UnionType
+from typing import Any, Annotated, Literal, NotRequired, Required, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+
+PACKAGE = "discord_yg_types-stubs"
+"""Name of the directory of the stub-only package."""
+
+_HEADER = "# Generated by `python -m discord_yg_types.stubs`. Do not edit.\n"
+
+_ALIASES: list[tuple[Any, str]] = [
+    (typings.ApplicationCommandName, "ApplicationCommandName"),
+    (typings.Description, "Description"),
+]
+"""Aliases of :mod:`typings` written by name instead of expanded."""
+
+_LOCALES_KEY = get_args(typings.Locales)[0]
+"""Key type of :data:`~typings.Locales`."""
+
+
+def _modules() -> list[str]:
+    """Names of the modules of :mod:`application_commands`, sorted."""
+    return [f".{module}" for module in sorted(application_commands._SUBMODULES)]
+
+
+class _Renderer:
+    """Writes annotations as source, and collects the imports they need."""
+
+    def __init__(self) -> None:
+        self.imports: dict[str, set[str]] = {}
+        """Names by absolute module."""
+        self.module = ""
+        """Module of the stub being written. Its classes are not imported."""
+
+    def name(self, module: str, name: str) -> str:
+        if module != self.module and module != "builtins":
+            self.imports.setdefault(module, set()).add(name)
+        return name
+
+    def value(self, value: Any) -> str:
+        """A literal value, or an argument of a restriction."""
+        if isinstance(value, Enum):
+            return f"{self.name(type(value).__module__, type(value).__name__)}.{value.name}"
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return repr(value)
+        raise TypeError(f"Cannot write {value!r} in a stub.")
+
+    def marker(self, marker: Any) -> str:
+        """A restriction of an `Annotated`."""
+        arguments = marker.types if isinstance(marker, restrictions.OnlyFor) else marker._fields()
+        name = self.name(type(marker).__module__, type(marker).__name__)
+        return f"{name}({', '.join(self.value(argument) for argument in arguments)})"
+
+    def annotation(self, annotation: Any) -> str:
+        for alias, name in _ALIASES:
+            if annotation == alias:
+                return self.name(typings.__name__, name)
+        if annotation is None or annotation is NoneType:
+            return "None"
+
+        origin = get_origin(annotation)
+        arguments = get_args(annotation)
+        if origin is Annotated:
+            markers = ", ".join(self.marker(marker) for marker in annotation.__metadata__)
+            return f"{self.name('typing', 'Annotated')}[{self.annotation(annotation.__origin__)}, {markers}]"
+        if origin in (Required, NotRequired):
+            return self.annotation(arguments[0])
+        if origin in (Union, UnionType):
+            return " | ".join(self.annotation(argument) for argument in arguments)
+        if origin is Literal:
+            return f"{self.name('typing', 'Literal')}[{', '.join(self.value(argument) for argument in arguments)}]"
+        if origin is dict and arguments[0] == _LOCALES_KEY:
+            return f"{self.name(typings.__name__, 'Locales')}[{self.annotation(arguments[1])}]"
+        if origin in (list, dict, tuple):
+            return f"{origin.__name__}[{', '.join(self.annotation(argument) for argument in arguments)}]"
+        if isinstance(annotation, type):
+            return self.name(annotation.__module__, annotation.__qualname__)
+        raise TypeError(f"Cannot write {annotation!r} in a stub.")
+
+
+def _typeddicts(module: Any) -> list[type]:
+    """The public TypedDicts defined in `module`, in order."""
+    return [
+        value for name, value in vars(module).items()
+        if not name.startswith("_") and is_typeddict(value) and value.__module__ == module.__name__
+    ]
+
+
+def flatten(cls: type, renderer: "_Renderer | None" = None) -> str:
+    """The stub of a TypedDict, with every field listed directly."""
+    renderer = renderer or _Renderer()
+    lines = [f"class {cls.__name__}({renderer.name('typing', 'TypedDict')}):"]
+    optional = cls.__optional_keys__  # type: ignore
+    for key, annotation in get_type_hints(cls, include_extras=True).items():
+        source = renderer.annotation(annotation)
+        if key in optional:
+            source = f"{renderer.name('typing', 'NotRequired')}[{source}]"
+        lines.append(f"    {key}: {source}")
+    if len(lines) == 1:
+        lines.append("    pass")
+    return "\n".join(lines)
+
+
+def _imports(imports: dict[str, set[str]]) -> list[str]:
+    return [f"from {module} import {', '.join(sorted(names))}" for module, names in sorted(imports.items())]
+
+
+def stub_module(name: str) -> str:
+    """The stub of a module of :mod:`application_commands`, like \
+    `".ApplicationCommand"`."""
+    module = import_module(name, application_commands.__name__)
+    renderer = _Renderer()
+    renderer.module = module.__name__
+    classes = [flatten(cls, renderer) for cls in _typeddicts(module)]
+    return _HEADER + "\n".join(_imports(renderer.imports)) + "\n\n\n" + "\n\n\n".join(classes) + "\n"
+
+
+def stub_package() -> str:
+    """The stub of :mod:`application_commands` itself, importing every name \
+    statically instead of on first access."""
+    modules: dict[str, list[str]] = {}
+    for name, module in application_commands._EXPORTS.items():
+        modules.setdefault(module, []).append(name)
+    lines = [
+        f"from {application_commands.__name__}{module} import {', '.join(f'{name} as {name}' for name in names)}"
+        for module, names in modules.items()
+    ]
+    return _HEADER + "\n".join(lines) + "\n"
+
+
+def generate_stubs() -> dict[str, str]:
+    """The files of the stub package, by path relative to its directory."""
+    files = {"py.typed": "partial\n", "application_commands/__init__.pyi": stub_package()}
+    for module in _modules():
+        files[f"application_commands/{module.lstrip('.')}.pyi"] = stub_module(module)
+    return files
+
+
+def write_stubs(directory: str | Path) -> Path:
+    """Writes the stub package into `directory`, and returns its path."""
+    root = Path(directory, PACKAGE)
+    for path, text in generate_stubs().items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(text, encoding="utf-8", newline="\n")
+    return root
+
+
+def _compare(source: type, stub: type, stub_namespace: dict[str, Any]) -> list[str]:
+    """Differences between a TypedDict and its stub."""
+    problems = []
+    name = source.__name__
+    source_hints = get_type_hints(source, include_extras=True)
+    stub_hints = get_type_hints(stub, globalns=stub_namespace, include_extras=True)
+    if list(source_hints) != list(stub_hints):
+        problems.append(f"{name}: fields {list(source_hints)} != {list(stub_hints)}")
+    # The stubs are executed with postponed annotations, so `NotRequired` is only seen once evaluated
+    required = {key for key, annotation in stub_hints.items() if get_origin(annotation) is not NotRequired}
+    if source.__required_keys__ != required:  # type: ignore
+        problems.append(f"{name}: required keys {sorted(source.__required_keys__)} != {sorted(required)}")  # type: ignore
+    # TypedDicts of the stubs are not the source classes, so annotations are compared as written
+    renderer = _Renderer()
+    for key in source_hints.keys() & stub_hints.keys():
+        expected = renderer.annotation(source_hints[key])
+        actual = renderer.annotation(stub_hints[key])
+        if expected != actual:
+            problems.append(f"{name}.{key}: {expected} != {actual}")
+    return problems
+
+
+def verify_stubs(files: dict[str, str] | None = None) -> list[str]:
+    """Executes the stubs and compares every TypedDict with its source \
+    class. Returns the differences found; an empty list means the stubs \
+    are equivalent."""
+    files = generate_stubs() if files is None else files
+    problems = []
+    for module in _modules():
+        path = f"application_commands/{module.lstrip('.')}.pyi"
+        text = files.get(path)
+        if text is None:
+            problems.append(f"{path}: missing")
+            continue
+        source_module = import_module(module, application_commands.__name__)
+        namespace: dict[str, Any] = {"__name__": path}
+        # Annotations are evaluated lazily so that the classes may refer to each other in any order
+        exec(compile("from __future__ import annotations\n" + text, path, "exec"), namespace)
+        sources = {cls.__name__: cls for cls in _typeddicts(source_module)}
+        stubs = {name: value for name, value in namespace.items() if is_typeddict(value) and value.__module__ == path}
+        if sources.keys() != stubs.keys():
+            problems.append(f"{path}: classes {sorted(sources)} != {sorted(stubs)}")
+        for name in sources.keys() & stubs.keys():
+            problems.extend(_compare(sources[name], stubs[name], namespace))
+
+    namespace = {}
+    exec(compile(files.get("application_commands/__init__.pyi", ""), "application_commands/__init__.pyi", "exec"), namespace)
+    for name in application_commands._EXPORTS:
+        if namespace.get(name) is not getattr(application_commands, name):
+            problems.append(f"application_commands/__init__.pyi: {name} is not exported")
+    return problems
+
+
+def main(arguments: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m discord_yg_types.stubs", description="Generates the flattened type stubs.")
+    parser.add_argument("directory", type=Path, help=f"where the {PACKAGE} directory is written")
+    parser.add_argument("--check", action="store_true", help="only check that the stubs are up to date and equivalent")
+    options = parser.parse_args(arguments)
+
+    files = generate_stubs()
+    problems = verify_stubs(files)
+    if options.check:
+        root = options.directory / PACKAGE
+        for path, text in files.items():
+            current = root / path
+            if not current.exists() or current.read_text(encoding="utf-8") != text:
+                problems.append(f"{current}: stale, run `python -m discord_yg_types.stubs {options.directory}`")
+    else:
+        write_stubs(options.directory)
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,292 @@
+"""Plans the minimal requests that make the commands of the server match \
+local definitions.
+
+Usage:
+```
+planner = SyncPlanner()
+plan = planner.plan(guild_id, desired, current)
+for command in plan.create:
+    ...  # POST command
+for command_id, patch in plan.update:
+    ...  # PATCH patch
+for command_id in plan.delete:
+    ...  # DELETE command_id
+planner.mark_synced(guild_id, desired)
+```
+"""
+
+import hashlib
+import json
+from .application_commands.ApplicationCommand import ApplicationCommand
+from .enums import ApplicationCommandTypes
+from .application_commands.PatchApplicationCommand import PatchApplicationCommand
+from .application_commands.PostApplicationCommand import PostApplicationCommand
+from .application_commands.PutGuildApplicationCommand import PutGuildApplicationCommand
+from typing import Any, Iterable, NamedTuple, Sequence
+from .typings import Snowflake
+
+
+SERVER_FIELDS = frozenset({
+    "id",
+    "application_id",
+    "version",
+    "guild_id",
+    "name_localized",
+    "description_localized",
+})
+"""Fields populated by the server, ignored when comparing."""
+
+RESET_VALUES: dict[str, Any] = {
+    "description": "",
+    "name_localizations": None,
+    "description_localizations": None,
+    "default_member_permissions": None,
+    "dm_permission": True,
+    "options": [],
+}
+"""Values sent in a PATCH to reset a field to its default."""
+
+CommandKey = tuple[int, str]
+"""(type, name). Unique among the commands of an application in a scope."""
+
+
+def _localizations(localizations: dict[str, str] | None) -> dict[str, str] | None:
+    return dict(sorted(localizations.items())) if localizations else None
+
+
+def _option(option: dict[str, Any]) -> dict[str, Any]:
+    """Normalizes an option. Defaults are dropped."""
+    normalized: dict[str, Any] = {
+        "type": int(option["type"]),
+        "name": option["name"],
+        "description": option.get("description", ""),
+    }
+    if option.get("required"):
+        normalized["required"] = True
+    for key in ("name_localizations", "description_localizations"):
+        localizations = _localizations(option.get(key))
+        if localizations:
+            normalized[key] = localizations
+    if option.get("autocomplete"):
+        normalized["autocomplete"] = True
+    if option.get("choices"):
+        normalized["choices"] = [_choice(choice) for choice in option["choices"]]
+    if option.get("channel_types"):
+        normalized["channel_types"] = sorted({int(channel_type) for channel_type in option["channel_types"]})
+    for key in ("min_value", "max_value", "min_length", "max_length"):
+        if option.get(key) is not None:
+            normalized[key] = option[key]
+    if option.get("options"):
+        normalized["options"] = [_option(child) for child in option["options"]]
+    return normalized
+
+
+def _choice(choice: dict[str, Any]) -> dict[str, Any]:
+    normalized = {"name": choice["name"], "value": choice["value"]}
+    localizations = _localizations(choice.get("name_localizations"))
+    if localizations:
+        normalized["name_localizations"] = localizations
+    return normalized
+
+
+def normalize_command(command: PostApplicationCommand | PutGuildApplicationCommand | ApplicationCommand) -> dict[str, Any]:
+    """Normalizes a local or a server command so that equal commands are \
+    equal dicts.
+
+    Server fields are dropped, defaults are dropped, localizations are \
+    sorted and `default_member_permissions` becomes an `int`.
+    """
+    command_type = int(command.get("type") or ApplicationCommandTypes.CHAT_INPUT)
+    normalized: dict[str, Any] = {"type": command_type, "name": command["name"]}
+    if command.get("description"):
+        normalized["description"] = command["description"]  # type: ignore
+    for key in ("name_localizations", "description_localizations"):
+        localizations = _localizations(command.get(key))  # type: ignore
+        if localizations:
+            normalized[key] = localizations
+    permissions = command.get("default_member_permissions")
+    if permissions is not None:
+        normalized["default_member_permissions"] = int(permissions)
+    if command.get("dm_permission") is False:
+        normalized["dm_permission"] = False
+    if command.get("options"):
+        normalized["options"] = [_option(option) for option in command["options"]]  # type: ignore
+    return normalized
+
+
+def _canonical(normalized: Any) -> str:
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _key(normalized: dict[str, Any]) -> CommandKey:
+    return normalized["type"], normalized["name"]
+
+
+class SyncPlan(NamedTuple):
+    """The requests that make the server match the local definitions."""
+
+    create: list[PostApplicationCommand]
+    """Commands to POST."""
+    update: list[tuple[Snowflake, PatchApplicationCommand]]
+    """(command ID, body) to PATCH."""
+    delete: list[Snowflake]
+    """IDs of the commands to DELETE."""
+
+    def __bool__(self) -> bool:
+        """Whether there is a request to make."""
+        return bool(self.create or self.update or self.delete)
+
+
+def _patch(desired: dict[str, Any], current: dict[str, Any]) -> PatchApplicationCommand:
+    """The fields of `desired` that differ from `current`, compared as \
+    canonical JSON like whole commands are. Fields missing from `desired` are \
+    reset."""
+    patch: dict[str, Any] = {"name": desired["name"]}
+    for key in sorted(desired.keys() | current.keys()):
+        if key in ("type", "name"):
+            continue
+        value = desired.get(key, RESET_VALUES.get(key))
+        if _canonical(value) != _canonical(current.get(key, RESET_VALUES.get(key))):
+            if key == "default_member_permissions" and value is not None:
+                value = str(value)
+            patch[key] = value
+    return patch  # type: ignore
+
+
+def _body(normalized: dict[str, Any]) -> PostApplicationCommand:
+    body = dict(normalized)
+    if "default_member_permissions" in body:
+        body["default_member_permissions"] = str(body["default_member_permissions"])
+    return body  # type: ignore
+
+
+class _Desired(NamedTuple):
+    commands: Sequence[PostApplicationCommand | PutGuildApplicationCommand]
+    """Kept so that its `id()` is not reused."""
+    normalized: dict[CommandKey, dict[str, Any]]
+    canonical: dict[CommandKey, str]
+    digest: str
+
+
+class SyncPlanner:
+    """Plans the minimal POST, PATCH and DELETE requests per guild.
+
+    The normalization of a list of local definitions is memoized by identity, \
+    so sharing one list between guilds normalizes it once. The memo keeps the \
+    `maxsize` lists used last. A guild whose definitions did not change since \
+    :meth:`mark_synced` is planned in O(1) when the server state is not given.
+    """
+
+    __slots__ = ("maxsize", "_desired", "_synced")
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        """Number of lists whose normalization is memoized."""
+        self._desired: dict[int, _Desired] = {}
+        """Normalized local definitions by `id()` of the list, least recently \
+        used first."""
+        self._synced: dict[Snowflake | None, str] = {}
+        """Digest of the definitions last synced by guild ID. `None` for \
+        global commands."""
+
+    def _normalize(self, commands: Sequence[PostApplicationCommand | PutGuildApplicationCommand]) -> _Desired:
+        desired = self._desired.pop(id(commands), None)
+        if desired is not None and desired.commands is commands:
+            self._desired[id(commands)] = desired
+            return desired
+
+        normalized: dict[CommandKey, dict[str, Any]] = {}
+        for command in commands:
+            command = normalize_command(command)
+            key = _key(command)
+            if key in normalized:
+                raise ValueError(f"Duplicate command {key[1]!r} of type {ApplicationCommandTypes(key[0]).name}.")
+            normalized[key] = command
+        canonical = {key: _canonical(command) for key, command in normalized.items()}
+        digest = hashlib.sha256("\n".join(sorted(canonical.values())).encode()).hexdigest()
+        if len(self._desired) >= self.maxsize:
+            del self._desired[next(iter(self._desired))]
+        desired = self._desired[id(commands)] = _Desired(commands, normalized, canonical, digest)
+        return desired
+
+    def forget(self, commands: Sequence[PostApplicationCommand | PutGuildApplicationCommand]) -> None:
+        """Drops the memoized normalization of `commands`. Call it after \
+        modifying the list in place or when the list is no longer used."""
+        self._desired.pop(id(commands), None)
+
+    def digest(self, commands: Sequence[PostApplicationCommand | PutGuildApplicationCommand]) -> str:
+        """A digest of the local definitions that ignores order and defaults."""
+        return self._normalize(commands).digest
+
+    def mark_synced(self, guild_id: Snowflake | None, commands: Sequence[PostApplicationCommand | PutGuildApplicationCommand]) -> None:
+        """Records that the server has `commands` for the guild (`None` for \
+        global commands)."""
+        self._synced[guild_id] = self._normalize(commands).digest
+
+    def plan(
+        self,
+        guild_id: Snowflake | None,
+        desired: Sequence[PostApplicationCommand | PutGuildApplicationCommand],
+        current: Iterable[ApplicationCommand] | None = None,
+    ) -> SyncPlan:
+        """Plans the requests that make the commands of the guild (`None` for \
+        global commands) match `desired`.
+
+        If `current` is `None`, the server is assumed to have the commands of \
+        the last :meth:`mark_synced`.
+
+        Raises:
+        - `ValueError` if `current` is `None` and `desired` differs from the \
+        commands of the last :meth:`mark_synced` of the guild (or the guild was \
+        never synced), or if `desired` has two commands with the same type and name.
+        """
+        wanted = self._normalize(desired)
+        if current is None:
+            if self._synced.get(guild_id) == wanted.digest:
+                return SyncPlan([], [], [])
+            raise ValueError("The commands of the server are required when `desired` differs from the commands last marked as synced for the guild.")
+
+        plan = plan_sync(wanted.normalized, current, wanted.canonical)
+        if not plan:
+            self._synced[guild_id] = wanted.digest
+        return plan
+
+
+def plan_sync(
+    desired: Iterable[PostApplicationCommand | PutGuildApplicationCommand] | dict[CommandKey, dict[str, Any]],
+    current: Iterable[ApplicationCommand],
+    canonical: dict[CommandKey, str] | None = None,
+) -> SyncPlan:
+    """Plans the requests that make `current`, the commands of the server, \
+    match `desired`.
+
+    Commands are matched by type and name. Server fields and defaults are \
+    ignored. A changed command is PATCHed with only the fields that differ; \
+    `name`, which is always sent, does not count as a change.
+    """
+    if not isinstance(desired, dict):
+        desired = {_key(command): command for command in map(normalize_command, desired)}  # type: ignore
+    if canonical is None:
+        canonical = {key: _canonical(command) for key, command in desired.items()}
+
+    create: list[PostApplicationCommand] = []
+    update: list[tuple[Snowflake, PatchApplicationCommand]] = []
+    delete: list[Snowflake] = []
+    seen: set[CommandKey] = set()
+    for command in current:
+        normalized = normalize_command(command)
+        key = _key(normalized)
+        wanted = desired.get(key)
+        if wanted is None or key in seen:
+            delete.append(command["id"])
+            continue
+        seen.add(key)
+        if _canonical(normalized) != canonical[key]:
+            patch = _patch(wanted, normalized)
+            if len(patch) > 1:
+                update.append((command["id"], patch))
+
+    for key, wanted in desired.items():
+        if key not in seen:
+            create.append(_body(wanted))
+    return SyncPlan(create, update, delete)
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""Pluggable HTTP transports for the requests to the API.
+
+A :class:`Transport` sends one request and returns its :class:`Response`. \
+:class:`HTTPTransport` is the real one: HTTP/1.1 over asyncio streams, with \
+a pool of keep-alive connections so that thousands of requests reuse a few \
+TLS connections. Load tests plug a stand-in transport instead.
+
+Usage:
+```
+transport = HTTPTransport(token)
+response = await transport.request("GET", f"/applications/{application_id}/commands")
+await transport.close()
+```
+"""
+
+import asyncio
+import ssl
+from collections.abc import Mapping
+from typing import NamedTuple, Protocol
+from urllib.parse import urlsplit
+
+
+API_URL = "https://discord.com/api/v10"
+
+
+class Response(NamedTuple):
+    status: int
+    """HTTP status code."""
+    headers: dict[str, str]
+    """Headers, by lowercase name."""
+    body: bytes
+
+
+class Transport(Protocol):
+    """Sends requests to the API."""
+
+    async def request(self, method: str, path: str, body: bytes | None = None, headers: Mapping[str, str] | None = None) -> Response:
+        """Sends a request to `path`, relative to the API URL.
+
+        Raises:
+        - `OSError` or `asyncio.TimeoutError` if the request could not be \
+        sent or answered, :class:`ProtocolError` included.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Closes the connections."""
+        ...
+
+
+class ProtocolError(OSError):
+    """The response is not valid HTTP/1.1."""
+
+
+class _StaleConnection(Exception):
+    """A pooled connection failed before any byte of the response, like \
+    when the server closed it while it was idle."""
+
+
+_Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class HTTPTransport:
+    """HTTP/1.1 transport with a pool of keep-alive connections.
+
+    At most `max_connections` requests are in flight at once; the others \
+    wait for a connection.
+    """
+
+    __slots__ = ("token", "timeout", "_host", "_port", "_prefix", "_ssl", "_idle", "_slots", "_user_agent")
+
+    def __init__(
+        self,
+        token: str,
+        url: str = API_URL,
+        max_connections: int = 16,
+        timeout: float = 30.0,
+        user_agent: str = "DiscordBot (https://github.com/Space-yg/discord.yg-types, 0.1.0)",
+    ) -> None:
+        self.token = token
+        """Token of the bot, sent as `Authorization: Bot <token>`."""
+        self.timeout = timeout
+        """Seconds to wait for a response."""
+        parts = urlsplit(url)
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._prefix = parts.path.rstrip("/")
+        """Path of the API URL, prepended to every path."""
+        self._ssl: ssl.SSLContext | None = ssl.create_default_context() if parts.scheme == "https" else None
+        self._idle: list[_Connection] = []
+        """Open connections waiting for a request."""
+        self._slots = asyncio.Semaphore(max_connections)
+        self._user_agent = user_agent
+
+    async def request(self, method: str, path: str, body: bytes | None = None, headers: Mapping[str, str] | None = None) -> Response:
+        """Sends a request to `path`, relative to the API URL.
+
+        A pooled connection that fails before any byte of the response is \
+        retried once on a new connection. A timeout is never retried, as the \
+        request may have been processed.
+
+        Raises:
+        - `OSError` or `asyncio.TimeoutError` if the request could not be \
+        sent or answered, :class:`ProtocolError` included.
+        """
+        async with self._slots:
+            if self._idle:
+                connection = self._idle.pop()
+                try:
+                    return await self._exchange(connection, method, path, body, headers, True)
+                except _StaleConnection:
+                    pass
+            connection = await asyncio.wait_for(asyncio.open_connection(self._host, self._port, ssl=self._ssl), self.timeout)
+            return await self._exchange(connection, method, path, body, headers, False)
+
+    async def _exchange(self, connection: _Connection, method: str, path: str, body: bytes | None, headers: Mapping[str, str] | None, pooled: bool) -> Response:
+        """Sends the request on `connection` within the timeout, and closes \
+        the connection on failure."""
+        try:
+            return await asyncio.wait_for(self._send(connection, method, path, body, headers, pooled), self.timeout)
+        except BaseException:
+            connection[1].close()
+            raise
+
+    async def _send(self, connection: _Connection, method: str, path: str, body: bytes | None, headers: Mapping[str, str] | None, pooled: bool) -> Response:
+        """Raises :class:`_StaleConnection` if a `pooled` connection fails \
+        before any byte of the response."""
+        reader, writer = connection
+        lines = [
+            f"{method} {self._prefix}{path} HTTP/1.1",
+            f"Host: {self._host}",
+            f"Authorization: Bot {self.token}",
+            f"User-Agent: {self._user_agent}",
+            f"Content-Length: {len(body) if body is not None else 0}",
+        ]
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        if headers:
+            lines.extend(f"{name}: {value}" for name, value in headers.items())
+        try:
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+            await writer.drain()
+            status_line = await reader.readline()
+        except TimeoutError:
+            raise
+        except OSError:
+            if pooled:
+                raise _StaleConnection() from None
+            raise
+        if not status_line:
+            if pooled:
+                raise _StaleConnection()
+            raise ProtocolError("The connection was closed before the response.")
+        try:
+            return await self._read(connection, method, status_line)
+        except (ValueError, IndexError, EOFError) as error:
+            raise ProtocolError(f"Invalid response: {error}") from error
+
+    async def _read(self, connection: _Connection, method: str, status_line: bytes) -> Response:
+        """Reads the rest of the response.
+
+        Raises:
+        - `ValueError`, `IndexError` or `EOFError` if the response is not \
+        valid HTTP/1.1 or is cut short.
+        """
+        reader, writer = connection
+        status = int(status_line.split(None, 2)[1])
+        response_headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            response_body = b"".join(chunks)
+        elif "content-length" in response_headers:
+            response_body = await reader.readexactly(int(response_headers["content-length"]))
+        elif status in (204, 304) or method == "HEAD":
+            response_body = b""
+        else:
+            response_body = await reader.read()
+            keep_alive = False
+
+        if keep_alive:
+            self._idle.append(connection)
+        else:
+            writer.close()
+        return Response(status, response_headers, response_body)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import Literal, TypeVar
+from .restrictions import Length, Lowercase, Pattern
+from typing import Annotated, Literal, TypeVar
 
 Snowflake = str
 """A unique identifier.
@@ -6,7 +7,7 @@ Snowflake = str
 https://discord.com/developers/docs/reference#snowflakes
 """
 
-ApplicationCommandName = str
+ApplicationCommandName = Annotated[str, Pattern(r"^[-\w]{1,32}$"), Lowercase()]
 """An Application Command name.
 
 Restrictions:
@@ -16,6 +17,13 @@ Restrictions:
 https://discord.com/developers/docs/interactions/application-commands#application-command-object-application-command-naming
 """
 
+Description = Annotated[str, Length(1, 100)]
+"""A description of an Application Command or an Application Command Option.
+
+Restrictions:
+- 1-100 characters.
+"""
+
 _VT = TypeVar("_VT")
 """Value type."""
 
@@ -0,0 +1,341 @@
+"""Compiled validators for the TypedDicts.
+
+Every TypedDict is compiled once into a specialized Python function that \
+checks a payload against the types and the :mod:`restrictions` of its \
+fields. The compiled functions are cached per class.
+
+Usage:
+```
+errors = validate(payload, PostApplicationCommand)
+if errors:
+    print(*errors, sep="\\n")
+```
+"""
+
+import re
+from enum import Enum, IntFlag
+from .restrictions import Length, Lowercase, MaxItems, OnlyFor, Pattern, Range, RequiredFirst
+from types import NoneType, UnionType
+from typing import Annotated, Any, Callable, Literal, Union, get_args, get_origin, get_type_hints, is_typeddict
+
+
+class ValidationError(ValueError):
+    """A restriction that a payload does not follow."""
+
+    path: str
+    """Where the error is in the payload. For example `options[0].choices[3].name`."""
+    message: str
+    """What is wrong."""
+
+    def __init__(self, path: str, message: str) -> None:
+        super().__init__(f"{path or '<root>'}: {message}")
+        self.path = path
+        self.message = message
+
+
+Validator = Callable[[Any, str, list[ValidationError]], None]
+"""A compiled validator. Takes the payload, the path of the payload, and \
+the list where the errors are appended."""
+
+_validators: dict[type | tuple[type, bool], Validator] = {}
+"""Compiled validators by TypedDict class, and shallow validators by \
+(class, `True`)."""
+
+_namespace: dict[str, Any] = {"ValidationError": ValidationError}
+"""Globals of the generated code."""
+
+
+def _join(path: str, key: str) -> str:
+    """Path of `key` inside of `path`."""
+    return f"{path}.{key}" if path else key
+
+
+def _index(path: str, index: int) -> str:
+    """Path of the item at `index` of the list at `path`."""
+    return f"{path}[{index}]"
+
+
+_namespace["_join"] = _join
+_namespace["_index"] = _index
+
+
+class _Compiler:
+    """Generates the source of the validator of one TypedDict class."""
+
+    def __init__(self, cls: type, shallow: bool) -> None:
+        self.cls = cls
+        self.shallow = shallow
+        self.lines: list[str] = []
+        self.constants = 0
+        self.variables = 0
+        self.dependencies: list[type] = []
+
+    def constant(self, value: Any) -> str:
+        """Stores `value` in the namespace and returns its name."""
+        name = f"_c{id(self):x}_{self.constants}"
+        self.constants += 1
+        _namespace[name] = value
+        return name
+
+    def variable(self) -> str:
+        """Returns a new local variable name."""
+        self.variables += 1
+        return f"v{self.variables}"
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent: int, path: str, message: str) -> None:
+        """Emits the code that appends an error. `path` and `message` are \
+        expressions."""
+        self.emit(indent, f"errors.append(ValidationError({path}, {message}))")
+
+    def check(self, annotation: Any, value: str, path: str, indent: int) -> None:
+        """Emits the code that checks `value` against `annotation`.
+
+        `path` is an expression evaluated only if there is an error.
+        """
+        markers: tuple[Any, ...] = ()
+        if get_origin(annotation) is Annotated:
+            markers = annotation.__metadata__
+            annotation = get_args(annotation)[0]
+
+        origin = get_origin(annotation)
+
+        if origin is Union or origin is UnionType:
+            arguments = get_args(annotation)
+            if NoneType in arguments:
+                rest = tuple(argument for argument in arguments if argument is not NoneType)
+                rest = Union[rest] if len(rest) > 1 else rest[0]  # type: ignore
+                self.emit(indent, f"if {value} is not None:")
+                self.check(Annotated[rest, *markers] if markers else rest, value, path, indent + 1)
+            else:
+                self.check_union(arguments, markers, value, path, indent)
+        elif origin is Literal:
+            values = self.constant(frozenset(get_args(annotation)))
+            self.emit(indent, f"if {value} not in {values}:")
+            self.error(indent + 1, path, repr(f"must be one of {list(get_args(annotation))!r}"))
+        elif origin is list:
+            self.check_list(get_args(annotation)[0], markers, value, path, indent)
+        elif origin is dict:
+            self.check_dict(*get_args(annotation), value, path, indent)
+        elif is_typeddict(annotation):
+            if self.shallow:
+                self.emit(indent, "pass")
+            else:
+                self.dependencies.append(annotation)
+                self.emit(indent, f"{_function_name(annotation)}({value}, {path}, errors)")
+        else:
+            self.emit(indent, f"if not ({self.test(annotation, value)}):")
+            self.error(indent + 1, path, repr(f"must be {_describe(annotation)}"))
+            if markers:
+                self.emit(indent, "else:")
+                self.check_markers(markers, value, path, indent + 1)
+
+    def test(self, annotation: Any, value: str) -> str:
+        """Boolean expression testing whether `value` is of the scalar type \
+        `annotation`."""
+        if annotation is bool:
+            return f"{value} is True or {value} is False"
+        if annotation is int:
+            return f"type({value}) is int or isinstance({value}, int) and not isinstance({value}, bool)"
+        if annotation is float:
+            return f"type({value}) is float or isinstance({value}, (int, float)) and not isinstance({value}, bool)"
+        if annotation is str:
+            return f"isinstance({value}, str)"
+        if isinstance(annotation, type) and issubclass(annotation, IntFlag):
+            mask = 0
+            for member in annotation:
+                mask |= member.value
+            return f"isinstance({value}, int) and not isinstance({value}, bool) and not {value} & {~mask}"
+        if isinstance(annotation, type) and issubclass(annotation, Enum):
+            if not len(annotation):
+                # Enums of helpers only, like ApplicationCommandPermissionConstant
+                return "False"
+            values = self.constant(frozenset(member.value for member in annotation))
+            return f"isinstance({value}, {self.constant(type(next(iter(annotation)).value))}) and {value} in {values}"
+        if annotation is Any:
+            return "True"
+        raise TypeError(f"Cannot compile a validator for {annotation!r}.")
+
+    def check_union(self, arguments: tuple[Any, ...], markers: tuple[Any, ...], value: str, path: str, indent: int) -> None:
+        """Emits the checks of a union of scalar types, with the restrictions \
+        of the union and of the matching type."""
+        keyword = "if"
+        for argument in arguments:
+            own = markers
+            if get_origin(argument) is Annotated:
+                own += argument.__metadata__
+                argument = get_args(argument)[0]
+            self.emit(indent, f"{keyword} {self.test(argument, value)}:")
+            self.check_markers(own, value, path, indent + 1)
+            keyword = "elif"
+        self.emit(indent, "else:")
+        self.error(indent + 1, path, repr(f"must be {' or '.join(_describe(argument) for argument in arguments)}"))
+
+    def check_markers(self, markers: tuple[Any, ...], value: str, path: str, indent: int) -> None:
+        """Emits the checks of the restrictions of a scalar."""
+        start = len(self.lines)
+        for marker in markers:
+            if isinstance(marker, Length):
+                condition = f"len({value}) < {marker.min}"
+                if marker.max is not None:
+                    condition = f"not {marker.min} <= len({value}) <= {marker.max}"
+                self.emit(indent, f"if {condition}:")
+                bounds = f"{marker.min}-{marker.max}" if marker.max is not None else f"at least {marker.min}"
+                self.error(indent + 1, path, repr(f"must be {bounds} characters"))
+            elif isinstance(marker, Range):
+                conditions = []
+                if marker.min is not None:
+                    conditions.append(f"{value} < {marker.min!r}")
+                if marker.max is not None:
+                    conditions.append(f"{value} > {marker.max!r}")
+                self.emit(indent, f"if {' or '.join(conditions)}:")
+                self.error(indent + 1, path, repr(f"must be between {marker.min} and {marker.max}"))
+            elif isinstance(marker, Pattern):
+                regex = self.constant(re.compile(marker.regex).match)
+                self.emit(indent, f"if {regex}({value}) is None:")
+                self.error(indent + 1, path, repr(f"must match {marker.regex}"))
+            elif isinstance(marker, Lowercase):
+                self.emit(indent, f"if {value}.lower() != {value}:")
+                self.error(indent + 1, path, repr("must be lowercase"))
+        if len(self.lines) == start:
+            self.emit(indent, "pass")
+
+    def check_list(self, item: Any, markers: tuple[Any, ...], value: str, path: str, indent: int) -> None:
+        self.emit(indent, f"if type({value}) is not list:")
+        self.error(indent + 1, path, repr("must be a list"))
+        self.emit(indent, "else:")
+        indent += 1
+        for marker in markers:
+            if isinstance(marker, MaxItems):
+                self.emit(indent, f"if len({value}) > {marker.max}:")
+                self.error(indent + 1, path, repr(f"must have at most {marker.max} items"))
+            elif isinstance(marker, RequiredFirst):
+                optional = self.variable()
+                self.emit(indent, f"{optional} = False")
+                self.emit(indent, f"for {optional}_i, {optional}_o in enumerate({value}):")
+                self.emit(indent + 1, f"if type({optional}_o) is dict:")
+                self.emit(indent + 2, f"if {optional}_o.get('required') is True:")
+                self.emit(indent + 3, f"if {optional}:")
+                self.error(indent + 4, f"_index({path}, {optional}_i)", repr("required options must be listed before optional options"))
+                self.emit(indent + 4, "break")
+                self.emit(indent + 2, "else:")
+                self.emit(indent + 3, f"{optional} = True")
+        index = self.variable()
+        element = self.variable()
+        self.emit(indent, f"for {index}, {element} in enumerate({value}):")
+        self.check(item, element, f"_index({path}, {index})", indent + 1)
+
+    def check_dict(self, key: Any, item: Any, value: str, path: str, indent: int) -> None:
+        self.emit(indent, f"if type({value}) is not dict:")
+        self.error(indent + 1, path, repr("must be an object"))
+        self.emit(indent, "else:")
+        indent += 1
+        name = self.variable()
+        element = self.variable()
+        self.emit(indent, f"for {name}, {element} in {value}.items():")
+        if get_origin(key) is Literal:
+            keys = self.constant(frozenset(get_args(key)))
+            self.emit(indent + 1, f"if {name} not in {keys}:")
+            self.error(indent + 2, f"_join({path}, {name})", repr("is not a valid key"))
+            self.emit(indent + 2, "continue")
+        self.check(item, element, f"_join({path}, {name})", indent + 1)
+
+    def compile(self) -> str:
+        hints = get_type_hints(self.cls, include_extras=True)
+        required: frozenset[str] = self.cls.__required_keys__  # type: ignore
+
+        self.emit(0, f"def {_function_name(self.cls, self.shallow)}(obj, path, errors):")
+        self.emit(1, "if type(obj) is not dict:")
+        self.error(2, "path", repr("must be an object"))
+        self.emit(2, "return")
+        if "type" in hints:
+            self.emit(1, "type_ = obj.get('type')")
+
+        for key, annotation in hints.items():
+            path = f"_join(path, {key!r})"
+            self.emit(1, f"value = obj.get({key!r}, obj)")
+            if key in required:
+                self.emit(1, "if value is obj:")
+                self.error(2, path, repr("is required"))
+                self.emit(1, "else:")
+            else:
+                self.emit(1, "if value is not obj:")
+
+            only = [marker for marker in _metadata(annotation) if isinstance(marker, OnlyFor)]
+            if only and "type" in hints:
+                types = self.constant(frozenset(only[0].types))
+                self.emit(2, f"if type_ is not None and type_ not in {types}:")
+                self.error(3, path, repr(f"is only for type {' or '.join(getattr(type_, 'name', str(type_)) for type_ in only[0].types)}"))
+            self.check(annotation, "value", path, 2)
+        return "\n".join(self.lines)
+
+
+def _metadata(annotation: Any) -> tuple[Any, ...]:
+    """The `Annotated` metadata of `annotation`, or of the non-`None` part \
+    of an optional."""
+    if get_origin(annotation) in (Union, UnionType):
+        for argument in get_args(annotation):
+            if get_origin(argument) is Annotated:
+                return argument.__metadata__
+    if get_origin(annotation) is Annotated:
+        return annotation.__metadata__
+    return ()
+
+
+def _describe(annotation: Any) -> str:
+    """Human readable name of a scalar type."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    return {bool: "a boolean", int: "an integer", float: "a number", str: "a string"}.get(
+        annotation, f"a valid {getattr(annotation, '__name__', annotation)}"
+    )
+
+
+def _function_name(cls: type, shallow: bool = False) -> str:
+    return f"_validate_{cls.__name__}_{id(cls):x}{'_shallow' if shallow else ''}"
+
+
+def compile_validator(cls: type, shallow: bool = False) -> Validator:
+    """Compiles the validator of a TypedDict class and of all the TypedDicts \
+    it contains. The validators are cached, so compiling a class twice returns \
+    the same function.
+
+    A `shallow` validator does not validate the TypedDicts contained in the \
+    payload, but still checks the restrictions of the lists holding them.
+
+    Raises:
+    - `TypeError` if `cls` is not a TypedDict or has a field that cannot be \
+    validated.
+    """
+    key = (cls, True) if shallow else cls
+    validator = _validators.get(key)  # type: ignore
+    if validator is not None:
+        return validator
+    if not is_typeddict(cls):
+        raise TypeError(f"{cls!r} is not a TypedDict.")
+
+    compiler = _Compiler(cls, shallow)
+    source = compiler.compile()
+    exec(compile(source, f"<validator {cls.__name__}>", "exec"), _namespace)
+    validator = _validators[key] = _namespace[_function_name(cls, shallow)]  # type: ignore
+    validator.__source__ = source  # type: ignore
+    for dependency in compiler.dependencies:
+        compile_validator(dependency)
+    return validator
+
+
+def validate(payload: Any, cls: type) -> list[ValidationError]:
+    """Validates `payload` against the TypedDict `cls`.
+
+    Returns the errors found. An empty list means the payload is valid.
+    """
+    errors: list[ValidationError] = []
+    (_validators.get(cls) or compile_validator(cls))(payload, "", errors)
+    return errors
+
+
+def is_valid(payload: Any, cls: type) -> bool:
+    """Whether `payload` follows all the restrictions of the TypedDict `cls`."""
+    return not validate(payload, cls)
\ No newline at end of file
@@ -0,0 +1,248 @@
+"""Lazy read-only views over raw JSON payloads.
+
+A :class:`PayloadView` reads like the dict of a TypedDict, but keeps the \
+payload as text and decodes only what is read. The members of the object \
+are located on first access, one after the other until the requested key \
+is found, so reading the `id`, `name` and `version` of a command usually \
+never touches its `options`. Objects and lists are skipped by matching \
+their brackets with a regular expression, without building them, so only \
+their nesting is checked until they are read. `options`, `choices` and `permissions` are decoded \
+into lists of views when read; other objects and lists are decoded when \
+read. Decoded values are cached.
+
+Views share the text of the payload and only store offsets into it. A \
+`bytes` payload is decoded into text once, by :func:`view`.
+
+Usage:
+```
+commands = view(response_body)
+ids = {command["name"]: command["id"] for command in commands}
+commands[0]["options"][0]["choices"][0]["value"]
+```
+"""
+
+import re
+from collections.abc import Mapping
+from .decoding import object_hook
+from .fingerprints import CHILD_KEYS
+from json import JSONDecodeError, JSONDecoder
+from json.decoder import scanstring
+from json.scanner import make_scanner
+from typing import Any, Iterator
+
+
+VIEW_KEYS = CHILD_KEYS | {"permissions"}
+"""Keys of the lists of objects decoded into lists of views."""
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_BETWEEN_BRACKETS_PATTERN = r'[^"\[\]{}]*+(?:"[^"\\]*+(?:\\.[^"\\]*+)*+"[^"\[\]{}]*+)*+'
+_BETWEEN_BRACKETS = re.compile(_BETWEEN_BRACKETS_PATTERN, re.DOTALL)
+"""Everything up to the next bracket outside of a string, strings included."""
+_CLOSING = {"{": "}", "[": "]"}
+
+_NESTED_DEPTH = 16
+
+
+def _nested_pattern(depth: int) -> str:
+    """An object or a list nested at most `depth` deep. Regular \
+    expressions cannot count, so every level is spelled out, and the kind \
+    of the brackets is not matched."""
+    content = _BETWEEN_BRACKETS_PATTERN
+    for _ in range(depth - 1):
+        content = rf"{_BETWEEN_BRACKETS_PATTERN}(?:[\[{{]{content}[\]}}]{_BETWEEN_BRACKETS_PATTERN})*+"
+    return rf"[\[{{]{content}[\]}}]"
+
+
+_NESTED = re.compile(_nested_pattern(_NESTED_DEPTH), re.DOTALL)
+"""Skips an object or a list in one match, without a Python loop per \
+bracket. Commands nest at most about 10 deep."""
+_scan = make_scanner(JSONDecoder())
+"""Decodes the JSON value starting at an index, and returns it with the \
+index where it ends."""
+_scan_structs = make_scanner(JSONDecoder(object_hook=object_hook))
+"""Like `_scan`, building :mod:`~discord_yg_types.structs`."""
+
+
+def _decode_value(text: str, position: int) -> tuple[Any, int]:
+    """The JSON value starting at `position`, and the index where it ends."""
+    try:
+        return _scan(text, position)
+    except StopIteration as error:
+        raise JSONDecodeError("Expecting value", text, error.value) from None
+
+
+def _skip(text: str, position: int) -> int:
+    """The index where the object or list starting at `position` ends. It \
+    is not decoded: only its brackets and strings are matched.
+
+    Raises:
+    - `json.JSONDecodeError` if the brackets do not match.
+    """
+    match = _NESTED.match(text, position)
+    if match is not None:
+        return match.end()
+    # Nested deeper than `_NESTED_DEPTH`, or invalid: the brackets are matched one by one
+    expected = [_CLOSING[text[position]]]
+    between = _BETWEEN_BRACKETS.match
+    while True:
+        position = between(text, position + 1).end()  # type: ignore
+        character = text[position:position + 1]
+        if not character or character == '"':
+            raise JSONDecodeError(f"Expecting {expected[-1]!r}", text, position)
+        if character in _CLOSING:
+            expected.append(_CLOSING[character])
+        elif character != expected.pop():
+            raise JSONDecodeError("Mismatched bracket", text, position)
+        elif not expected:
+            return position + 1
+
+
+class PayloadView(Mapping[str, Any]):
+    """Read-only view of a JSON object, decoded lazily."""
+
+    __slots__ = ("_text", "_start", "_position", "_offsets", "_values")
+
+    def __init__(self, text: str, start: int = 0) -> None:
+        """View of the object starting at `start` in `text`.
+
+        Raises:
+        - `json.JSONDecodeError` if there is no object at `start`.
+        """
+        start = _WHITESPACE.match(text, start).end()  # type: ignore
+        if text[start:start + 1] != "{":
+            raise JSONDecodeError("Expecting '{'", text, start)
+        self._text = text
+        """The whole payload."""
+        self._start = start
+        """Index of the `{` of the object."""
+        self._position = start + 1
+        """Index where the next member starts, `-1` once every member is \
+        located."""
+        self._offsets: dict[str, int] = {}
+        """Index where the value starts, by located key, in order."""
+        self._values: dict[str, Any] = {}
+        """Decoded value by key."""
+
+    def _next(self) -> str | None:
+        """Locates the next member. Scalars are decoded right away, objects \
+        and lists are skipped. Returns the key, or `None` if there is no \
+        member left."""
+        text = self._text
+        position = _WHITESPACE.match(text, self._position).end()  # type: ignore
+        character = text[position:position + 1]
+        if character == "}":
+            self._position = -1
+            return None
+        if self._offsets:
+            if character != ",":
+                raise JSONDecodeError("Expecting ',' delimiter", text, position)
+            position = _WHITESPACE.match(text, position + 1).end()  # type: ignore
+            character = text[position:position + 1]
+        if character != '"':
+            raise JSONDecodeError("Expecting property name enclosed in double quotes", text, position)
+        key, position = scanstring(text, position + 1)
+        position = _WHITESPACE.match(text, position).end()  # type: ignore
+        if text[position:position + 1] != ":":
+            raise JSONDecodeError("Expecting ':' delimiter", text, position)
+        position = _WHITESPACE.match(text, position + 1).end()  # type: ignore
+        self._offsets[key] = position
+        if text[position:position + 1] in _CLOSING:
+            self._position = _skip(text, position)
+        else:
+            self._values[key], self._position = _decode_value(text, position)
+        return key
+
+    def _locate(self, key: str) -> int | None:
+        """Index where the value of `key` starts, `None` if it is missing."""
+        offset = self._offsets.get(key)
+        while offset is None and self._position >= 0:
+            if self._next() == key:
+                offset = self._offsets[key]
+        return offset
+
+    def _locate_all(self) -> None:
+        while self._position >= 0:
+            self._next()
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key in values:
+            return values[key]
+        offset = self._locate(key)
+        if offset is None:
+            raise KeyError(key)
+        if key in values:
+            return values[key]
+        if key in VIEW_KEYS and self._text[offset] == "[":
+            value = _views(self._text, offset)
+        else:
+            value = _decode_value(self._text, offset)[0]
+        values[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._locate(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        self._locate_all()
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        self._locate_all()
+        return len(self._offsets)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decodes the whole object."""
+        return _decode_value(self._text, self._start)[0]
+
+    def to_struct(self) -> Any:
+        """Decodes the whole object into a struct, like \
+        :func:`~decoding.decode` does."""
+        try:
+            return _scan_structs(self._text, self._start)[0]
+        except StopIteration as error:
+            raise JSONDecodeError("Expecting value", self._text, error.value) from None
+
+    def __repr__(self) -> str:
+        return f"PayloadView({self.to_dict()!r})"
+
+
+def _views(text: str, position: int) -> list[Any]:
+    """Views of the objects of the list starting at `position`. Other \
+    values are decoded."""
+    items: list[Any] = []
+    position = _WHITESPACE.match(text, position + 1).end()  # type: ignore
+    if text[position:position + 1] == "]":
+        return items
+    while True:
+        if text[position:position + 1] == "{":
+            items.append(PayloadView(text, position))
+            position = _skip(text, position)
+        else:
+            value, position = _decode_value(text, position)
+            items.append(value)
+        position = _WHITESPACE.match(text, position).end()  # type: ignore
+        character = text[position:position + 1]
+        if character == "]":
+            return items
+        if character != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", text, position)
+        position = _WHITESPACE.match(text, position + 1).end()  # type: ignore
+
+
+def view(data: bytes | bytearray | memoryview | str) -> Any:
+    """View of a JSON payload: a :class:`PayloadView` for an object, a list \
+    of views for a list of objects.
+
+    Raises:
+    - `json.JSONDecodeError` if `data` is not valid JSON.
+    - `UnicodeDecodeError` if `data` is not valid UTF-8.
+    """
+    text = data if isinstance(data, str) else str(data, "utf-8")
+    position = _WHITESPACE.match(text).end()  # type: ignore
+    character = text[position:position + 1]
+    if character == "{":
+        return PayloadView(text, position)
+    if character == "[":
+        return _views(text, position)
+    return _decode_value(text, position)[0]
\ No newline at end of file
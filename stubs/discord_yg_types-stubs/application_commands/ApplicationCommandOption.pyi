@@ -0,0 +1,137 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.application_commands.ApplicationCommandOptionChoice import ApplicationCommandOptionChoice, ApplicationCommandOptionChoiceForInteger, ApplicationCommandOptionChoiceForNumber, ApplicationCommandOptionChoiceForString
+from discord_yg_types.enums import ApplicationCommandOptionTypes, ChannelTypes
+from discord_yg_types.restrictions import MaxItems, OnlyFor, Range, RequiredFirst
+from discord_yg_types.typings import ApplicationCommandName, Description, Locales
+from typing import Annotated, Literal, NotRequired, TypedDict
+
+
+class ApplicationCommandBooleanOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.BOOLEAN]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+
+
+class ApplicationCommandUserOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.USER]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+
+
+class ApplicationCommandRoleOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.ROLE]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+
+
+class ApplicationCommandMentionableOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.MENTIONABLE]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+
+
+class ApplicationCommandAttachmentOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.ATTACHMENT]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+
+
+class ApplicationCommandIntegerOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.INTEGER]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    autocomplete: NotRequired[Annotated[bool, OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    choices: NotRequired[Annotated[list[ApplicationCommandOptionChoiceForInteger], MaxItems(25)]]
+    min_value: NotRequired[Annotated[int, Range(-9007199254740992, 9007199254740992)]]
+    max_value: NotRequired[Annotated[int, Range(-9007199254740992, 9007199254740992)]]
+
+
+class ApplicationCommandStringOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.STRING]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    autocomplete: NotRequired[Annotated[bool, OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    choices: NotRequired[Annotated[list[ApplicationCommandOptionChoiceForString], MaxItems(25)]]
+    min_length: NotRequired[Annotated[int, Range(0, 6000)]]
+    max_length: NotRequired[Annotated[int, Range(0, 6000)]]
+
+
+class ApplicationCommandChannelOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.CHANNEL]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    channel_types: NotRequired[list[ChannelTypes]]
+
+
+class ApplicationCommandNumberOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.NUMBER]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    autocomplete: NotRequired[Annotated[bool, OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    choices: NotRequired[Annotated[list[ApplicationCommandOptionChoiceForNumber], MaxItems(25)]]
+    min_value: NotRequired[Annotated[float, Range(-9007199254740992, 9007199254740992)]]
+    max_value: NotRequired[Annotated[float, Range(-9007199254740992, 9007199254740992)]]
+
+
+class ApplicationCommandOption(TypedDict):
+    type: ApplicationCommandOptionTypes
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    autocomplete: NotRequired[Annotated[bool, OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandOptionTypes.SUB_COMMAND, ApplicationCommandOptionTypes.SUB_COMMAND_GROUP)]]
+    choices: NotRequired[Annotated[list[ApplicationCommandOptionChoice], MaxItems(25), OnlyFor(ApplicationCommandOptionTypes.STRING, ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    channel_types: NotRequired[Annotated[list[ChannelTypes], OnlyFor(ApplicationCommandOptionTypes.CHANNEL)]]
+    min_value: NotRequired[Annotated[int | float, Range(-9007199254740992, 9007199254740992), OnlyFor(ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    max_value: NotRequired[Annotated[int | float, Range(-9007199254740992, 9007199254740992), OnlyFor(ApplicationCommandOptionTypes.INTEGER, ApplicationCommandOptionTypes.NUMBER)]]
+    min_length: NotRequired[Annotated[int, Range(0, 6000), OnlyFor(ApplicationCommandOptionTypes.STRING)]]
+    max_length: NotRequired[Annotated[int, Range(0, 6000), OnlyFor(ApplicationCommandOptionTypes.STRING)]]
+
+
+class ApplicationCommandSubCommandOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.SUB_COMMAND]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[bool]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst()]]
+
+
+class ApplicationCommandSubCommandGroupOption(TypedDict):
+    type: Literal[ApplicationCommandOptionTypes.SUB_COMMAND_GROUP]
+    name: ApplicationCommandName
+    description: Description
+    required: NotRequired[Literal[True]]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    description_localizations: NotRequired[Locales[Description] | None]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst()]]
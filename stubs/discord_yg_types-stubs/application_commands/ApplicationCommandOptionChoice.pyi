@@ -0,0 +1,28 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.restrictions import Length
+from discord_yg_types.typings import Description, Locales
+from typing import Annotated, NotRequired, TypedDict
+
+
+class ApplicationCommandOptionChoice(TypedDict):
+    name: Description
+    value: Annotated[str, Length(0, 100)] | int | float
+    name_localizations: NotRequired[Locales[Description]]
+
+
+class ApplicationCommandOptionChoiceForString(TypedDict):
+    name: Description
+    value: Annotated[str, Length(0, 100)]
+    name_localizations: NotRequired[Locales[Description]]
+
+
+class ApplicationCommandOptionChoiceForInteger(TypedDict):
+    name: Description
+    value: int
+    name_localizations: NotRequired[Locales[Description]]
+
+
+class ApplicationCommandOptionChoiceForNumber(TypedDict):
+    name: Description
+    value: float
+    name_localizations: NotRequired[Locales[Description]]
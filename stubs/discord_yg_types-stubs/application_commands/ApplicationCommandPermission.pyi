@@ -0,0 +1,9 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.enums import ApplicationCommandPermissionConstant, ApplicationCommandPermissionType
+from typing import TypedDict
+
+
+class ApplicationCommandPermission(TypedDict):
+    id: str | ApplicationCommandPermissionConstant
+    type: ApplicationCommandPermissionType
+    permission: bool
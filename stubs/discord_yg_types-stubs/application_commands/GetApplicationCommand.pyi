@@ -0,0 +1,49 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.application_commands.ApplicationCommandOption import ApplicationCommandOption
+from discord_yg_types.enums import ApplicationCommandTypes, Permissions
+from discord_yg_types.restrictions import Length, MaxItems, OnlyFor, RequiredFirst
+from discord_yg_types.typings import ApplicationCommandName, Description, Locales
+from typing import Annotated, NotRequired, TypedDict
+
+
+class GetApplicationCommandWithLocalizations(TypedDict):
+    id: str
+    application_id: str
+    version: str
+    name: ApplicationCommandName
+    description: Annotated[str, Length(0, 100)]
+    guild_id: NotRequired[str]
+    type: NotRequired[ApplicationCommandTypes]
+    default_member_permissions: NotRequired[Permissions | None]
+    name_localizations: NotRequired[Locales[ApplicationCommandName]]
+    description_localizations: NotRequired[Locales[Description]]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]]
+
+
+class GetApplicationCommandWithoutLocalizations(TypedDict):
+    id: str
+    application_id: str
+    version: str
+    name: ApplicationCommandName
+    description: Annotated[str, Length(0, 100)]
+    guild_id: NotRequired[str]
+    type: NotRequired[ApplicationCommandTypes]
+    default_member_permissions: NotRequired[Permissions | None]
+    name_localized: NotRequired[ApplicationCommandName]
+    description_localized: NotRequired[str]
+
+
+class GetApplicationCommand(TypedDict):
+    id: str
+    application_id: str
+    version: str
+    name: ApplicationCommandName
+    description: Annotated[str, Length(0, 100)]
+    guild_id: NotRequired[str]
+    type: NotRequired[ApplicationCommandTypes]
+    default_member_permissions: NotRequired[Permissions | None]
+    name_localized: NotRequired[ApplicationCommandName]
+    description_localized: NotRequired[str]
+    name_localizations: NotRequired[Locales[ApplicationCommandName]]
+    description_localizations: NotRequired[Locales[Description]]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]]
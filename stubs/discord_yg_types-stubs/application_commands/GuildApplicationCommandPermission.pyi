@@ -0,0 +1,11 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.application_commands.ApplicationCommandPermission import ApplicationCommandPermission
+from discord_yg_types.restrictions import MaxItems
+from typing import Annotated, TypedDict
+
+
+class GuildApplicationCommandPermission(TypedDict):
+    id: str
+    application_id: str
+    guild_id: str
+    permissions: Annotated[list[ApplicationCommandPermission], MaxItems(100)]
@@ -0,0 +1,40 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.application_commands.ApplicationCommandOption import ApplicationCommandOption
+from discord_yg_types.enums import ApplicationCommandTypes, Permissions
+from discord_yg_types.restrictions import MaxItems, OnlyFor, RequiredFirst
+from discord_yg_types.typings import ApplicationCommandName, Description, Locales
+from typing import Annotated, NotRequired, TypedDict
+
+
+class PatchApplicationCommand(TypedDict):
+    name: NotRequired[ApplicationCommandName]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    default_member_permissions: NotRequired[Permissions | None]
+    dm_permission: NotRequired[bool | None]
+    description: NotRequired[Description]
+    description_localizations: NotRequired[Locales[Description] | None]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]]
+
+
+class PatchChatInputApplicationCommand(TypedDict):
+    name: NotRequired[ApplicationCommandName]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    default_member_permissions: NotRequired[Permissions | None]
+    dm_permission: NotRequired[bool | None]
+    description: NotRequired[Description]
+    description_localizations: NotRequired[Locales[Description] | None]
+    options: NotRequired[Annotated[list[ApplicationCommandOption], MaxItems(25), RequiredFirst(), OnlyFor(ApplicationCommandTypes.CHAT_INPUT)]]
+
+
+class PatchUserApplicationCommand(TypedDict):
+    name: NotRequired[ApplicationCommandName]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    default_member_permissions: NotRequired[Permissions | None]
+    dm_permission: NotRequired[bool | None]
+
+
+class PatchMessageApplicationCommand(TypedDict):
+    name: NotRequired[ApplicationCommandName]
+    name_localizations: NotRequired[Locales[ApplicationCommandName] | None]
+    default_member_permissions: NotRequired[Permissions | None]
+    dm_permission: NotRequired[bool | None]
@@ -0,0 +1,8 @@
+# Generated by `python -m discord_yg_types.stubs`. Do not edit.
+from discord_yg_types.application_commands.ApplicationCommand import ChatInputApplicationCommand as ChatInputApplicationCommand, UserApplicationCommand as UserApplicationCommand, MessageApplicationCommand as MessageApplicationCommand
+from discord_yg_types.application_commands.ApplicationCommandOption import ApplicationCommandBooleanOption as ApplicationCommandBooleanOption, ApplicationCommandUserOption as ApplicationCommandUserOption, ApplicationCommandRoleOption as ApplicationCommandRoleOption, ApplicationCommandMentionableOption as ApplicationCommandMentionableOption, ApplicationCommandAttachmentOption as ApplicationCommandAttachmentOption, ApplicationCommandIntegerOption as ApplicationCommandIntegerOption, ApplicationCommandStringOption as ApplicationCommandStringOption, ApplicationCommandChannelOption as ApplicationCommandChannelOption, ApplicationCommandNumberOption as ApplicationCommandNumberOption, ApplicationCommandSubCommandOption as ApplicationCommandSubCommandOption, ApplicationCommandSubCommandGroupOption as ApplicationCommandSubCommandGroupOption
+from discord_yg_types.application_commands.ApplicationCommandOptionChoice import ApplicationCommandOptionChoiceForString as ApplicationCommandOptionChoiceForString, ApplicationCommandOptionChoiceForInteger as ApplicationCommandOptionChoiceForInteger, ApplicationCommandOptionChoiceForNumber as ApplicationCommandOptionChoiceForNumber
+from discord_yg_types.application_commands.GetApplicationCommand import GetApplicationCommandWithLocalizations as GetApplicationCommandWithLocalizations, GetApplicationCommandWithoutLocalizations as GetApplicationCommandWithoutLocalizations
+from discord_yg_types.application_commands.PatchApplicationCommand import PatchChatInputApplicationCommand as PatchChatInputApplicationCommand, PatchUserApplicationCommand as PatchUserApplicationCommand, PatchMessageApplicationCommand as PatchMessageApplicationCommand
+from discord_yg_types.application_commands.PostApplicationCommand import PostChatInputApplicationCommand as PostChatInputApplicationCommand, PostUserApplicationCommand as PostUserApplicationCommand, PostMessageApplicationCommand as PostMessageApplicationCommand
+from discord_yg_types.application_commands.PutGuildApplicationCommand import PutChatInputGuildApplicationCommand as PutChatInputGuildApplicationCommand, PutUserGuildApplicationCommand as PutUserGuildApplicationCommand, PutMessageGuildApplicationCommand as PutMessageGuildApplicationCommand